@@ -0,0 +1,99 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Milisegundos que puede añadir cada importación al arranque del intérprete (mediana).
+PRESUPUESTO_MS = {
+    "src.Comandos": 40.0,
+    "src.Consola": 40.0,
+    "src.Gestor": 25.0,
+}
+
+# Módulos pesados que no deben cargarse solo por importar los puntos de entrada.
+PROHIBIDOS = ("cryptography", "rich", "pickle", "concurrent.futures.process", "numpy")
+
+
+def _tiempo_proceso(codigo):
+    """
+    Mide en milisegundos lo que tarda un intérprete nuevo en ejecutar `codigo`.
+
+    Args:
+        codigo (str): Código a ejecutar con `python -c`.
+
+    Returns:
+        float: Tiempo de pared en milisegundos.
+    """
+    inicio = time.perf_counter()
+    subprocess.run([sys.executable, "-c", codigo], cwd=RAIZ, check=True)
+    return (time.perf_counter() - inicio) * 1000
+
+
+def modulos_prohibidos(modulo):
+    """
+    Importa `modulo` en un intérprete nuevo y devuelve los módulos pesados que arrastró.
+
+    Args:
+        modulo (str): Módulo a importar.
+
+    Returns:
+        list: Módulos de `PROHIBIDOS` presentes en `sys.modules` tras la importación.
+    """
+    codigo = (f"import sys, {modulo}; "
+              f"print(' '.join(m for m in {PROHIBIDOS!r} if m in sys.modules))")
+    salida = subprocess.run([sys.executable, "-c", codigo], cwd=RAIZ, check=True,
+                            capture_output=True, text=True).stdout
+    return salida.split()
+
+
+def medir_arranque(modulo, repeticiones=20):
+    """
+    Mide el costo de importar `modulo` en frío, descontando el arranque del intérprete.
+
+    Args:
+        modulo (str): Módulo a importar.
+        repeticiones (int): Número de procesos a lanzar por medición.
+
+    Returns:
+        dict: Mediana y percentil 95 del costo de importación en milisegundos.
+    """
+    base = [_tiempo_proceso("pass") for _ in range(repeticiones)]
+    con_modulo = sorted(_tiempo_proceso(f"import {modulo}") for _ in range(repeticiones))
+    referencia = statistics.median(base)
+    return {
+        "mediana_ms": statistics.median(con_modulo) - referencia,
+        "p95_ms": con_modulo[int(0.95 * (len(con_modulo) - 1))] - referencia,
+    }
+
+
+def main(argv=None):
+    """
+    Mide el arranque de los puntos de entrada y lo compara contra `PRESUPUESTO_MS`.
+
+    Returns:
+        int: 0 si todos los módulos respetan el presupuesto, 1 en otro caso.
+    """
+    parser = argparse.ArgumentParser(description="Mide el costo de arranque de los módulos de src.")
+    parser.add_argument("--repeticiones", type=int, default=20)
+    argumentos = parser.parse_args(argv)
+
+    resultados = {}
+    dentro = True
+    for modulo, presupuesto in PRESUPUESTO_MS.items():
+        medicion = medir_arranque(modulo, argumentos.repeticiones)
+        medicion["presupuesto_ms"] = presupuesto
+        medicion["prohibidos"] = modulos_prohibidos(modulo)
+        medicion["dentro"] = medicion["mediana_ms"] <= presupuesto and not medicion["prohibidos"]
+        dentro = dentro and medicion["dentro"]
+        resultados[modulo] = medicion
+    print(json.dumps(resultados, indent=2))
+    return 0 if dentro else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
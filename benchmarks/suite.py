@@ -0,0 +1,313 @@
+import argparse
+import datetime
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if RAIZ not in sys.path:
+    sys.path.insert(0, RAIZ)
+
+from src.Campo import PRIMO
+from src.Codificador import Codificador
+from src.Lagrange import Lagrange
+from src.Gestor import gestiona_C, gestiona_D
+
+RUTA_DOCS = os.path.join(RAIZ, 'docs')
+RUTA_RESULTADOS = os.path.join(RAIZ, 'resultados')
+RUTA_HISTORIAL = os.path.join(os.path.dirname(__file__), 'resultados')
+
+UMBRALES = (3, 10, 20)
+FRAGMENTOS = (10, 100, 1000)
+TAMANOS = ("1K", "1M", "64M")
+
+# Aumento relativo de la mediana a partir del cual una medición se considera regresión.
+TOLERANCIA = 0.10
+
+_UNIDADES = {"K": 1024, "M": 1024**2, "G": 1024**3}
+
+
+def interpreta_tamano(texto):
+    """
+    Convierte un tamaño como `64M` o `2G` a bytes.
+
+    Args:
+        texto (str): Número con sufijo opcional K, M o G.
+
+    Returns:
+        int: Tamaño en bytes.
+    """
+    texto = texto.strip().upper()
+    if texto[-1] in _UNIDADES:
+        return int(float(texto[:-1]) * _UNIDADES[texto[-1]])
+    return int(texto)
+
+
+def percentiles(muestras):
+    """
+    Resume una lista de latencias en segundos.
+
+    Args:
+        muestras (list): Latencias en segundos.
+
+    Returns:
+        dict: Mediana, percentiles 90 y 99, mínimo y número de muestras, en milisegundos.
+    """
+    ordenadas = sorted(muestras)
+
+    def percentil(p):
+        return ordenadas[min(len(ordenadas) - 1, int(round(p * (len(ordenadas) - 1))))] * 1000
+
+    return {"p50_ms": percentil(0.50), "p90_ms": percentil(0.90), "p99_ms": percentil(0.99),
+            "min_ms": ordenadas[0] * 1000, "muestras": len(ordenadas)}
+
+
+def medir(funcion, repeticiones):
+    """
+    Ejecuta `funcion` varias veces y devuelve la latencia de cada ejecución.
+
+    Args:
+        funcion (callable): Función sin argumentos a medir.
+        repeticiones (int): Número de ejecuciones.
+
+    Returns:
+        list: Latencias en segundos.
+    """
+    muestras = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        muestras.append(time.perf_counter() - inicio)
+    return muestras
+
+
+def memoria_maxima_mb():
+    """Devuelve el RSS máximo del proceso actual en MiB."""
+    maximo = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reporta KiB y macOS bytes.
+    return maximo / 1024 if sys.platform != "darwin" else maximo / 1024**2
+
+
+def bench_generacion(t, n, repeticiones):
+    """
+    Mide la generación del polinomio y la evaluación de `n` fragmentos.
+
+    Returns:
+        dict: Percentiles de latencia y fragmentos por segundo.
+    """
+    codificador = Codificador()
+    codificador.generaSha("contrasena")
+
+    def generar():
+        codificador.shamir_generar_puntos(codificador.shamir_generar_polinomio(t), n)
+
+    resultado = percentiles(medir(generar, repeticiones))
+    resultado["fragmentos_por_s"] = n / (resultado["p50_ms"] / 1000)
+    return resultado
+
+
+def bench_reconstruccion(t, n, repeticiones):
+    """
+    Mide `Lagrange.evalua(0)` con `t` fragmentos, en frío (sin pesos en caché) y en caliente.
+
+    Returns:
+        dict: Percentiles de latencia en frío y en caliente.
+    """
+    codificador = Codificador()
+    codificador.generaSha("contrasena")
+    puntos = codificador.shamir_generar_puntos(codificador.shamir_generar_polinomio(t), n)[-t:]
+
+    def en_frio():
+        Lagrange.limpia_cache()
+        Lagrange(puntos, PRIMO).evalua(0)
+
+    frio = percentiles(medir(en_frio, repeticiones))
+    caliente = percentiles(medir(lambda: Lagrange(puntos, PRIMO).evalua(0), repeticiones))
+    return {"frio": frio, "caliente": caliente}
+
+
+def _crear_archivo(ruta, tamano):
+    """Escribe `tamano` bytes pseudoaleatorios en `ruta` sin generarlos todos en memoria."""
+    bloque = os.urandom(1024 * 1024)
+    with open(ruta, 'wb') as archivo:
+        restantes = tamano
+        while restantes > 0:
+            restantes -= archivo.write(bloque[:restantes])
+
+
+def _extremo_a_extremo(tamano, n, t, repeticiones):
+    """
+    Cifra y descifra un archivo de `tamano` bytes con `gestiona_C` y `gestiona_D`.
+
+    Se ejecuta en un proceso hijo para que el RSS máximo corresponda solo a esta medición.
+    """
+    nombre = f"bench_{tamano}"
+    claro = os.path.join(RUTA_DOCS, nombre + ".bin")
+    _crear_archivo(claro, tamano)
+    cifrado = []
+    descifrado = []
+    try:
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            gestiona_C([nombre, n, t, claro, "contrasena"])
+            cifrado.append(time.perf_counter() - inicio)
+            for extension in (".aes", ".frg"):
+                os.replace(os.path.join(RUTA_RESULTADOS, nombre + extension),
+                           os.path.join(RUTA_DOCS, nombre + extension))
+            os.remove(claro)
+
+            inicio = time.perf_counter()
+            gestiona_D([nombre + ".aes", nombre + ".frg"])
+            descifrado.append(time.perf_counter() - inicio)
+            os.replace(os.path.join(RUTA_RESULTADOS, nombre + ".bin"), claro)
+    finally:
+        for ruta in (claro, os.path.join(RUTA_DOCS, nombre + ".aes"), os.path.join(RUTA_DOCS, nombre + ".frg"),
+                     os.path.join(RUTA_RESULTADOS, nombre + ".aes"), os.path.join(RUTA_RESULTADOS, nombre + ".frg"),
+                     os.path.join(RUTA_RESULTADOS, nombre + ".bin")):
+            if os.path.exists(ruta):
+                os.remove(ruta)
+
+    resultado = {"cifrado": percentiles(cifrado), "descifrado": percentiles(descifrado)}
+    for etapa in ("cifrado", "descifrado"):
+        resultado[etapa]["mb_por_s"] = tamano / 1024**2 / (resultado[etapa]["p50_ms"] / 1000)
+    resultado["rss_maximo_mb"] = memoria_maxima_mb()
+    return resultado
+
+
+def bench_extremo_a_extremo(tamano, n, t, repeticiones):
+    """
+    Mide `gestiona_C`/`gestiona_D` sobre un archivo de `tamano` bytes en un proceso aislado.
+
+    Returns:
+        dict: Percentiles y rendimiento de cifrado y descifrado, y RSS máximo del proceso.
+    """
+    with ProcessPoolExecutor(max_workers=1) as grupo:
+        return grupo.submit(_extremo_a_extremo, tamano, n, t, repeticiones).result()
+
+
+def ejecutar_suite(umbrales, fragmentos, tamanos, repeticiones):
+    """
+    Ejecuta la malla completa de mediciones.
+
+    Returns:
+        dict: Mediciones indexadas por una llave estable, por ejemplo `generacion/t=3/n=10`.
+    """
+    mediciones = {}
+    for t in umbrales:
+        for n in fragmentos:
+            if n < t:
+                continue
+            mediciones[f"generacion/t={t}/n={n}"] = bench_generacion(t, n, repeticiones)
+        mediciones[f"reconstruccion/t={t}"] = bench_reconstruccion(t, max(fragmentos), repeticiones)
+    for texto in tamanos:
+        tamano = interpreta_tamano(texto)
+        # Los archivos grandes se miden menos veces para que la suite termine en tiempo razonable.
+        veces = repeticiones if tamano <= 64 * 1024**2 else 1
+        mediciones[f"extremo/{texto}"] = bench_extremo_a_extremo(tamano, 5, 3, veces)
+    return mediciones
+
+
+# Llaves con la mediana en ms: `p50_ms` en la suite y `mediana_ms` en las mediciones de arranque.
+_LLAVES_MEDIANA = ("p50_ms", "mediana_ms")
+
+
+def _medianas(medicion, prefijo=""):
+    """Aplana una medición a pares (llave, mediana en ms)."""
+    for llave, valor in medicion.items():
+        if isinstance(valor, dict):
+            yield from _medianas(valor, f"{prefijo}{llave}/")
+        elif llave in _LLAVES_MEDIANA:
+            yield prefijo.rstrip("/"), valor
+
+
+def comparar(actual, base, tolerancia=TOLERANCIA):
+    """
+    Compara dos ejecuciones y devuelve las mediciones cuya mediana empeoró más de `tolerancia`.
+
+    Args:
+        actual (dict): Mediciones de la ejecución actual.
+        base (dict): Mediciones de referencia.
+        tolerancia (float): Aumento relativo permitido.
+
+    Returns:
+        list: Diccionarios con la llave, la mediana base, la actual y el cambio relativo.
+    """
+    referencias = dict(_medianas(base))
+    regresiones = []
+    for llave, mediana in _medianas(actual):
+        anterior = referencias.get(llave)
+        if anterior and (mediana - anterior) / anterior > tolerancia:
+            regresiones.append({"medicion": llave, "base_ms": anterior, "actual_ms": mediana,
+                                "cambio": (mediana - anterior) / anterior})
+    return regresiones
+
+
+def _commit_actual():
+    """Devuelve el commit de git actual, o None si no se puede obtener."""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=RAIZ, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    """
+    Ejecuta la suite, guarda los resultados y los compara opcionalmente contra una ejecución previa.
+
+    Returns:
+        int: 0 si no hay regresiones, 1 si las hay.
+    """
+    parser = argparse.ArgumentParser(description="Suite de rendimiento de Shamir Secret Sharing.")
+    parser.add_argument("--umbrales", default=",".join(map(str, UMBRALES)), help="Valores de t separados por comas.")
+    parser.add_argument("--fragmentos", default=",".join(map(str, FRAGMENTOS)), help="Valores de n separados por comas.")
+    parser.add_argument("--tamanos", default=",".join(TAMANOS), help="Tamaños de archivo, p. ej. 1K,1M,1G,4G.")
+    parser.add_argument("--repeticiones", type=int, default=10)
+    parser.add_argument("--arranque", action="store_true", help="Incluye las mediciones de arranque en frío.")
+    parser.add_argument("--comparar", help="Archivo JSON de una ejecución previa contra el cual comparar.")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA)
+    parser.add_argument("--salida", help="Archivo donde guardar los resultados. Por defecto, en benchmarks/resultados.")
+    argumentos = parser.parse_args(argv)
+
+    mediciones = ejecutar_suite([int(t) for t in argumentos.umbrales.split(",")],
+                                [int(n) for n in argumentos.fragmentos.split(",")],
+                                [tamano for tamano in argumentos.tamanos.split(",") if tamano],
+                                argumentos.repeticiones)
+    if argumentos.arranque:
+        from benchmarks.arranque import PRESUPUESTO_MS, medir_arranque
+        for modulo in PRESUPUESTO_MS:
+            mediciones[f"arranque/{modulo}"] = medir_arranque(modulo)
+
+    ejecucion = {
+        "fecha": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": _commit_actual(),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "mediciones": mediciones,
+    }
+    salida = argumentos.salida
+    if salida is None:
+        os.makedirs(RUTA_HISTORIAL, exist_ok=True)
+        salida = os.path.join(RUTA_HISTORIAL, datetime.datetime.now().strftime("%Y%m%d-%H%M%S") + ".json")
+    with open(salida, 'w', encoding='utf-8') as archivo:
+        json.dump(ejecucion, archivo, indent=2)
+    print(f"Resultados guardados en {salida}")
+
+    if argumentos.comparar:
+        with open(argumentos.comparar, 'r', encoding='utf-8') as archivo:
+            base = json.load(archivo)["mediciones"]
+        regresiones = comparar(mediciones, base, argumentos.tolerancia)
+        for regresion in regresiones:
+            print(f"REGRESIÓN {regresion['medicion']}: {regresion['base_ms']:.3f} ms -> "
+                  f"{regresion['actual_ms']:.3f} ms ({regresion['cambio']:+.0%})")
+        return 1 if regresiones else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
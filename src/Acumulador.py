@@ -0,0 +1,111 @@
+from .Campo import PRIMO, inversos
+
+
+class Acumulador:
+    """
+    Reconstruye el secreto conforme llegan los fragmentos, uno a la vez.
+
+    Guarda la forma baricéntrica de la interpolación en cero: para cada abscisa `x_i` el
+    denominador `d_i = Π_{j≠i} (x_i - x_j)` y el producto de todas las abscisas. Agregar un
+    fragmento actualiza esos valores en O(t) multiplicaciones y pedir el secreto cuesta O(t)
+    más una sola inversión (con el truco de Montgomery), de modo que juntar `t` fragmentos por
+    la red cuesta O(t^2) en total en vez de reinterpolar con cada uno.
+
+    Attributes:
+        umbral (int): Fragmentos necesarios, o None si se desconoce.
+        primo (int): Módulo del campo.
+    """
+
+    def __init__(self, umbral=None, primo=PRIMO):
+        """
+        Inicializa un acumulador vacío.
+
+        Args:
+            umbral (int, optional): Fragmentos necesarios para reconstruir.
+            primo (int): Módulo del campo. Por defecto es `PRIMO`.
+
+        Raises:
+            ValueError: Si el umbral es menor que 1.
+        """
+        if umbral is not None and umbral < 1:
+            raise ValueError("El umbral debe ser positivo.")
+        self.umbral = umbral
+        self.primo = primo
+        self._xs = []
+        self._ys = []
+        self._denominadores = []
+        self._producto = 1
+        self._secreto = None
+
+    def __len__(self):
+        """Devuelve el número de fragmentos acumulados."""
+        return len(self._xs)
+
+    @property
+    def completo(self):
+        """True si ya se tienen `umbral` fragmentos."""
+        return self.umbral is not None and len(self._xs) >= self.umbral
+
+    def agrega(self, x, y):
+        """
+        Agrega un fragmento en O(t).
+
+        Args:
+            x (int): Abscisa del fragmento.
+            y (int): Ordenada del fragmento.
+
+        Returns:
+            bool: True si con este fragmento se alcanzó el umbral.
+
+        Raises:
+            ValueError: Si la abscisa ya se había agregado.
+        """
+        primo = self.primo
+        x %= primo
+        # Se revisa antes de tocar los denominadores para que un error no deje el estado a medias.
+        if x in self._xs:
+            raise ValueError(f"Ya se agregó un fragmento con x={x}.")
+        denominador = 1
+        for i, xi in enumerate(self._xs):
+            diferencia = x - xi
+            self._denominadores[i] = self._denominadores[i] * -diferencia % primo
+            denominador = denominador * diferencia % primo
+        self._xs.append(x)
+        self._ys.append(y % primo)
+        self._denominadores.append(denominador)
+        self._producto = self._producto * x % primo
+        self._secreto = None
+        return self.completo
+
+    def secreto(self):
+        """
+        Evalúa en cero el polinomio que interpola los fragmentos acumulados.
+
+        Usa `L_i(0) = (-1)^(k-1) · P / (x_i · d_i)` con `P` el producto de las abscisas, e
+        invierte todos los `x_i · d_i` con una sola exponenciación modular.
+
+        Returns:
+            int: El secreto.
+
+        Raises:
+            ValueError: Si aún no se alcanza el umbral, o si hay menos de dos fragmentos cuando
+                el umbral se desconoce.
+        """
+        minimo = self.umbral if self.umbral is not None else 2
+        if len(self._xs) < minimo:
+            raise ValueError(f"Se necesitan {minimo} fragmentos y solo hay {len(self._xs)}.")
+        if self._secreto is None:
+            self._secreto = self._evalua_en_cero()
+        return self._secreto
+
+    def _evalua_en_cero(self):
+        """Calcula el secreto a partir de la forma baricéntrica acumulada."""
+        primo = self.primo
+        if 0 in self._xs:
+            return self._ys[self._xs.index(0)]
+        escalas = inversos([x * d % primo for x, d in zip(self._xs, self._denominadores)], primo)
+        suma = 0
+        for y, escala in zip(self._ys, escalas):
+            suma += y * escala
+        signo = -1 if len(self._xs) % 2 == 0 else 1
+        return signo * self._producto * suma % primo
@@ -0,0 +1,241 @@
+import sqlite3
+from itertools import islice
+from .Campo import BYTES_PRIMO
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS secretos (
+    id TEXT PRIMARY KEY,
+    umbral INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS fragmentos (
+    secreto TEXT NOT NULL REFERENCES secretos (id),
+    x INTEGER NOT NULL,
+    y BLOB NOT NULL,
+    custodio TEXT,
+    PRIMARY KEY (secreto, x)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS fragmentos_custodio ON fragmentos (custodio, secreto);
+"""
+
+# Identificadores por consulta al buscar varios secretos a la vez; SQLite limita los parámetros.
+_POR_CONSULTA = 500
+
+# Filas por llamada a `executemany` en las inserciones masivas.
+_POR_INSERCION = 10000
+
+
+class AlmacenFragmentos:
+    """
+    Almacén de fragmentos de muchos secretos en una base de datos SQLite local con índices.
+
+    Cada fragmento se guarda con el identificador de su secreto, su custodio, su abscisa y su
+    ordenada, y cada secreto con su umbral. La llave primaria (secreto, x) y el índice por
+    custodio permiten encontrar los fragmentos de un secreto o de un custodio sin recorrer la
+    tabla. Las ordenadas se guardan como BLOB big-endian de ancho fijo, ya que no caben en
+    un INTEGER de SQLite.
+
+    Attributes:
+        ruta (str): Archivo de la base de datos, o `":memory:"`.
+    """
+
+    def __init__(self, ruta=":memory:"):
+        """
+        Abre (o crea) el almacén.
+
+        Args:
+            ruta (str): Archivo de la base de datos. Por defecto, una base en memoria.
+        """
+        self.ruta = ruta
+        self._conexion = sqlite3.connect(ruta)
+        self._conexion.execute("PRAGMA foreign_keys = ON")
+        if ruta != ":memory:":
+            self._conexion.execute("PRAGMA journal_mode = WAL")
+            self._conexion.execute("PRAGMA synchronous = NORMAL")
+        self._conexion.executescript(_ESQUEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        self.cerrar()
+        return False
+
+    def cerrar(self):
+        """Cierra la conexión con la base de datos."""
+        self._conexion.close()
+
+    def guarda_secreto(self, secreto, umbral, fragmentos, custodios=None):
+        """
+        Guarda los fragmentos de un secreto.
+
+        Args:
+            secreto (str): Identificador del secreto.
+            umbral (int): Fragmentos necesarios para reconstruirlo.
+            fragmentos (List[Tuple[int, int]]): Puntos (x, y).
+            custodios (List[str], optional): Custodio de cada fragmento, en el mismo orden.
+
+        Raises:
+            ValueError: Si el número de custodios no coincide con el de fragmentos.
+            sqlite3.IntegrityError: Si ya existe un fragmento del secreto con la misma abscisa.
+        """
+        custodios = [None] * len(fragmentos) if custodios is None else list(custodios)
+        if len(custodios) != len(fragmentos):
+            raise ValueError("Debe haber un custodio por fragmento.")
+        self.guarda_lote((secreto, custodio, x, y, umbral) for (x, y), custodio in zip(fragmentos, custodios))
+
+    def guarda_lote(self, registros):
+        """
+        Guarda fragmentos de muchos secretos en una sola transacción.
+
+        Args:
+            registros (iterable): Tuplas (secreto, custodio, x, y, umbral).
+
+        Raises:
+            ValueError: Si un secreto aparece con umbrales distintos, en el lote o respecto al ya
+                guardado; en ese caso no se guarda nada.
+            sqlite3.IntegrityError: Si algún (secreto, x) ya existe; en ese caso no se guarda nada.
+        """
+        registros = iter(registros)
+        with self._conexion:
+            while lote := list(islice(registros, _POR_INSERCION)):
+                umbrales = {}
+                for secreto, _, _, _, umbral in lote:
+                    if umbrales.setdefault(secreto, umbral) != umbral:
+                        raise ValueError(f"El secreto {secreto} tiene umbrales distintos.")
+                self._conexion.executemany(
+                    "INSERT INTO secretos (id, umbral) VALUES (?, ?) ON CONFLICT (id) DO NOTHING", umbrales.items())
+                self._verifica_umbrales(umbrales)
+                self._conexion.executemany(
+                    "INSERT INTO fragmentos (secreto, x, y, custodio) VALUES (?, ?, ?, ?)",
+                    ((secreto, x, y.to_bytes(BYTES_PRIMO, 'big'), custodio)
+                     for secreto, custodio, x, y, _ in lote))
+
+    def _verifica_umbrales(self, umbrales):
+        """
+        Compara los umbrales de un lote con los guardados.
+
+        Args:
+            umbrales (dict): Umbral de cada secreto del lote.
+
+        Raises:
+            ValueError: Si algún secreto ya estaba guardado con otro umbral.
+        """
+        secretos = iter(umbrales)
+        while grupo := list(islice(secretos, _POR_CONSULTA)):
+            marcas = ", ".join("?" * len(grupo))
+            filas = self._conexion.execute(f"SELECT id, umbral FROM secretos WHERE id IN ({marcas})", grupo)
+            for secreto, umbral in filas:
+                if umbral != umbrales[secreto]:
+                    raise ValueError(f"El secreto {secreto} ya está guardado con umbral {umbral}.")
+
+    def importa_frg(self, secreto, ruta, custodios=None):
+        """
+        Guarda los fragmentos de un archivo `.frg` con el umbral registrado en su cabecera.
+
+        Args:
+            secreto (str): Identificador del secreto.
+            ruta (str): Ruta del archivo `.frg`.
+            custodios (List[str], optional): Custodio de cada fragmento, en el orden del archivo.
+
+        Raises:
+            ValueError: Si el archivo no registra el umbral o tiene fragmentos dañados.
+        """
+        from . import Fragmentos
+
+        with open(ruta, 'rb') as flujo:
+            lector = Fragmentos.LectorFragmentos(flujo)
+            if lector.umbral is None:
+                raise ValueError("El archivo de fragmentos no registra el umbral.")
+            fragmentos = []
+            for x, y, integro in lector:
+                if not integro:
+                    raise ValueError(f"El fragmento con x={x} está dañado.")
+                fragmentos.append((x, y))
+        self.guarda_secreto(secreto, lector.umbral, fragmentos, custodios)
+
+    def umbral(self, secreto):
+        """
+        Devuelve el umbral de un secreto.
+
+        Args:
+            secreto (str): Identificador del secreto.
+
+        Returns:
+            int: El umbral, o None si el secreto no existe.
+        """
+        fila = self._conexion.execute("SELECT umbral FROM secretos WHERE id = ?", (secreto,)).fetchone()
+        return fila[0] if fila else None
+
+    def fragmentos(self, secreto, limite=None):
+        """
+        Devuelve los fragmentos de un secreto, ordenados por abscisa.
+
+        Args:
+            secreto (str): Identificador del secreto.
+            limite (int, optional): Máximo de fragmentos a devolver, por ejemplo el umbral.
+
+        Returns:
+            List[Tuple[int, int]]: Puntos (x, y).
+        """
+        filas = self._conexion.execute(
+            "SELECT x, y FROM fragmentos WHERE secreto = ? ORDER BY x LIMIT ?",
+            (secreto, -1 if limite is None else limite))
+        return [(x, int.from_bytes(y, 'big')) for x, y in filas]
+
+    def fragmentos_de_secretos(self, secretos):
+        """
+        Devuelve los fragmentos de varios secretos con pocas consultas indexadas.
+
+        Args:
+            secretos (iterable): Identificadores de los secretos.
+
+        Returns:
+            dict: Por cada secreto con fragmentos, la lista de puntos (x, y) ordenada por abscisa.
+        """
+        resultado = {}
+        secretos = iter(secretos)
+        while grupo := list(islice(secretos, _POR_CONSULTA)):
+            marcas = ", ".join("?" * len(grupo))
+            filas = self._conexion.execute(
+                f"SELECT secreto, x, y FROM fragmentos WHERE secreto IN ({marcas}) ORDER BY secreto, x", grupo)
+            for secreto, x, y in filas:
+                resultado.setdefault(secreto, []).append((x, int.from_bytes(y, 'big')))
+        return resultado
+
+    def fragmentos_de_custodio(self, custodio):
+        """
+        Devuelve todos los fragmentos que tiene un custodio.
+
+        Args:
+            custodio (str): Identificador del custodio.
+
+        Returns:
+            List[Tuple[str, int, int]]: Tuplas (secreto, x, y) ordenadas por secreto.
+        """
+        filas = self._conexion.execute(
+            "SELECT secreto, x, y FROM fragmentos WHERE custodio = ? ORDER BY secreto, x", (custodio,))
+        return [(secreto, x, int.from_bytes(y, 'big')) for secreto, x, y in filas]
+
+    def reconstruye(self, secreto):
+        """
+        Reconstruye un secreto con los primeros `umbral` fragmentos guardados.
+
+        Args:
+            secreto (str): Identificador del secreto.
+
+        Returns:
+            int: El secreto.
+
+        Raises:
+            KeyError: Si el secreto no existe.
+            ValueError: Si no hay suficientes fragmentos.
+        """
+        from .Acumulador import Acumulador
+
+        umbral = self.umbral(secreto)
+        if umbral is None:
+            raise KeyError(secreto)
+        acumulador = Acumulador(umbral)
+        for x, y in self.fragmentos(secreto, umbral):
+            acumulador.agrega(x, y)
+        return acumulador.secreto()
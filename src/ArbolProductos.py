@@ -0,0 +1,252 @@
+from .Campo import PRIMO, inverso, inversos
+
+# Por debajo de este número de coeficientes conviene multiplicar y dividir término a término.
+_UMBRAL_RAPIDO = 16
+
+# A partir de este número de coeficientes, `evalua_consecutivos` obtiene los primeros valores con el árbol.
+_MINIMO_ARBOL = 256
+
+# Pasos de diferencias finitas entre reducciones módulo primo; cada paso crece a lo más un bit.
+_PASOS_SIN_REDUCIR = 64
+
+
+def _empaca(coeficientes, ancho):
+    """Junta los coeficientes en un solo entero, `ancho` bytes por coeficiente."""
+    return int.from_bytes(b"".join(coef.to_bytes(ancho, 'little') for coef in coeficientes), 'little')
+
+
+def _desempaca(valor, ancho, longitud, primo):
+    """Separa un entero empacado en `longitud` coeficientes reducidos módulo primo."""
+    datos = valor.to_bytes(ancho * longitud, 'little')
+    return [int.from_bytes(datos[i:i + ancho], 'little') % primo for i in range(0, ancho * longitud, ancho)]
+
+
+def multiplica(a, b, primo=PRIMO):
+    """
+    Multiplica dos polinomios sobre GF(primo), con coeficientes del término independiente en adelante.
+
+    Los polinomios grandes se multiplican por sustitución de Kronecker: cada uno se empaca en
+    un entero con un coeficiente por casilla de ancho fijo, se multiplican los enteros (CPython
+    usa Karatsuba para enteros grandes) y se desempaca el producto. Las casillas son lo bastante
+    anchas para que la suma de productos de coeficientes no se desborde a la siguiente.
+
+    Args:
+        a (List[int]): Coeficientes del primer factor, reducidos módulo primo.
+        b (List[int]): Coeficientes del segundo factor, reducidos módulo primo.
+        primo (int): Módulo del campo. Por defecto es `PRIMO`.
+
+    Returns:
+        List[int]: Los `len(a) + len(b) - 1` coeficientes del producto.
+    """
+    if not a or not b:
+        return []
+    longitud = len(a) + len(b) - 1
+    if min(len(a), len(b)) < _UMBRAL_RAPIDO:
+        producto = [0] * longitud
+        for i, coef_a in enumerate(a):
+            if coef_a:
+                for j, coef_b in enumerate(b):
+                    producto[i + j] += coef_a * coef_b
+        return [coef % primo for coef in producto]
+    ancho = (2 * (primo - 1).bit_length() + min(len(a), len(b)).bit_length() + 7) // 8
+    return _desempaca(_empaca(a, ancho) * _empaca(b, ancho), ancho, longitud, primo)
+
+
+def _inversa_serie(f, n, primo):
+    """
+    Calcula `g` con `f·g ≡ 1 (mod x^n)` por iteración de Newton, duplicando la precisión en cada paso.
+
+    Args:
+        f (List[int]): Coeficientes de la serie; `f[0]` no puede ser cero.
+        n (int): Número de coeficientes buscados.
+        primo (int): Módulo del campo.
+
+    Returns:
+        List[int]: Los primeros `n` coeficientes de `1/f`.
+    """
+    g = [inverso(f[0], primo)]
+    precision = 1
+    while precision < n:
+        precision = min(2 * precision, n)
+        error = multiplica(f[:precision], g, primo)[:precision]
+        error = [-coef % primo for coef in error]
+        error[0] = (error[0] + 2) % primo
+        g = multiplica(g, error, primo)[:precision]
+    return g
+
+
+def residuo(a, b, primo=PRIMO):
+    """
+    Calcula el residuo de dividir `a` entre `b` sobre GF(primo).
+
+    Para divisores grandes obtiene el cociente invirtiendo `b` como serie de potencias (con
+    los coeficientes al revés), de modo que la división cuesta lo mismo que unas pocas
+    multiplicaciones.
+
+    Args:
+        a (List[int]): Coeficientes del dividendo.
+        b (List[int]): Coeficientes del divisor; el principal no puede ser cero.
+        primo (int): Módulo del campo. Por defecto es `PRIMO`.
+
+    Returns:
+        List[int]: Los `len(b) - 1` coeficientes del residuo.
+    """
+    grado = len(b) - 1
+    if len(a) <= grado:
+        return list(a) + [0] * (grado - len(a))
+    m = len(a) - grado
+    if min(m, grado) < _UMBRAL_RAPIDO:
+        residuo = list(a)
+        principal = inverso(b[-1], primo)
+        for i in range(m - 1, -1, -1):
+            coeficiente = residuo[i + grado] * principal % primo
+            if coeficiente:
+                for j in range(grado):
+                    residuo[i + j] = (residuo[i + j] - coeficiente * b[j]) % primo
+        return residuo[:grado]
+    inversa = _inversa_serie(b[::-1], m, primo)
+    cociente = multiplica(a[::-1][:m], inversa, primo)[:m][::-1]
+    producto = multiplica(cociente, b, primo)
+    return [(x - y) % primo for x, y in zip(a[:grado], producto[:grado])]
+
+
+def arbol_productos(xs, primo=PRIMO):
+    """
+    Construye el árbol de subproductos de `Π (x - x_i)`.
+
+    Args:
+        xs (List[int]): Abscisas.
+        primo (int): Módulo del campo. Por defecto es `PRIMO`.
+
+    Returns:
+        List[List[List[int]]]: Niveles del árbol, de las hojas `x - x_i` a la raíz. El nodo `j`
+        de un nivel es el producto de los nodos `2j` y `2j + 1` del nivel anterior; si el nivel
+        anterior tiene un número impar de nodos, el último sube sin cambios.
+    """
+    niveles = [[[-x % primo, 1] for x in xs]]
+    while len(niveles[-1]) > 1:
+        nivel = niveles[-1]
+        siguiente = [multiplica(nivel[i], nivel[i + 1], primo) for i in range(0, len(nivel) - 1, 2)]
+        if len(nivel) % 2:
+            siguiente.append(nivel[-1])
+        niveles.append(siguiente)
+    return niveles
+
+
+def evalua_en_puntos(coeficientes, xs, primo=PRIMO, niveles=None):
+    """
+    Evalúa un polinomio en muchos puntos a la vez bajando por el árbol de subproductos.
+
+    En cada nodo se reduce el polinomio módulo el subproducto del nodo; en las hojas el residuo
+    es el valor en `x_i`. Con `n` puntos y grado menor que `n` cuesta O(M(n) log n) en vez de
+    las O(n^2) operaciones de evaluar punto por punto.
+
+    Args:
+        coeficientes (List[int]): Coeficientes del polinomio, del término independiente en adelante.
+        xs (List[int]): Abscisas.
+        primo (int): Módulo del campo. Por defecto es `PRIMO`.
+        niveles (list, optional): El árbol de `arbol_productos(xs)`, si ya se construyó.
+
+    Returns:
+        List[int]: El valor del polinomio en cada abscisa, en el mismo orden.
+    """
+    if not xs:
+        return []
+    niveles = niveles or arbol_productos(xs, primo)
+    residuos = [residuo([coef % primo for coef in coeficientes], niveles[-1][0], primo)]
+    for nivel in reversed(niveles[:-1]):
+        residuos = [residuo(residuos[j // 2], nodo, primo) for j, nodo in enumerate(nivel)]
+    return [r[0] for r in residuos]
+
+
+def interpola(puntos, primo=PRIMO):
+    """
+    Calcula los coeficientes del polinomio que pasa por los puntos con el árbol de subproductos.
+
+    Con `M = Π (x - x_i)`, el polinomio es `Σ c_i · M / (x - x_i)` con `c_i = y_i / M'(x_i)`.
+    Los `M'(x_i)` se obtienen con `evalua_en_puntos`, se invierten todos con una sola
+    exponenciación (`inversos`) y la suma se arma subiendo por el árbol: cada nodo combina a sus
+    hijos como `P_izq · M_der + P_der · M_izq`. El costo es O(M(n) log n).
+
+    Args:
+        puntos (List[Tuple[int, int]]): Puntos (x, y).
+        primo (int): Módulo del campo. Por defecto es `PRIMO`.
+
+    Returns:
+        List[int]: Los `n` coeficientes del polinomio, del término independiente en adelante.
+
+    Raises:
+        ValueError: Si no hay puntos o si se repite alguna abscisa.
+    """
+    xs = [x % primo for x, _ in puntos]
+    if not xs:
+        raise ValueError("Se necesita al menos un punto para interpolar.")
+    if len(set(xs)) != len(xs):
+        raise ValueError("Las abscisas de los pares ordenados no pueden repetirse.")
+
+    niveles = arbol_productos(xs, primo)
+    raiz = niveles[-1][0]
+    derivada = [i * coef % primo for i, coef in enumerate(raiz)][1:]
+    escalas = inversos(evalua_en_puntos(derivada, xs, primo, niveles), primo)
+    sumas = [[y * escala % primo] for (_, y), escala in zip(puntos, escalas)]
+
+    for nivel in niveles[:-1]:
+        siguientes = []
+        for i in range(0, len(nivel) - 1, 2):
+            izquierda = multiplica(sumas[i], nivel[i + 1], primo)
+            derecha = multiplica(sumas[i + 1], nivel[i], primo)
+            siguientes.append([(a + b) % primo for a, b in zip(izquierda, derecha)])
+        if len(nivel) % 2:
+            siguientes.append(sumas[-1])
+        sumas = siguientes
+    return sumas[0]
+
+
+def evalua_consecutivos(coeficientes, n, primo=PRIMO):
+    """
+    Evalúa un polinomio en `x = 1, 2, ..., n` por el método de diferencias finitas.
+
+    Con la tabla `Δ^k P(1)`, `k = 0..d`, el siguiente valor se obtiene sumando a cada entrada
+    la siguiente: `d` sumas por punto y ninguna multiplicación. La tabla se empaca en un solo
+    entero, una entrada por casilla, así que cada paso es un corrimiento y una suma de enteros
+    grandes. Las casillas tienen `_PASOS_SIN_REDUCIR` bits de holgura y cada tantos pasos se
+    desempaca la tabla para reducirla módulo primo. Los primeros `d + 1` valores salen de
+    Horner o, para grados grandes, de `evalua_en_puntos`.
+
+    Args:
+        coeficientes (List[int]): Coeficientes del polinomio, del término independiente en adelante.
+        n (int): Número de puntos.
+        primo (int): Módulo del campo. Por defecto es `PRIMO`.
+
+    Returns:
+        List[int]: `[P(1), ..., P(n)]` reducidos módulo primo.
+    """
+    coeficientes = [coef % primo for coef in coeficientes] or [0]
+    longitud = len(coeficientes)
+    xs = range(1, min(n, longitud) + 1)
+    if longitud >= _MINIMO_ARBOL:
+        tabla = evalua_en_puntos(coeficientes, list(xs), primo)
+    else:
+        tabla = []
+        for x in xs:
+            valor = 0
+            for coef in reversed(coeficientes):
+                valor = (valor * x + coef) % primo
+            tabla.append(valor)
+    if n <= longitud:
+        return tabla
+
+    for k in range(1, longitud):
+        tabla[k:] = [(a - b) % primo for a, b in zip(tabla[k:], tabla[k - 1:-1])]
+
+    ancho = (primo.bit_length() + _PASOS_SIN_REDUCIR + 8) // 8
+    bits = 8 * ancho
+    mascara = (1 << bits) - 1
+    empacada = _empaca(tabla, ancho)
+    valores = []
+    for paso in range(1, n + 1):
+        valores.append(empacada & mascara)
+        empacada += empacada >> bits
+        if paso % _PASOS_SIN_REDUCIR == 0:
+            empacada = _empaca(_desempaca(empacada, ancho, longitud, primo), ancho)
+    return [valor % primo for valor in valores]
@@ -1,23 +1,75 @@
 import os
+import stat
+from .Cabecera import TAMANO_BLOQUE
 
 class Archivo:
     def __init__(self, nombre_archivo):
         """
-        Inicializa un objeto Documento cargando el contenido del archivo dado.
+        Inicializa un objeto Documento a partir del archivo dado.
+
+        Solo consulta los metadatos del archivo; el contenido se lee hasta que se pide con
+        `get_archivo` o `iterar_bloques`.
 
         :param nombre_archivo: Nombre del archivo a cargar.
         """
         self.__nombre = nombre_archivo
-        self.__archivo = self.archivoBytes(self.__nombre)
+        self.__ruta = self.ruta_docs(nombre_archivo)
+        self.__tamano = self.verifica_archivo(nombre_archivo).st_size
+        self.__archivo = None
 
     def get_nombre(self):
         """Devuelve el nombre del archivo."""
         return self.__nombre
 
+    def get_ruta(self):
+        """Devuelve la ruta completa del archivo."""
+        return self.__ruta
+
+    def get_tamano(self):
+        """Devuelve el tamaño del archivo en bytes al momento de crear el objeto."""
+        return self.__tamano
+
     def get_archivo(self):
-        """Devuelve el contenido del archivo en bytes."""
+        """Devuelve el contenido del archivo en bytes, leyéndolo la primera vez que se pide."""
+        if self.__archivo is None:
+            self.__archivo = self.leer_archivo(self.__nombre)
         return self.__archivo
 
+    def iterar_bloques(self, tamano=TAMANO_BLOQUE, prefijo=b""):
+        """
+        Recorre el contenido del archivo en bloques sin cargarlo completo en memoria.
+
+        :param tamano: Tamaño máximo de cada bloque en bytes.
+        :param prefijo: Bytes que se recorren antes del contenido, como si fueran parte de él (bytes).
+        :return: Generador de bloques de bytes; todos miden `tamano` salvo el último.
+        :raises IOError: Si ocurre un error al leer el archivo.
+        """
+        with open(self.__ruta, 'rb') as archivo:
+            while len(prefijo) >= tamano:
+                yield prefijo[:tamano]
+                prefijo = prefijo[tamano:]
+            bloque = prefijo + archivo.read(tamano - len(prefijo))
+            while bloque:
+                yield bloque
+                bloque = archivo.read(tamano)
+
+    def __getstate__(self):
+        """
+        Conserva el formato serializado anterior (nombre y contenido) al usar pickle.
+
+        :return: Estado del objeto con el contenido ya leído.
+        """
+        return {'_Archivo__nombre': self.__nombre, '_Archivo__archivo': self.get_archivo()}
+
+    def ruta_docs(self, nombre_archivo):
+        """
+        Construye la ruta de un archivo dentro del directorio `../docs`.
+
+        :param nombre_archivo: Nombre del archivo.
+        :return: Ruta del archivo.
+        """
+        return os.path.join(os.path.dirname(__file__), '../docs', nombre_archivo)
+
     def archivoBytes(self, archivo):
         """
         Verifica y devuelve el contenido de un archivo en bytes.
@@ -40,7 +92,7 @@ class Archivo:
         :raises IOError: Si ocurre un error al leer el archivo.
         """
         # Construir la ruta del archivo
-        ruta = os.path.join(os.path.dirname(__file__), '../docs', nombre_archivo)
+        ruta = self.ruta_docs(nombre_archivo)
 
         # Verificar si el archivo existe
         if not os.path.exists(ruta):
@@ -56,34 +108,34 @@ class Archivo:
 
     def verifica_archivo(self, ruta):
         """
-        Verifica si el archivo existe dentro de la carpeta 'docs'.
+        Verifica si el archivo existe dentro de la carpeta 'docs' con una sola llamada a `stat`.
 
         Args:
             ruta (str): Nombre del archivo a verificar dentro de la carpeta 'docs'.
 
         Returns:
-            str: Contenido del archivo si este existe y se puede leer.
+            os.stat_result: Metadatos del archivo si este existe y es un archivo regular.
 
         Raises:
             TypeError: Si `ruta` no es una cadena válida.
-            FileNotFoundError: Si el archivo no existe en la carpeta 'docs'.
-            Exception: Si ocurre algún error al intentar leer el archivo.
+            FileNotFoundError: Si el archivo no existe en la carpeta 'docs' o no es un archivo regular.
+            Exception: Si ocurre algún error al consultar el archivo.
 
         Precondición:
             - `ruta` debe ser una cadena que representa el nombre del archivo.
 
         Postcondición:
-            - Si el archivo existe y es legible, se devuelve su contenido.
+            - Si el archivo existe, se devuelven sus metadatos sin leer su contenido.
         """
         if not isinstance(ruta, str):
             raise TypeError("La ruta debe ser una cadena válida.")
-        ruta_actual = os.path.dirname(__file__)
-        ruta_completa = os.path.join(ruta_actual, '../docs', ruta)
+        ruta_completa = self.ruta_docs(ruta)
         try:
-            with open(ruta_completa, 'r') as archivo:
-                contenido = archivo.read()
-            return contenido
+            metadatos = os.stat(ruta_completa)
         except FileNotFoundError:
             raise FileNotFoundError(f"No se encontró el archivo en la carpeta 'docs': {ruta_completa}")
         except Exception as e:
-            raise Exception(f"Ocurrió un error al leer el archivo: {e}")
\ No newline at end of file
+            raise Exception(f"Ocurrió un error al leer el archivo: {e}")
+        if not stat.S_ISREG(metadatos.st_mode):
+            raise FileNotFoundError(f"No se encontró el archivo en la carpeta 'docs': {ruta_completa}")
+        return metadatos
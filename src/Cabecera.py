@@ -0,0 +1,312 @@
+import hashlib
+import hmac
+import struct
+
+# Identifica los archivos `.aes` que guardan el contenido en claro sin serializar con pickle.
+MAGIA = b"SSSC"
+
+# Versión del formato que se escribe al cifrar. La versión 1 no tiene valor de verificación y
+# hasta la versión 2 el nombre del archivo original se guarda en claro en la cabecera; desde la
+# versión 3 va cifrado al inicio del contenido y la cabecera solo registra su longitud. Desde
+# la versión 4, AES-GCM cifra cada archivo con una clave propia derivada de una sal aleatoria.
+VERSION = 4
+
+# Primera versión en la que el nombre del archivo original va cifrado.
+VERSION_NOMBRE_CIFRADO = 3
+
+# Primera versión en la que AES-GCM usa una clave por archivo (ver `clave_gcm`).
+VERSION_SUBCLAVE = 4
+
+# Identificadores del algoritmo con el que se cifró el contenido.
+CIFRADO_AES_CBC = 1
+CIFRADO_AES_GCM = 2
+
+# En AES-GCM cada bloque se cifra por separado y lleva su propia etiqueta de autenticación.
+TAMANO_ETIQUETA = 16
+# Bytes del prefijo del nonce que precede al índice del bloque.
+TAMANO_PREFIJO_NONCE = 7
+# Bytes de la sal aleatoria de la que se deriva la clave de cada archivo en AES-GCM.
+TAMANO_SAL = 16
+
+# Tamaño de los bloques en los que se lee y escribe el contenido al cifrar o descifrar en flujo.
+TAMANO_BLOQUE = 1024 * 1024
+
+# Bytes del valor de verificación de la clave.
+TAMANO_VERIFICACION = 8
+
+# Magia, versión, cifrado, tamaño de bloque, longitud original y longitudes de los campos
+# variables: nombre e IV y, desde la versión 2, el valor de verificación de la clave.
+_FIJA = {1: struct.Struct(">4sBBIQHB"), 2: struct.Struct(">4sBBIQHBB"), 3: struct.Struct(">4sBBIQHBB"),
+         4: struct.Struct(">4sBBIQHBB")}
+_INICIO = struct.Struct(">4sB")
+
+
+class Cabecera:
+    """
+    Cabecera binaria versionada que precede al texto cifrado en un archivo `.aes`.
+
+    Registra todo lo necesario para descifrar en flujo sin serializar un objeto `Archivo`:
+    la versión del formato, el cifrado, el tamaño de bloque, el nombre y la longitud del
+    archivo original, el vector de inicialización y un valor de verificación de la clave.
+
+    Desde la versión 3 el nombre no se escribe en la cabecera, que va en claro: el texto cifrado
+    comienza con los `largo_nombre` bytes del nombre en UTF-8, seguidos del contenido. Al leer
+    una cabecera de la versión 3, `nombre` es None hasta que se descifra.
+
+    Attributes:
+        nombre (str): Nombre del archivo original, o None si aún no se descifra.
+        largo_nombre (int): Longitud en bytes del nombre en UTF-8.
+        iv (bytes): Vector de inicialización usado por el cifrado. En AES-GCM es la sal de la clave
+            del archivo desde la versión 4 y el prefijo del nonce en las anteriores.
+        longitud (int): Longitud en bytes del archivo original.
+        cifrado (int): Identificador del cifrado, por ejemplo `CIFRADO_AES_CBC`.
+        tamano_bloque (int): Tamaño de los bloques en que se procesó el contenido.
+        version (int): Versión del formato de la cabecera.
+        verificacion (bytes): Valor de verificación de la clave (ver `valor_verificacion`); vacío
+            en la versión 1.
+    """
+
+    def __init__(self, nombre, iv, longitud, cifrado=CIFRADO_AES_CBC, tamano_bloque=TAMANO_BLOQUE,
+                 version=VERSION, verificacion=b"", largo_nombre=None):
+        """
+        Inicializa la cabecera.
+
+        Args:
+            nombre (str): Nombre del archivo original, o None si va cifrado y aún no se conoce.
+            iv (bytes): Vector de inicialización.
+            longitud (int): Longitud en bytes del archivo original.
+            cifrado (int): Identificador del cifrado.
+            tamano_bloque (int): Tamaño de bloque en bytes.
+            version (int): Versión del formato.
+            verificacion (bytes): Valor de verificación de la clave.
+            largo_nombre (int, optional): Longitud del nombre; solo se usa si `nombre` es None.
+
+        Raises:
+            ValueError: Si algún campo no cabe en la cabecera.
+        """
+        if nombre is not None:
+            largo_nombre = len(nombre.encode('utf-8'))
+        elif largo_nombre is None or version < VERSION_NOMBRE_CIFRADO:
+            raise ValueError("La cabecera necesita el nombre del archivo original.")
+        if largo_nombre > 0xFFFF:
+            raise ValueError("El nombre del archivo es demasiado largo para la cabecera.")
+        if len(iv) > 0xFF:
+            raise ValueError("El vector de inicialización es demasiado largo para la cabecera.")
+        if not 0 < tamano_bloque <= 0xFFFFFFFF:
+            raise ValueError("El tamaño de bloque de la cabecera es inválido.")
+        if len(verificacion) > 0xFF or (version == 1 and verificacion):
+            raise ValueError("El valor de verificación no cabe en la cabecera.")
+        self.nombre = nombre
+        self.largo_nombre = largo_nombre
+        self.iv = bytes(iv)
+        self.longitud = longitud
+        self.cifrado = cifrado
+        self.tamano_bloque = tamano_bloque
+        self.version = version
+        self.verificacion = bytes(verificacion)
+
+    @property
+    def nombre_cifrado(self):
+        """bool: True si el nombre va al inicio del texto cifrado en lugar de en la cabecera."""
+        return self.version >= VERSION_NOMBRE_CIFRADO
+
+    @property
+    def longitud_flujo(self):
+        """int: Bytes de texto claro que se cifran: el contenido y, si va cifrado, el nombre."""
+        return self.longitud + (self.largo_nombre if self.nombre_cifrado else 0)
+
+    def a_bytes(self):
+        """
+        Serializa la cabecera.
+
+        Returns:
+            bytes: Parte fija seguida del nombre en UTF-8 (hasta la versión 2), del IV y del valor
+            de verificación.
+        """
+        nombre_bytes = b"" if self.nombre_cifrado else self.nombre.encode('utf-8')
+        largos = (self.largo_nombre, len(self.iv)) + ((len(self.verificacion),) if self.version >= 2 else ())
+        fija = _FIJA[self.version].pack(MAGIA, self.version, self.cifrado, self.tamano_bloque, self.longitud, *largos)
+        return fija + nombre_bytes + self.iv + self.verificacion
+
+    @classmethod
+    def desde_bytes(cls, datos):
+        """
+        Interpreta una cabecera al inicio de un búfer sin copiar el resto de los datos.
+
+        Args:
+            datos (bytes-like): Búfer que comienza con la cabecera.
+
+        Returns:
+            Tuple[Cabecera, int]: La cabecera y el desplazamiento donde comienza el texto cifrado.
+
+        Raises:
+            ValueError: Si el búfer no comienza con una cabecera válida y soportada.
+        """
+        vista = memoryview(datos)
+        fija = _parte_fija(vista)
+        if len(vista) < fija.size:
+            raise ValueError("La cabecera del archivo cifrado está truncada.")
+        _, version, cifrado, tamano_bloque, longitud, largo_nombre, largo_iv, *resto = fija.unpack_from(vista)
+        largo_verificacion = resto[0] if resto else 0
+
+        inicio_iv = fija.size + (0 if version >= VERSION_NOMBRE_CIFRADO else largo_nombre)
+        inicio_verificacion = inicio_iv + largo_iv
+        fin = inicio_verificacion + largo_verificacion
+        if len(vista) < fin:
+            raise ValueError("La cabecera del archivo cifrado está truncada.")
+        nombre = None if version >= VERSION_NOMBRE_CIFRADO else str(vista[fija.size:inicio_iv], 'utf-8')
+        iv = vista[inicio_iv:inicio_verificacion].tobytes()
+        verificacion = vista[inicio_verificacion:fin].tobytes()
+        return cls(nombre, iv, longitud, cifrado, tamano_bloque, version, verificacion, largo_nombre), fin
+
+    @classmethod
+    def leer(cls, flujo):
+        """
+        Lee una cabecera desde un flujo binario, dejándolo posicionado al inicio del texto cifrado.
+
+        Args:
+            flujo: Objeto tipo archivo abierto en modo binario.
+
+        Returns:
+            Cabecera: La cabecera leída.
+
+        Raises:
+            ValueError: Si el flujo no comienza con una cabecera válida y soportada.
+        """
+        inicio = flujo.read(_INICIO.size)
+        estructura = _parte_fija(inicio)
+        fija = inicio + flujo.read(estructura.size - _INICIO.size)
+        if len(fija) < estructura.size:
+            raise ValueError("La cabecera del archivo cifrado está truncada.")
+        _, version, _, _, _, *largos = estructura.unpack(fija)
+        if version >= VERSION_NOMBRE_CIFRADO:
+            largos = largos[1:]
+        cabecera, _ = cls.desde_bytes(fija + flujo.read(sum(largos)))
+        return cabecera
+
+
+def _parte_fija(inicio):
+    """
+    Elige la estructura de la parte fija según la magia y la versión.
+
+    Args:
+        inicio (bytes-like): Primeros bytes de la cabecera.
+
+    Returns:
+        struct.Struct: Estructura de la parte fija de esa versión.
+
+    Raises:
+        ValueError: Si la cabecera está truncada, no tiene la magia o su versión no está soportada.
+    """
+    if len(inicio) < _INICIO.size:
+        raise ValueError("La cabecera del archivo cifrado está truncada.")
+    magia, version = _INICIO.unpack_from(inicio)
+    if magia != MAGIA:
+        raise ValueError("El archivo no tiene una cabecera de cifrado válida.")
+    if version not in _FIJA:
+        raise ValueError(f"La versión {version} del formato cifrado no está soportada.")
+    return _FIJA[version]
+
+
+def valor_verificacion(clave):
+    """
+    Deriva de la clave un valor corto que permite comprobarla sin descifrar el contenido.
+
+    Es un HMAC-SHA256 con la clave sobre una etiqueta fija, truncado a `TAMANO_VERIFICACION`
+    bytes: no revela la clave, y con una clave incorrecta coincide solo con probabilidad 2^-64.
+
+    Args:
+        clave (bytes): Clave AES.
+
+    Returns:
+        bytes: Valor de verificación.
+    """
+    return hmac.new(clave, b"SSSC verificacion de clave", hashlib.sha256).digest()[:TAMANO_VERIFICACION]
+
+
+def verifica_clave(cabecera, clave):
+    """
+    Comprueba la clave contra el valor de verificación de la cabecera.
+
+    Las cabeceras de la versión 1 no tienen valor de verificación y se aceptan siempre; a partir
+    de la versión 2 el valor es obligatorio, para que borrarlo no desactive la comprobación.
+
+    Args:
+        cabecera (Cabecera): Cabecera del archivo cifrado.
+        clave (bytes): Clave a comprobar.
+
+    Raises:
+        ValueError: Si la cabecera no trae el valor de verificación o la clave no le corresponde.
+    """
+    if cabecera.version < 2:
+        return
+    if not cabecera.verificacion:
+        raise ValueError("La cabecera no tiene el valor de verificación de la clave.")
+    if not hmac.compare_digest(valor_verificacion(clave), cabecera.verificacion):
+        raise ValueError("Los fragmentos no corresponden a este archivo: la clave reconstruida es incorrecta.")
+
+
+def _hkdf(clave, sal, info, largo):
+    """HKDF-SHA256 (RFC 5869): extrae una clave pseudoaleatoria de `clave` y `sal` y la expande a `largo` bytes."""
+    prk = hmac.new(sal, clave, hashlib.sha256).digest()
+    salida = b""
+    bloque = b""
+    contador = 1
+    while len(salida) < largo:
+        bloque = hmac.new(prk, bloque + info + bytes([contador]), hashlib.sha256).digest()
+        salida += bloque
+        contador += 1
+    return salida[:largo]
+
+
+def clave_gcm(clave, cabecera):
+    """
+    Obtiene la clave y el prefijo del nonce con que se cifra en AES-GCM el archivo de `cabecera`.
+
+    La clave derivada de la contraseña es la misma para todos los archivos cifrados con ella.
+    Desde la versión 4 cada archivo guarda en la cabecera una sal aleatoria de `TAMANO_SAL`
+    bytes, y su clave y prefijo del nonce se derivan de la clave y la sal con HKDF-SHA256: dos
+    archivos solo compartirían clave si repitieran una sal de 128 bits. Las versiones
+    anteriores usan la clave directamente y el IV de la cabecera como prefijo.
+
+    Args:
+        clave (bytes): Clave AES derivada de la contraseña.
+        cabecera (Cabecera): Cabecera del archivo.
+
+    Returns:
+        Tuple[bytes, bytes]: La clave AES del archivo y el prefijo de `TAMANO_PREFIJO_NONCE` bytes.
+
+    Raises:
+        ValueError: Si la sal de la cabecera no tiene `TAMANO_SAL` bytes.
+    """
+    if cabecera.version < VERSION_SUBCLAVE:
+        return clave, cabecera.iv
+    if len(cabecera.iv) != TAMANO_SAL:
+        raise ValueError("La sal de la cabecera del archivo cifrado es inválida.")
+    material = _hkdf(clave, cabecera.iv, b"SSSC clave AES-GCM por archivo", len(clave) + TAMANO_PREFIJO_NONCE)
+    return material[:len(clave)], material[len(clave):]
+
+
+def nonce_bloque(prefijo, indice, ultimo):
+    """
+    Construye el nonce de AES-GCM de un bloque del contenido.
+
+    Sigue el esquema STREAM: el prefijo de `clave_gcm`, el índice del bloque y un byte que marca
+    el último bloque. Como cada archivo tiene su propia clave, ningún par clave-nonce se repite
+    dentro de un archivo ni entre archivos; además los bloques no pueden reordenarse y truncar
+    el archivo en un límite de bloque se detecta al descifrar.
+
+    Args:
+        prefijo (bytes): Prefijo de `TAMANO_PREFIJO_NONCE` bytes.
+        indice (int): Posición del bloque, desde cero.
+        ultimo (bool): Si es el último bloque del contenido.
+
+    Returns:
+        bytes: Nonce de 12 bytes.
+
+    Raises:
+        ValueError: Si el índice no cabe en cuatro bytes.
+    """
+    if indice > 0xFFFFFFFF:
+        raise ValueError("El archivo tiene demasiados bloques para el cifrado AES-GCM.")
+    return prefijo + indice.to_bytes(4, 'big') + (b"\x01" if ultimo else b"\x00")
@@ -0,0 +1,68 @@
+# Primo más pequeño mayor que 2^256: cualquier clave SHA-256 es un residuo válido.
+PRIMO = 2**256 + 297
+
+# Bytes necesarios para representar cualquier residuo módulo PRIMO.
+BYTES_PRIMO = (PRIMO.bit_length() + 7) // 8
+
+
+def inverso(valor, primo=PRIMO):
+    """
+    Calcula el inverso multiplicativo de un elemento del campo GF(p).
+
+    Args:
+        valor (int): Elemento a invertir.
+        primo (int): Módulo del campo. Por defecto es `PRIMO`.
+
+    Precondición:
+        - `valor` no debe ser congruente con cero módulo `primo`.
+
+    Postcondición:
+        - Se retorna `v` tal que `valor * v ≡ 1 (mod primo)`.
+
+    Returns:
+        int: El inverso de `valor` módulo `primo`.
+
+    Raises:
+        ValueError: Si `valor` es cero en el campo.
+    """
+    valor %= primo
+    if valor == 0:
+        raise ValueError("El cero no tiene inverso en el campo.")
+    return pow(valor, -1, primo)
+
+
+def inversos(valores, primo=PRIMO):
+    """
+    Invierte una lista de elementos del campo con una sola exponenciación modular.
+
+    Utiliza el truco de Montgomery: acumula los productos prefijo, invierte el producto total
+    y recorre la lista en sentido inverso para recuperar cada inverso con dos multiplicaciones.
+
+    Args:
+        valores (list): Elementos del campo a invertir.
+        primo (int): Módulo del campo. Por defecto es `PRIMO`.
+
+    Precondición:
+        - Ningún elemento de `valores` debe ser congruente con cero módulo `primo`.
+
+    Postcondición:
+        - Se retorna una lista del mismo tamaño con el inverso de cada elemento, en el mismo orden.
+
+    Returns:
+        list: Inversos de `valores` módulo `primo`.
+
+    Raises:
+        ValueError: Si algún elemento es cero en el campo.
+    """
+    prefijos = []
+    acumulado = 1
+    for valor in valores:
+        prefijos.append(acumulado)
+        acumulado = acumulado * valor % primo
+    inverso_total = inverso(acumulado, primo)
+
+    resultado = [0] * len(prefijos)
+    for i in range(len(prefijos) - 1, -1, -1):
+        resultado[i] = prefijos[i] * inverso_total % primo
+        inverso_total = inverso_total * valores[i] % primo
+    return resultado
@@ -0,0 +1,168 @@
+import os
+import numpy as np
+
+# Polinomio irreducible x^8 + x^4 + x^3 + x + 1 que define GF(2^8), el mismo de AES.
+POLINOMIO_REDUCCION = 0x11B
+
+# Máximo número de fragmentos: cada uno usa una abscisa distinta y no nula del campo.
+MAX_FRAGMENTOS = 255
+
+
+def _construir_tablas():
+    """
+    Construye las tablas de exponentes, logaritmos y multiplicación de GF(2^8).
+
+    Usa 3 como generador del grupo multiplicativo. La tabla de exponentes se duplica para que
+    `EXP[LOG[a] + LOG[b]]` no necesite reducir la suma módulo 255.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Tablas `EXP` (510), `LOG` (256) y `MULT` (256x256).
+    """
+    exp = np.zeros(510, dtype=np.uint8)
+    log = np.zeros(256, dtype=np.int32)
+    valor = 1
+    for i in range(255):
+        exp[i] = valor
+        log[valor] = i
+        doble = valor << 1
+        if doble & 0x100:
+            doble ^= POLINOMIO_REDUCCION
+        valor ^= doble
+    exp[255:] = exp[:255]
+
+    elementos = np.arange(256)
+    mult = exp[log[elementos][:, None] + log[elementos][None, :]]
+    mult[0, :] = 0
+    mult[:, 0] = 0
+    return exp, log, mult
+
+
+EXP, LOG, MULT = _construir_tablas()
+
+
+def multiplica(a, b):
+    """
+    Multiplica dos elementos de GF(2^8).
+
+    Args:
+        a (int): Elemento entre 0 y 255.
+        b (int): Elemento entre 0 y 255.
+
+    Returns:
+        int: El producto `a·b` en el campo.
+    """
+    return int(MULT[a, b])
+
+
+def inverso(valor):
+    """
+    Calcula el inverso multiplicativo de un elemento de GF(2^8).
+
+    Args:
+        valor (int): Elemento entre 1 y 255.
+
+    Returns:
+        int: `v` tal que `valor·v = 1` en el campo.
+
+    Raises:
+        ValueError: Si `valor` es cero.
+    """
+    if valor == 0:
+        raise ValueError("El cero no tiene inverso en el campo.")
+    return int(EXP[255 - LOG[valor]])
+
+
+def divide_secreto(secreto, n, t):
+    """
+    Divide una cadena de bytes de cualquier longitud en `n` fragmentos con umbral `t`.
+
+    Cada byte del secreto es el término independiente de su propio polinomio de grado `t-1`
+    sobre GF(2^8). Para cada abscisa, todos los polinomios se evalúan a la vez con Horner:
+    cada paso es una consulta vectorizada a la fila de la tabla de multiplicación de esa abscisa.
+
+    Args:
+        secreto (bytes): Datos a dividir.
+        n (int): Número de fragmentos, a lo más `MAX_FRAGMENTOS`.
+        t (int): Número mínimo de fragmentos para reconstruir.
+
+    Precondición:
+        - `2 <= t <= n <= MAX_FRAGMENTOS`.
+
+    Postcondición:
+        - Cualquier subconjunto de `t` fragmentos reconstruye `secreto` con `combina_secreto`.
+
+    Returns:
+        List[Tuple[int, bytes]]: Fragmentos (x, y), con `x` de 1 a `n` y `y` del largo del secreto.
+
+    Raises:
+        ValueError: Si `n` o `t` están fuera de rango.
+    """
+    if not 2 <= t <= n <= MAX_FRAGMENTOS:
+        raise ValueError(f"Se requiere 2 <= t <= n <= {MAX_FRAGMENTOS}.")
+    datos = np.frombuffer(bytes(secreto), dtype=np.uint8)
+    coeficientes = np.frombuffer(os.urandom((t - 1) * datos.size), dtype=np.uint8).reshape(t - 1, datos.size)
+
+    fragmentos = []
+    for x in range(1, n + 1):
+        por_x = MULT[x]
+        acumulado = coeficientes[-1]
+        for coeficiente in coeficientes[-2::-1]:
+            acumulado = por_x[acumulado] ^ coeficiente
+        fragmentos.append((x, (por_x[acumulado] ^ datos).tobytes()))
+    return fragmentos
+
+
+def pesos_en_cero(abscisas):
+    """
+    Calcula los pesos de Lagrange `L_i(0) = Π x_j / (x_j - x_i)` en GF(2^8).
+
+    En característica 2 la resta es XOR, de modo que `x_j - x_i = x_j ^ x_i`.
+
+    Args:
+        abscisas (List[int]): Abscisas distintas y no nulas.
+
+    Returns:
+        List[int]: El peso de cada abscisa, en el mismo orden.
+    """
+    pesos = []
+    for i, xi in enumerate(abscisas):
+        numerador = 1
+        denominador = 1
+        for j, xj in enumerate(abscisas):
+            if i != j:
+                numerador = multiplica(numerador, xj)
+                denominador = multiplica(denominador, xj ^ xi)
+        pesos.append(multiplica(numerador, inverso(denominador)))
+    return pesos
+
+
+def combina_secreto(fragmentos):
+    """
+    Reconstruye el secreto a partir de al menos `t` fragmentos de `divide_secreto`.
+
+    Los pesos de Lagrange se calculan una sola vez para todas las posiciones; cada fragmento
+    aporta su fila de la tabla de multiplicación indexada por sus bytes.
+
+    Args:
+        fragmentos (List[Tuple[int, bytes]]): Fragmentos (x, y) con abscisas distintas.
+
+    Returns:
+        bytes: El secreto reconstruido.
+
+    Raises:
+        ValueError: Si no hay fragmentos, si se repite o es cero alguna abscisa, o si los
+            fragmentos tienen longitudes distintas.
+    """
+    if not fragmentos:
+        raise ValueError("Se necesita al menos un fragmento.")
+    abscisas = [x for x, _ in fragmentos]
+    if len(set(abscisas)) != len(abscisas) or not all(1 <= x <= MAX_FRAGMENTOS for x in abscisas):
+        raise ValueError("Las abscisas de los fragmentos deben ser distintas y estar entre 1 y 255.")
+    longitud = len(fragmentos[0][1])
+    if any(len(y) != longitud for _, y in fragmentos):
+        raise ValueError("Los fragmentos tienen longitudes distintas.")
+
+    secreto = np.zeros(longitud, dtype=np.uint8)
+    for (_, y), peso in zip(fragmentos, pesos_en_cero(abscisas)):
+        secreto ^= MULT[peso][np.frombuffer(y, dtype=np.uint8)]
+    return secreto.tobytes()
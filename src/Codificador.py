@@ -1,29 +1,35 @@
 
 import hashlib
 import os
-import random
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.primitives.padding import PKCS7
-from cryptography.hazmat.backends import default_backend
-from .Polinomio import Monomio, Polinomio
+import secrets
+import tempfile
+from .Polinomio import Polinomio
+from .Campo import PRIMO
 from .Archivo import Archivo
-import pickle
+from .Cabecera import (Cabecera, CIFRADO_AES_CBC, CIFRADO_AES_GCM, TAMANO_SAL, clave_gcm, nonce_bloque,
+                       valor_verificacion)
+from .Cronometro import Cronometro
+from .Paralelo import EjecutorOrdenado
+from . import Fragmentos
 
 class Codificador:
 
     """
-    Clase para cifrar y manejar archivos utilizando el algoritmo sha256 y AES en modo CBC.
+    Clase para cifrar y manejar archivos utilizando el algoritmo sha256 y AES en modo GCM o CBC.
     Attributes:
         __key (bytes): Clave de cifrado generada a partir de una contraseña.
+        cronometro (Cronometro): Registra el tiempo de cada etapa del cifrado.
     """
 
-    def __init__(self):
+    def __init__(self, cronometro=None):
         self.__key = None
         self.__nombreCifrado = None
+        self.cronometro = cronometro or Cronometro(activo=False)
         """
         Inicializa el objeto Codificador.
         Establece la clave de cifrado (__key) como `None` por defecto.
         Establece el nombre original del archivo claro (__nombre) como `None` por defecto.
+        Usa el `cronometro` dado para medir las etapas; por defecto no se mide nada.
         """
 
     def generaSha(self, password):
@@ -45,11 +51,23 @@ class Codificador:
         :param nombre_archivo: Nombre del archivo a leer (str).
         :return: El objeto en bytes, o `None` si el archivo no existe.
         """
+        import pickle
+
         archivo = Archivo(nombre_archivo)
         en_bytes = pickle.dumps(archivo)
         return en_bytes
 
     
+    def ruta_cifrado(self):
+        """Devuelve la ruta del archivo `.aes` de salida, creando `resultados` si no existe.
+
+        :return: Ruta del archivo cifrado (str).
+        """
+        ruta = os.path.join(os.path.dirname(__file__), '../resultados')
+        if not os.path.exists(ruta):
+            os.makedirs(ruta)
+        return os.path.join(ruta, f"{self.__nombreCifrado}.aes")
+
     def guardar_archivo(self, data):
         """Guarda datos cifrados en un archivo con extensión `.aes`.
 
@@ -59,94 +77,194 @@ class Codificador:
         :param data: Datos cifrados a guardar (bytes).
         """
 
-        ruta = os.path.join(os.path.dirname(__file__), '../resultados')
-        cifrado = os.path.join(ruta, f"{self.__nombreCifrado}.aes") 
-
-        if not os.path.exists(ruta):
-            os.makedirs(ruta)
-    
-        with open(cifrado, 'wb') as archivo:
+        with open(self.ruta_cifrado(), 'wb') as archivo:
             archivo.write(data)
  
 
-    def cifrar_archivo(self, archivo_claro, nombre, password):
-        """Cifra un archivo utilizando AES en modo CBC.
+    def cifrar_archivo(self, archivo_claro, nombre, password, cifrado=CIFRADO_AES_GCM, trabajadores=None):
+        """Cifra un archivo utilizando AES en modo GCM (por defecto) o CBC.
+
+        Lee el archivo especificado en bloques de `TAMANO_BLOQUE` bytes, los cifra utilizando
+        la contraseña proporcionada y los escribe conforme avanza en el archivo `.aes`, precedidos
+        por una `Cabecera` versionada con la longitud original, el IV y un valor de verificación
+        de la clave. El nombre del archivo original se cifra junto con el contenido, al inicio,
+        para no dejarlo en claro. La memoria usada no depende del tamaño del archivo. El `.aes` se
+        escribe en un temporal que solo se renombra si el cifrado termina bien, para no dejar
+        archivos a medias en 'resultados'.
 
-        Lee el archivo especificado, lo cifra utilizando la contraseña proporcionada
-        y guarda el archivo cifrado con extensión `.aes`.
+        En AES-GCM el archivo se cifra con una clave propia derivada de una sal aleatoria (ver
+        `clave_gcm`), cada bloque con su propio nonce (ver `nonce_bloque`) y lleva una
+        etiqueta que autentica el bloque y la cabecera, por lo que al descifrar una clave
+        incorrecta o un archivo alterado se detectan en el primer bloque dañado. Como los bloques
+        son independientes, se cifran en paralelo con `trabajadores` hilos y se escriben en orden.
 
         :param archivo_claro: Nombre del archivo a cifrar (str).
+        :param nombre: Nombre del archivo cifrado, sin extensión (str).
         :param password: Contraseña utilizada para generar la clave de cifrado (str).
-        :raises Exception: Si el archivo no existe.
+        :param cifrado: `CIFRADO_AES_GCM` o `CIFRADO_AES_CBC` (int).
+        :param trabajadores: Hilos para cifrar en AES-GCM (int). Por defecto, el número de núcleos;
+            AES-CBC siempre usa uno.
+        :raises FileNotFoundError: Si el archivo no existe.
+        :raises ValueError: Si el cifrado no está soportado.
+        :raises IOError: Si el archivo cambia de tamaño mientras se cifra.
         """
-        
-        self.generaSha(password)
+        if cifrado not in (CIFRADO_AES_GCM, CIFRADO_AES_CBC):
+            raise ValueError(f"El cifrado {cifrado} no está soportado.")
+
+        cronometro = self.cronometro
+        with cronometro.etapa("sha"):
+            self.generaSha(password)
         self.__nombreCifrado = nombre
 
-        datos = self.convertir_objeto(archivo_claro)
+        with cronometro.etapa("apertura"):
+            archivo = Archivo(archivo_claro)
+            iv = os.urandom(TAMANO_SAL if cifrado == CIFRADO_AES_GCM else 16)
+            cabecera = Cabecera(os.path.basename(archivo.get_nombre()), iv, archivo.get_tamano(), cifrado,
+                                verificacion=valor_verificacion(self.__key))
+            if cifrado == CIFRADO_AES_GCM:
+                cifra_bloque = self._cifrador_gcm(cabecera)
+            else:
+                cifra_bloque = self._cifrador_cbc(cabecera)
+                trabajadores = 1
+
+        ruta = self.ruta_cifrado()
+        descriptor, temporal = tempfile.mkstemp(suffix=".parcial", dir=os.path.dirname(ruta))
+        try:
+            with os.fdopen(descriptor, 'wb') as destino, EjecutorOrdenado(cifra_bloque, trabajadores) as ejecutor:
+                destino.write(cabecera.a_bytes())
+                leidos = 0
+                indice = 0
+                bloques = archivo.iterar_bloques(cabecera.tamano_bloque, cabecera.nombre.encode('utf-8'))
+                with cronometro.etapa("lectura"):
+                    bloque = next(bloques, b"")
+                while bloque is not None:
+                    with cronometro.etapa("lectura"):
+                        siguiente = next(bloques, None)
+                    leidos += len(bloque)
+                    ejecutor.agrega(indice, bloque, siguiente is None)
+                    with cronometro.etapa("aes"):
+                        cifrados = ejecutor.extrae(todas=siguiente is None)
+                    with cronometro.etapa("escritura"):
+                        destino.writelines(cifrados)
+                    bloque = siguiente
+                    indice += 1
+
+            if leidos != cabecera.longitud_flujo:
+                raise IOError(f"El archivo '{archivo_claro}' cambió de tamaño mientras se cifraba.")
+            os.replace(temporal, ruta)
+        except BaseException:
+            if os.path.exists(temporal):
+                os.remove(temporal)
+            raise
+
+    def _cifrador_cbc(self, cabecera):
+        """
+        Prepara el cifrado AES-CBC con relleno PKCS7 de bloques consecutivos.
+
+        :param cabecera: Cabecera del archivo, con el IV (Cabecera).
+        :return: Función `(indice, bloque, ultimo) -> bytes` que cifra el siguiente bloque.
+        """
+        # `cryptography` se importa hasta que se necesita para no penalizar el arranque.
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+        from cryptography.hazmat.primitives.padding import PKCS7
+        from cryptography.hazmat.backends import default_backend
 
         padder = PKCS7(algorithms.AES.block_size).padder()
-        datos_padded = padder.update(datos) + padder.finalize()
+        encryptor = Cipher(algorithms.AES(self.__key), modes.CBC(cabecera.iv), backend=default_backend()).encryptor()
 
-        iv = os.urandom(16)
+        def cifra_bloque(indice, bloque, ultimo):
+            cifrado = encryptor.update(padder.update(bloque))
+            if ultimo:
+                cifrado += encryptor.update(padder.finalize()) + encryptor.finalize()
+            return cifrado
+        return cifra_bloque
 
-        cifrar = Cipher(algorithms.AES(self.__key), modes.CBC(iv), backend=default_backend())
-        encryptor = cifrar.encryptor()
-        datos_cifrados = encryptor.update(datos_padded) + encryptor.finalize()
+    def _cifrador_gcm(self, cabecera):
+        """
+        Prepara el cifrado AES-GCM por bloques, autenticando la cabecera en cada uno.
+
+        :param cabecera: Cabecera del archivo, con la sal de su clave (Cabecera).
+        :return: Función `(indice, bloque, ultimo) -> bytes` que cifra un bloque y agrega su etiqueta;
+            no guarda estado, por lo que puede llamarse desde varios hilos.
+        """
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
-        datos_con_iv = iv + datos_cifrados
-        self.guardar_archivo(datos_con_iv)
+        clave, prefijo = clave_gcm(self.__key, cabecera)
+        aesgcm = AESGCM(clave)
+        datos_asociados = cabecera.a_bytes()
+
+        def cifra_bloque(indice, bloque, ultimo):
+            return aesgcm.encrypt(nonce_bloque(prefijo, indice, ultimo), bloque, datos_asociados)
+        return cifra_bloque
 
 
     def shamir_generar_polinomio(self, grado):
         """
         Genera un polinomio para Shamir's Secret Sharing con la contraseña como término independiente.
+
+        El polinomio vive en el campo GF(PRIMO), por lo que sus coeficientes y evaluaciones
+        tienen un ancho fijo sin importar el umbral ni el número de fragmentos.
         
         Args:
             password (str): Contraseña del usuario.
-            grado (int): Grado del polinomio, que será `t-1` donde `t` es el umbral.
+            grado (int): Número de coeficientes, igual al umbral `t`; el polinomio tiene grado `t-1`,
+                así que se necesitan exactamente `t` puntos para reconstruirlo.
 
         Returns:
             Polinomio: Polinomio generado.
         """
-        if(grado <= 0 or grado >20):
-            raise Exception("El umbral del polinomio es inválido por ser cero, negativo, o muy grande.")
+        if(grado <= 0):
+            raise Exception("El umbral del polinomio es inválido por ser cero o negativo.")
         
         k = int.from_bytes(self.__key, 'big')
 
-        coeficientes = [random.randint(1, 2**256 - 1) for _ in range(1 , grado-1)]
+        # Los coeficientes ocultos vienen de `secrets`: con `random` (Mersenne Twister) podrían predecirse.
+        coeficientes = [secrets.randbelow(PRIMO - 1) + 1 for _ in range(1, grado)]
         coeficientes.insert(0, k)  # Insertar K como término independiente
 
-        monomios = [Monomio(coef, exp) for exp, coef in enumerate(coeficientes)]
-        return Polinomio(monomios)
+        return Polinomio.desde_coeficientes(coeficientes, PRIMO)
 
     def shamir_generar_puntos(self, polinomio, n):
         """
-        Genera `n` puntos evaluando el polinomio en distintos valores de `x`.
+        Genera `n` puntos evaluando el polinomio en `x = 1, ..., n`.
+
+        Los valores se calculan todos juntos con `Polinomio.evalua_consecutivos` (diferencias
+        finitas), sin multiplicaciones por punto, para repartir entre cientos de miles de participantes.
 
         Args:
             polinomio (Polinomio): Polinomio generado.
             n (int): Número de puntos a generar.
 
         Returns:
-            List[Tuple[int, int]]: Lista de puntos `(x, y)`.
+            List[Tuple[int, int]]: Lista de puntos `(x, y)` con `y` reducido módulo PRIMO.
         """
         if(n<=0):
             raise Exception("El número de puntos a generar no puede ser negativo o cero.")
         
-        puntos = [(x, polinomio.evalua(x)) for x in range(1, n + 1)]
+        puntos = list(zip(range(1, n + 1), polinomio.evalua_consecutivos(n)))
         return puntos
 
-    def guardar_fragmentos(self, puntos):
+    def guardar_fragmentos(self, puntos, formato="binario", umbral=None):
         """
         Genera un archivo de fragmentos de Shamir con los puntos (xi, P(xi)).
 
-        :param archivo_cifrado: Nombre del archivo cifrado (str).
+        Por defecto usa el formato binario de `Fragmentos`, con ordenadas de ancho fijo y un
+        CRC por fragmento; el formato de texto `(x,y)` sigue disponible. En el binario se registra
+        el umbral para que al descifrar se lean solo los fragmentos necesarios.
+
         :param puntos: Lista de puntos (xi, P(xi)).
+        :param formato: `"binario"` o `"texto"` (str).
+        :param umbral: Número mínimo de fragmentos para reconstruir (int), o None si se desconoce.
+        :raises ValueError: Si el formato no es válido.
         """
         ruta = os.path.join(os.path.dirname(__file__), '../resultados')
         archivo_fragmentos = os.path.join(ruta, f"{self.__nombreCifrado}.frg")
-        
-        with open(archivo_fragmentos, 'w') as archivo:
-            for x, y in puntos:
-                archivo.write(f"({x},{y})\n")
+
+        if formato == "binario":
+            with open(archivo_fragmentos, 'wb') as archivo:
+                archivo.write(Fragmentos.codifica_fragmentos(puntos, umbral or 0))
+        elif formato == "texto":
+            with open(archivo_fragmentos, 'w') as archivo:
+                archivo.write(Fragmentos.codifica_texto(puntos))
+        else:
+            raise ValueError(f"Formato de fragmentos desconocido: {formato}")
@@ -0,0 +1,223 @@
+import argparse
+import json
+import os
+import sys
+from .Gestor import (verifica_archivo, validar_tamano, nombreCorrecto, rangoValido, gestiona_C, gestiona_D,
+                     gestiona_C_lote, gestiona_D_lote, nombre_desde_archivo, verificar_extension_aes,
+                     verificar_extension_frg)
+
+# Variable de entorno de la que se lee la contraseña si no se usa `--contrasena-stdin`.
+VARIABLE_CONTRASENA = "SHAMIR_CONTRASENA"
+
+EXITO = 0
+ERROR = 1
+ARGUMENTOS_INVALIDOS = 2
+
+
+class ArgumentosInvalidos(ValueError):
+    """Error en los argumentos del comando; `main` termina con `ARGUMENTOS_INVALIDOS`."""
+
+
+def _valida(comprobacion, *valores):
+    """
+    Ejecuta una validación de `Gestor` sobre argumentos del comando.
+
+    Raises:
+        ArgumentosInvalidos: Si la validación falla.
+    """
+    try:
+        comprobacion(*valores)
+    except (ValueError, TypeError) as e:
+        raise ArgumentosInvalidos(str(e)) from e
+
+
+def crear_parser():
+    """
+    Construye el analizador de argumentos de la línea de comandos.
+
+    Returns:
+        argparse.ArgumentParser: Analizador con los subcomandos `split` y `combine`.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m src.Comandos",
+        description="Cifra y descifra archivos con Shamir Secret Sharing sin la consola interactiva.",
+    )
+    parser.add_argument("--json", action="store_true", help="Imprime el resultado como JSON.")
+    parser.add_argument("--tiempos", metavar="ARCHIVO", help="Guarda el tiempo de cada etapa en un archivo JSON.")
+    parser.add_argument("--perfil", metavar="ARCHIVO", help="Ejecuta la operación bajo cProfile y guarda el perfil.")
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+
+    split = subcomandos.add_parser("split", help="Cifra un archivo y divide su clave en n fragmentos.")
+    split.add_argument("archivo", help="Archivo a cifrar dentro de la carpeta docs (o directorio/manifiesto con --lote).")
+    split.add_argument("-n", type=int, required=True, help="Número de fragmentos a generar.")
+    split.add_argument("-t", type=int, required=True, help="Número mínimo de fragmentos para reconstruir.")
+    split.add_argument("--nombre", help="Nombre del .aes y .frg de salida. Por defecto, el del archivo.")
+    split.add_argument("--lote", action="store_true", help="Cifra todos los archivos de un directorio o manifiesto.")
+    split.add_argument("--trabajadores", type=int, help="Procesos para --lote. Por defecto, el número de núcleos.")
+    split.add_argument("--hilos", type=int, help="Hilos para cifrar un archivo por bloques. Por defecto, el número de núcleos.")
+    split.add_argument("--contrasena-stdin", action="store_true",
+                       help=f"Lee la contraseña de la entrada estándar en vez de ${VARIABLE_CONTRASENA}.")
+
+    combine = subcomandos.add_parser("combine", help="Reconstruye la clave y descifra un archivo.")
+    combine.add_argument("cifrado", help="Archivo .aes dentro de la carpeta docs (o directorio con --lote).")
+    combine.add_argument("fragmentos", nargs="?", help="Archivo .frg dentro de la carpeta docs.")
+    combine.add_argument("--lote", action="store_true", help="Descifra todos los pares .aes/.frg de un directorio.")
+    combine.add_argument("--trabajadores", type=int, help="Procesos para --lote. Por defecto, el número de núcleos.")
+    combine.add_argument("--robusto", action="store_true",
+                         help="Corrige fragmentos alterados con Reed-Solomon; requiere más de t fragmentos.")
+    combine.add_argument("--hilos", type=int, help="Hilos para descifrar un archivo por bloques. Por defecto, el número de núcleos.")
+    return parser
+
+
+def _rechaza_con_lote(argumentos, *opciones):
+    """
+    Rechaza las opciones que no tienen efecto en el modo lote, en vez de ignorarlas en silencio.
+
+    Args:
+        argumentos (argparse.Namespace): Argumentos del subcomando.
+        *opciones (str): Nombres de los atributos de las opciones a revisar.
+
+    Raises:
+        ArgumentosInvalidos: Si alguna de las opciones se dio junto con `--lote`.
+    """
+    for opcion in opciones:
+        if getattr(argumentos, opcion):
+            raise ArgumentosInvalidos(f"--{opcion} no está disponible con --lote.")
+
+
+def leer_contrasena(desde_stdin):
+    """
+    Obtiene la contraseña de la entrada estándar o de la variable de entorno.
+
+    Args:
+        desde_stdin (bool): Si es True se lee la primera línea de la entrada estándar.
+
+    Returns:
+        str: La contraseña.
+
+    Raises:
+        ArgumentosInvalidos: Si no se proporcionó contraseña.
+    """
+    if desde_stdin:
+        contrasena = sys.stdin.readline().rstrip("\r\n")
+    else:
+        contrasena = os.environ.get(VARIABLE_CONTRASENA)
+    if not contrasena:
+        raise ArgumentosInvalidos(f"No se proporcionó contraseña; usa --contrasena-stdin o la variable {VARIABLE_CONTRASENA}.")
+    return contrasena
+
+
+def ejecutar_split(argumentos, cronometro=None):
+    """
+    Ejecuta el subcomando `split`.
+
+    Args:
+        argumentos (argparse.Namespace): Argumentos del subcomando.
+        cronometro (Cronometro, optional): Registra el tiempo de cada etapa.
+
+    Returns:
+        dict: Resultado de la operación, con la llave `exito`.
+
+    Raises:
+        ArgumentosInvalidos: Si `n`, `t`, la contraseña o el nombre son inválidos, o si se dio
+            `--nombre` o `--hilos` con `--lote`.
+    """
+    _valida(rangoValido, argumentos.n, argumentos.t)
+    contrasena = leer_contrasena(argumentos.contrasena_stdin)
+    _valida(validar_tamano, contrasena)
+    if argumentos.lote:
+        _rechaza_con_lote(argumentos, "nombre", "hilos")
+        resumen = gestiona_C_lote(argumentos.archivo, argumentos.n, argumentos.t, contrasena, argumentos.trabajadores)
+        return dict(resumen, exito=resumen["fallidos"] == 0)
+
+    verifica_archivo(argumentos.archivo)
+    nombre = argumentos.nombre or nombre_desde_archivo(argumentos.archivo, set())
+    _valida(nombreCorrecto, nombre)
+    gestiona_C([nombre, argumentos.n, argumentos.t, argumentos.archivo, contrasena], cronometro, argumentos.hilos)
+    return {"exito": True, "cifrado": f"{nombre}.aes", "fragmentos": f"{nombre}.frg"}
+
+
+def ejecutar_combine(argumentos, cronometro=None):
+    """
+    Ejecuta el subcomando `combine`.
+
+    Args:
+        argumentos (argparse.Namespace): Argumentos del subcomando.
+        cronometro (Cronometro, optional): Registra el tiempo de cada etapa.
+
+    Returns:
+        dict: Resultado de la operación, con la llave `exito` y, fuera del modo lote, la ruta del
+        archivo descifrado en `descifrado`.
+
+    Raises:
+        ArgumentosInvalidos: Si falta el archivo de fragmentos fuera del modo lote, alguna extensión
+            es incorrecta o se dio `--robusto` o `--hilos` con `--lote`.
+    """
+    if argumentos.lote:
+        _rechaza_con_lote(argumentos, "robusto", "hilos")
+        resumen = gestiona_D_lote(argumentos.cifrado, argumentos.trabajadores)
+        return dict(resumen, exito=resumen["fallidos"] == 0)
+
+    if argumentos.fragmentos is None:
+        raise ArgumentosInvalidos("Falta el archivo de fragmentos (.frg).")
+    _valida(verificar_extension_aes, argumentos.cifrado)
+    _valida(verificar_extension_frg, argumentos.fragmentos)
+    verifica_archivo(argumentos.cifrado)
+    verifica_archivo(argumentos.fragmentos)
+    # El nombre del archivo original va cifrado, así que la ruta de salida solo se conoce al descifrar.
+    _, destino = gestiona_D([argumentos.cifrado, argumentos.fragmentos], cronometro, argumentos.hilos,
+                            argumentos.robusto)
+    return {"exito": True, "cifrado": argumentos.cifrado, "fragmentos": argumentos.fragmentos,
+            "descifrado": os.path.abspath(destino)}
+
+
+def main(argv=None):
+    """
+    Punto de entrada no interactivo.
+
+    Args:
+        argv (list, optional): Argumentos sin el nombre del programa. Por defecto, `sys.argv[1:]`.
+
+    Returns:
+        int: Código de salida: 0 si todo salió bien, 1 si hubo errores y 2 si los argumentos son inválidos.
+        Los errores de sintaxis los reporta argparse terminando con `SystemExit(2)`.
+    """
+    parser = crear_parser()
+    argumentos = parser.parse_args(argv)
+    if argumentos.tiempos and argumentos.lote:
+        # Cada elemento del lote se procesa en otro proceso, fuera del alcance del cronómetro.
+        parser.error("--tiempos no está disponible con --lote.")
+    operacion = {"split": ejecutar_split, "combine": ejecutar_combine}[argumentos.comando]
+    codigo = None
+    cronometro = None
+    if argumentos.tiempos:
+        from .Cronometro import Cronometro
+        cronometro = Cronometro()
+    try:
+        if argumentos.perfil:
+            from .Cronometro import perfilar
+            resultado = perfilar(argumentos.perfil, operacion, argumentos, cronometro)
+        else:
+            resultado = operacion(argumentos, cronometro)
+    except ArgumentosInvalidos as e:
+        resultado = {"exito": False, "error": str(e)}
+        codigo = ARGUMENTOS_INVALIDOS
+    except Exception as e:
+        resultado = {"exito": False, "error": str(e)}
+    if cronometro is not None:
+        cronometro.guardar(argumentos.tiempos)
+
+    if argumentos.json:
+        print(json.dumps(resultado, ensure_ascii=False))
+    elif not resultado["exito"]:
+        errores = [resultado["error"]] if "error" in resultado else [
+            f"{r.get('archivo') or r.get('cifrado')}: {r['error']}" for r in resultado["resultados"] if not r["exito"]]
+        for error in errores:
+            print(f"Error: {error}", file=sys.stderr)
+    if codigo is None:
+        codigo = EXITO if resultado["exito"] else ERROR
+    return codigo
+
+
+if __name__ == "__main__":
+    sys.exit(main())
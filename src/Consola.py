@@ -1,16 +1,28 @@
 from getpass import getpass
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Prompt
-from rich.text import Text
 from .Gestor import verifica_archivo, validar_tamano, nombreCorrecto, rangoValido, gestiona_C, gestiona_D, verificar_extension_aes, verificar_extension_frg
 
-console = Console()
+_console = None
+
+def obtener_consola():
+    """
+    Devuelve la consola de Rich, creándola (e importando Rich) la primera vez que se usa.
+
+    Returns:
+        rich.console.Console: La consola compartida del programa.
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
 
 def mostrar_titulo():
     """
     Muestra el título principal del programa con formato enriquecido usando Rich.
     """
+    from rich.panel import Panel
+    from rich.text import Text
+
     panel = Panel(
         Text("Bienvenid@", style="bold yellow"),
         title="Shamir Secret Sharing",
@@ -19,7 +31,7 @@ def mostrar_titulo():
         padding=(1, 2),
         expand=True
     )
-    console.print(panel)
+    obtener_consola().print(panel)
 
 def mostrar_menu(titulo, opciones):
     """
@@ -29,6 +41,8 @@ def mostrar_menu(titulo, opciones):
         titulo (str): El título del menú.
         opciones (list): Lista de opciones del menú.
     """
+    from rich.panel import Panel
+
     menu_text = "\n".join(
         [f"[bold yellow][{i}][/bold yellow] [cyan]- {opcion}[/]" for i, opcion in enumerate(opciones, start=1)]
     )
@@ -41,7 +55,7 @@ def mostrar_menu(titulo, opciones):
         style="bold green",
         expand=True
     )
-    console.print(panel)
+    obtener_consola().print(panel)
 
 def ejecutar_opcion(opciones, seleccionado):
     """
@@ -61,9 +75,9 @@ def ejecutar_opcion(opciones, seleccionado):
         if 1 <= selec <= len(opciones):
             opciones[selec - 1]()
         else:
-            console.print("[bold red]Opción no válida. Intenta nuevamente.[/]")
+            obtener_consola().print("[bold red]Opción no válida. Intenta nuevamente.[/]")
     except ValueError:
-        console.print("[bold red]Entrada inválida. Por favor, ingresa un número.[/]")
+        obtener_consola().print("[bold red]Entrada inválida. Por favor, ingresa un número.[/]")
 
 def entrada_cifrar():
     """
@@ -74,10 +88,10 @@ def entrada_cifrar():
             datos = obtener_datos_cifrado()
             gestiona_C(datos)
         except Exception as e:
-            console.print(f"[bold red]Error: {e}\n", style="bold yellow")
-            console.print("[bold green]Intente de nuevo.")
+            obtener_consola().print(f"[bold red]Error: {e}\n", style="bold yellow")
+            obtener_consola().print("[bold green]Intente de nuevo.")
         else:
-            console.print(
+            obtener_consola().print(
                 f"[bold magenta]✔ Archivo cifrado guardado correctamente en:\n"
                 f"[bold yellow] - {datos[0]}.aes[/] y [bold yellow]{datos[0]}.frg[/] en la carpeta [bold green]../resultados/[/]",
                 style="bold yellow"
@@ -91,6 +105,9 @@ def obtener_datos_cifrado():
     Returns:
         list: Lista con los datos proporcionados por el usuario.
     """
+    from rich.prompt import Prompt
+
+    console = obtener_consola()
     console.print("[bold green]✔ Ingrese el nombre del archivo a encriptar:[/]")
     documento = Prompt.ask("Debe estar en la carpeta [bold cyan]/docs[/] de este proyecto e incluir la extensión (ej: archivo.txt)")
     verifica_archivo(documento)
@@ -113,10 +130,10 @@ def entrada_descifrar():
             datos = obtener_datos_descifrado()
             gestiona_D(datos)
         except Exception as e:
-            console.print(f"[bold red]Error: {e}\n", style="bold yellow")
-            console.print("[bold green]Intente de nuevo.")
+            obtener_consola().print(f"[bold red]Error: {e}\n", style="bold yellow")
+            obtener_consola().print("[bold green]Intente de nuevo.")
         else:
-            console.print(
+            obtener_consola().print(
                 "[bold magenta]✔ Archivo descifrado correctamente.\n"
                 "[bold green]Guardado en la carpeta: [bold yellow]../resultados[/]",
                 style="bold yellow"
@@ -130,6 +147,9 @@ def obtener_datos_descifrado():
     Returns:
         list: Lista con los datos proporcionados por el usuario.
     """
+    from rich.prompt import Prompt
+
+    console = obtener_consola()
     console.print("[bold green]✔ Ingrese el nombre del archivo a descifrar:[/]")
     descifrar = Prompt.ask("Archivo cifrado (ej: archivo.aes):")
     verificar_extension_aes(descifrar)
@@ -143,6 +163,9 @@ def mostrar_consola():
     """
     Función principal que controla el flujo del menú y la interacción con el usuario.
     """
+    from rich.prompt import Prompt
+
+    console = obtener_consola()
     mostrar_titulo()
     opciones = ["Cifrar Archivo", "Descifrar Archivo"]
     acciones = [
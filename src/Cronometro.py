@@ -0,0 +1,131 @@
+import json
+import time
+from contextlib import nullcontext
+
+_SIN_MEDICION = nullcontext()
+
+
+class Cronometro:
+    """
+    Acumula el tiempo de cada etapa del cifrado y descifrado.
+
+    Las etapas pueden anidarse; cada una se identifica por su ruta, por ejemplo
+    `gestiona_C/cifrar_archivo/aes`, y acumula el número de llamadas y el tiempo total, de modo
+    que medir cada bloque de un archivo grande no hace crecer la memoria. Un cronómetro inactivo
+    no mide nada y su costo es despreciable.
+
+    Attributes:
+        activo (bool): Si es False, `etapa` no registra nada.
+    """
+
+    def __init__(self, activo=True):
+        """
+        Inicializa el cronómetro.
+
+        Args:
+            activo (bool): Si es False, las etapas no se miden.
+        """
+        self.activo = activo
+        self._pila = []
+        self._etapas = {}
+
+    def etapa(self, nombre):
+        """
+        Mide el bloque `with` como una etapa anidada dentro de la etapa en curso.
+
+        Args:
+            nombre (str): Nombre de la etapa.
+
+        Returns:
+            Administrador de contexto que mide la etapa.
+        """
+        if not self.activo:
+            return _SIN_MEDICION
+        return _Etapa(self, nombre)
+
+    def _comenzar(self, nombre):
+        """Anida la etapa `nombre` en la pila y devuelve el acumulado de su ruta."""
+        self._pila.append(nombre)
+        # Se registra al comenzar para que `resultados` respete el orden de inicio.
+        return self._etapas.setdefault("/".join(self._pila), [0, 0.0])
+
+    def resultados(self):
+        """
+        Devuelve las mediciones acumuladas en el orden en que comenzó cada etapa.
+
+        Returns:
+            dict: Lista de etapas con sus llamadas y tiempo total, y el tiempo total de las
+            etapas de primer nivel, en milisegundos.
+        """
+        etapas = [{"etapa": ruta, "llamadas": llamadas, "total_ms": total * 1000}
+                  for ruta, (llamadas, total) in self._etapas.items()]
+        total = sum(etapa["total_ms"] for etapa in etapas if "/" not in etapa["etapa"])
+        return {"etapas": etapas, "total_ms": total}
+
+    def a_json(self):
+        """
+        Serializa las mediciones como JSON.
+
+        Returns:
+            str: Mediciones en formato JSON.
+        """
+        return json.dumps(self.resultados(), ensure_ascii=False, indent=2)
+
+    def guardar(self, ruta):
+        """
+        Escribe las mediciones en un archivo JSON.
+
+        Args:
+            ruta (str): Ruta del archivo de salida.
+        """
+        with open(ruta, 'w', encoding='utf-8') as archivo:
+            archivo.write(self.a_json())
+
+
+class _Etapa:
+    """Administrador de contexto que mide una etapa de un `Cronometro`."""
+
+    __slots__ = ("cronometro", "nombre", "inicio", "acumulado")
+
+    def __init__(self, cronometro, nombre):
+        self.cronometro = cronometro
+        self.nombre = nombre
+        self.inicio = 0.0
+        self.acumulado = None
+
+    def __enter__(self):
+        self.acumulado = self.cronometro._comenzar(self.nombre)
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        duracion = time.perf_counter() - self.inicio
+        self.acumulado[0] += 1
+        self.acumulado[1] += duracion
+        self.cronometro._pila.pop()
+        return False
+
+
+def perfilar(ruta_perfil, funcion, *args, **kwargs):
+    """
+    Ejecuta una función bajo cProfile y guarda el perfil en `ruta_perfil`.
+
+    El archivo generado usa el formato de `pstats`, que herramientas como snakeviz, gprof2dot
+    o flameprof convierten en gráficas de flama.
+
+    Args:
+        ruta_perfil (str): Archivo donde guardar el perfil.
+        funcion (callable): Función a perfilar.
+        *args: Argumentos posicionales de `funcion`.
+        **kwargs: Argumentos con nombre de `funcion`.
+
+    Returns:
+        El valor devuelto por `funcion`.
+    """
+    import cProfile
+
+    perfil = cProfile.Profile()
+    try:
+        return perfil.runcall(funcion, *args, **kwargs)
+    finally:
+        perfil.dump_stats(ruta_perfil)
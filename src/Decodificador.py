@@ -1,50 +1,139 @@
 import hashlib
 import os
+import tempfile
 from .Lagrange import Lagrange
-from cryptography.hazmat.primitives import padding as padding_lib
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.backends import default_backend
-import pickle
+from .Campo import PRIMO
+from .Cabecera import (Cabecera, MAGIA, CIFRADO_AES_CBC, CIFRADO_AES_GCM, TAMANO_ETIQUETA, clave_gcm, nonce_bloque,
+                       verifica_clave)
+from .Cronometro import Cronometro
+from .Paralelo import EjecutorOrdenado
+from . import Fragmentos
 
 class Decodificador:
 
-    def __init__(self):
-        pass
+    def __init__(self, cronometro=None):
+        """
+        Inicializa el objeto Decodificador.
+
+        Args:
+            cronometro (Cronometro, optional): Registra el tiempo de cada etapa del descifrado.
+                Por defecto no se mide nada.
+        """
+        self.cronometro = cronometro or Cronometro(activo=False)
 
     def leer_fragmentos(self, archivo):
 
         """ 
         Lee los puntos (fragmentos) desde un archivo. 
+        Acepta tanto el formato binario de `Fragmentos` como el de texto `(x,y)`.
         Args: 
             archivo (str): Nombre del archivo de fragmentos. 
         Returns: List[Tuple[int, int]]: Lista de puntos (x, y). 
         """
-        puntos=[]
         ruta = os.path.join(os.path.dirname(__file__), '../docs', archivo) 
 
         if not os.path.exists(ruta): raise FileNotFoundError(f"Error: El archivo '{archivo}' no existe.")
 
-        with open(ruta, 'r') as archivo: 
-            for linea in archivo: 
-                x, y = map(int, linea.strip().strip('()').split(',')) 
-                puntos.append((x, y))     
-        return puntos
-    
+        with open(ruta, 'rb') as archivo: 
+            return Fragmentos.decodifica(archivo.read())
+
+    def leer_fragmentos_umbral(self, archivo, umbral=None):
+        """
+        Lee del archivo solo los fragmentos necesarios para reconstruir el secreto.
+
+        Los fragmentos se interpretan conforme se leen y la lectura se detiene en cuanto se
+        tienen `umbral` fragmentos válidos con abscisas distintas. Se descartan los fragmentos
+        dañados y los que repiten una abscisa ya leída. Si no se conoce el umbral se leen todos.
+
+        Args:
+            archivo (str): Nombre del archivo de fragmentos.
+            umbral (int, optional): Fragmentos necesarios. Por defecto, el registrado en el archivo.
+
+        Returns:
+            List[Tuple[int, int]]: Puntos (x, y) con abscisas distintas.
+
+        Raises:
+            FileNotFoundError: Si el archivo no existe.
+            ValueError: Si el archivo no contiene `umbral` fragmentos válidos.
+        """
+        ruta = os.path.join(os.path.dirname(__file__), '../docs', archivo)
+
+        if not os.path.exists(ruta): raise FileNotFoundError(f"Error: El archivo '{archivo}' no existe.")
+
+        puntos = {}
+        with open(ruta, 'rb') as flujo:
+            lector = Fragmentos.LectorFragmentos(flujo)
+            umbral = umbral or lector.umbral
+            for x, y, integro in lector:
+                if not integro or x in puntos:
+                    continue
+                puntos[x] = y
+                if umbral is not None and len(puntos) == umbral:
+                    break
+        if umbral is not None and len(puntos) < umbral:
+            raise ValueError(f"Solo hay {len(puntos)} fragmentos válidos de los {umbral} necesarios.")
+        return list(puntos.items())
+
     def reconstruir_secreto(self, archivo):
 
         """
         Reconstruye el secreto a partir de los 
-        fragmentos utilizando la interpolación de Lagrange.
+        fragmentos necesarios (ver `leer_fragmentos_umbral`) utilizando la interpolación de Lagrange en el campo GF(PRIMO).
         Args:
             archivo: archivo con los puntos (List[Tuple[int, int]]): Lista de puntos (x, y).
 
         Returns:
             int: El secreto reconstruido.
         """
-        puntos = self.leer_fragmentos(archivo)
-        lagrange = Lagrange(puntos)
-        secreto = lagrange.evalua(0)
-        return int(round(secreto))
+        with self.cronometro.etapa("fragmentos"):
+            puntos = self.leer_fragmentos_umbral(archivo)
+        with self.cronometro.etapa("lagrange"):
+            lagrange = Lagrange(puntos, PRIMO)
+            secreto = lagrange.evalua(0)
+        return secreto
+
+    def reconstruir_secreto_robusto(self, archivo, umbral=None):
+        """
+        Reconstruye el secreto aunque algunos fragmentos del archivo estén alterados.
+
+        Lee todos los fragmentos, descarta los que fallan su CRC y decodifica el resto como un
+        código Reed-Solomon con Berlekamp-Welch (ver `ReedSolomon`), lo que corrige hasta
+        `(n - umbral) // 2` fragmentos con valores incorrectos en tiempo polinomial.
+
+        Args:
+            archivo (str): Nombre del archivo de fragmentos.
+            umbral (int, optional): Fragmentos necesarios. Por defecto, el registrado en el archivo.
+
+        Returns:
+            Tuple[int, List[int]]: El secreto y las abscisas de los fragmentos dañados o incorrectos.
+
+        Raises:
+            FileNotFoundError: Si el archivo no existe.
+            ValueError: Si no se conoce el umbral o hay demasiados fragmentos dañados.
+        """
+        from .ReedSolomon import decodifica_berlekamp_welch
+
+        ruta = os.path.join(os.path.dirname(__file__), '../docs', archivo)
+
+        if not os.path.exists(ruta): raise FileNotFoundError(f"Error: El archivo '{archivo}' no existe.")
+
+        puntos = {}
+        danados = []
+        with self.cronometro.etapa("fragmentos"):
+            with open(ruta, 'rb') as flujo:
+                lector = Fragmentos.LectorFragmentos(flujo)
+                umbral = umbral or lector.umbral
+                for x, y, integro in lector:
+                    if not integro:
+                        if x is not None:
+                            danados.append(x)
+                    elif x not in puntos:
+                        puntos[x] = y
+        if umbral is None:
+            raise ValueError("El archivo de fragmentos no registra el umbral; indíquelo para reconstruir.")
+        with self.cronometro.etapa("reed_solomon"):
+            coeficientes, incorrectos = decodifica_berlekamp_welch(list(puntos.items()), umbral, PRIMO)
+        return coeficientes[0], sorted(danados + incorrectos)
 
     def leer_archivo(self, archivo_cifrado):
         """
@@ -54,12 +143,23 @@ class Decodificador:
         Returns:
             bytes: Contenido del archivo en bytes.
         """
-        ruta = os.path.join(os.path.dirname(__file__), f'../docs/{archivo_cifrado}')
+        ruta = os.path.join(os.path.dirname(__file__), '../docs', archivo_cifrado)
         if os.path.exists(ruta):
             with open(ruta, 'rb') as archivo:
                 return archivo.read()
         raise FileNotFoundError(f"El archivo '{archivo_cifrado}' no existe.")
     
+    def ruta_resultado(self, nombre_original):
+        """Devuelve la ruta donde se guarda el archivo descifrado, creando `resultados` si no existe.
+
+        :param nombre_original: Nombre del archivo original (str).
+        :return: Ruta del archivo descifrado (str).
+        """
+        ruta = os.path.join(os.path.dirname(__file__), '../resultados')
+        if not os.path.exists(ruta):
+            os.makedirs(ruta)
+        return os.path.join(ruta, f"{nombre_original}")
+
     def guardar_archivo(self, nombre_original, data):
         """Guarda datos cifrados en un archivo con extensión `.aes`.
 
@@ -68,41 +168,298 @@ class Decodificador:
         :param nombre_original: Nombre del archivo original (str).
         :param data: Datos cifrados a guardar (bytes).
         """
-        ruta = os.path.join(os.path.dirname(__file__), '../resultados')
-        cifrado = os.path.join(ruta, f"{nombre_original}") 
-
-        if not os.path.exists(ruta):
-            os.makedirs(ruta)
-    
-        with open(cifrado, 'wb') as archivo:
+        with open(self.ruta_resultado(nombre_original), 'wb') as archivo:
             archivo.write(data)
  
-    def descifrar_archivo(self, archivo_cifrado, archivo_frg):
+    def descifrar_archivo(self, archivo_cifrado, archivo_frg, trabajadores=None, robusto=False, publicar=True):
         """
-        Descifra un archivo cifrado utilizando AES en modo CBC.
+        Descifra un archivo cifrado utilizando AES en modo GCM o CBC, según su cabecera.
+
+        Acepta tanto los archivos con `Cabecera` binaria versionada como los del formato
+        anterior, formados por el IV seguido de un objeto `Archivo` serializado con pickle. Los
+        primeros se descifran en flujo, bloque a bloque, con memoria acotada.
 
         Args:
             archivo_cifrado (str): Nombre del archivo cifrado.
-            password (str): Contraseña utilizada para generar la clave de descifrado.
+            archivo_frg (str): Nombre del archivo de fragmentos.
+            trabajadores (int, optional): Hilos para descifrar AES-GCM. Por defecto, el número de núcleos.
+            robusto (bool): Si es True, reconstruye con `reconstruir_secreto_robusto`, tolerando
+                fragmentos alterados.
+            publicar (bool): Si es False, el resultado se deja en el archivo temporal para que quien
+                llama lo renombre, por ejemplo tras revisar que no choca con otro del mismo lote.
+        Returns:
+            Tuple[str, str]: Ruta donde quedó el texto claro (la final, o la temporal si `publicar`
+            es False) y ruta final que le corresponde en 'resultados'.
         Raises:
             Exception: Si el archivo no existe o si hay problemas durante el descifrado.
         """
-        secreto = self.reconstruir_secreto(archivo_frg)
-        datos_cifrados = self.leer_archivo(archivo_cifrado)
+        with self.cronometro.etapa("reconstruir_secreto"):
+            if robusto:
+                secreto, _ = self.reconstruir_secreto_robusto(archivo_frg)
+            else:
+                secreto = self.reconstruir_secreto(archivo_frg)
         clave = secreto.to_bytes(32, byteorder='big')
 
+        ruta = os.path.join(os.path.dirname(__file__), '../docs', archivo_cifrado)
+        if not os.path.exists(ruta):
+            raise FileNotFoundError(f"El archivo '{archivo_cifrado}' no existe.")
+        with open(ruta, 'rb') as origen:
+            if origen.read(len(MAGIA)) == MAGIA:
+                origen.seek(0)
+                return self.descifrar_flujo(clave, origen, trabajadores, publicar)
+
+        return self.descifrar_formato_pickle(clave, archivo_cifrado, publicar)
+
+    def descifrar_formato_pickle(self, clave, archivo_cifrado, publicar=True):
+        """
+        Descifra un archivo del formato anterior: IV seguido de un `Archivo` serializado con pickle.
+
+        Args:
+            clave (bytes): Clave AES de 32 bytes.
+            archivo_cifrado (str): Nombre del archivo cifrado.
+            publicar (bool): Si es False, el resultado se deja en un archivo temporal.
+        Returns:
+            Tuple[str, str]: Ruta donde quedó el texto claro y ruta final (ver `descifrar_archivo`).
+        """
+        import pickle
+
+        with self.cronometro.etapa("lectura"):
+            datos_cifrados = self.leer_archivo(archivo_cifrado)
         iv = datos_cifrados[:16]
-        datos_cifrados_puros = datos_cifrados[16:]
+        with self.cronometro.etapa("aes"):
+            datos_descifrados = self._descifrar_cbc(clave, iv, datos_cifrados[16:])
+        # Deserializar el objeto Archivo
+        with self.cronometro.etapa("pickle"):
+            objeto_archivo = pickle.loads(datos_descifrados)
+
+        # Guardar el archivo original
+        with self.cronometro.etapa("escritura"):
+            descriptor, temporal = self._crear_temporal()
+            try:
+                with os.fdopen(descriptor, 'wb') as salida:
+                    salida.write(objeto_archivo.get_archivo())
+                return self._terminar(temporal, objeto_archivo.get_nombre(), publicar)
+            except BaseException:
+                if os.path.exists(temporal):
+                    os.remove(temporal)
+                raise
+
+    def _crear_temporal(self):
+        """
+        Crea en 'resultados' un archivo temporal con nombre único para escribir el texto claro.
+
+        Cada descifrado usa su propio temporal, así que dos descifrados simultáneos nunca
+        escriben en el mismo archivo aunque su resultado tenga el mismo nombre.
+
+        Returns:
+            Tuple[int, str]: Descriptor abierto y ruta del temporal.
+        """
+        return tempfile.mkstemp(suffix=".parcial", dir=self.ruta_resultado(""))
+
+    def _terminar(self, temporal, nombre, publicar):
+        """
+        Calcula la ruta final del resultado y, si se pide, renombra el temporal a ella.
+
+        Args:
+            temporal (str): Archivo temporal con el texto claro.
+            nombre (str): Nombre del archivo original registrado en el archivo cifrado.
+            publicar (bool): Si es True, renombra el temporal.
+        Returns:
+            Tuple[str, str]: Ruta donde quedó el texto claro y ruta final.
+        Raises:
+            ValueError: Si el nombre registrado no es un nombre de archivo válido.
+        """
+        # El nombre registrado no puede sacar el resultado de la carpeta `resultados`.
+        nombre = os.path.basename(nombre)
+        if nombre in ("", ".", ".."):
+            raise ValueError("El archivo cifrado no registra un nombre de archivo válido.")
+        destino = self.ruta_resultado(nombre)
+        if not publicar:
+            return temporal, destino
+        os.replace(temporal, destino)
+        return destino, destino
+
+    def descifrar_flujo(self, clave, origen, trabajadores=None, publicar=True):
+        """
+        Descifra en flujo un archivo con `Cabecera` y escribe el resultado bloque a bloque.
+
+        Antes de descifrar se compara la clave con el valor de verificación de la cabecera, de
+        modo que unos fragmentos equivocados se rechazan sin leer el contenido. Los bloques se
+        leen en un único búfer reutilizado y se pasan al descifrador como rebanadas de
+        `memoryview`, sin copias intermedias. El texto claro se escribe primero en
+        un archivo temporal único que solo se renombra al nombre original si el descifrado
+        termina sin errores y con la longitud registrada en la cabecera. Desde la versión 3 de la
+        cabecera el nombre original se obtiene de los primeros bytes descifrados.
+
+        Args:
+            clave (bytes): Clave AES de 32 bytes.
+            origen: Archivo cifrado abierto en modo binario, posicionado al inicio.
+            trabajadores (int, optional): Hilos para descifrar AES-GCM. Por defecto, el número de núcleos.
+            publicar (bool): Si es False, el resultado se deja en el archivo temporal.
+        Returns:
+            Tuple[str, str]: Ruta donde quedó el texto claro y ruta final (ver `descifrar_archivo`).
+        Raises:
+            ValueError: Si la clave no corresponde al archivo o si la cabecera, el relleno, alguna
+                etiqueta de autenticación o la longitud descifrada son inválidos.
+        """
+        cabecera = Cabecera.leer(origen)
+        with self.cronometro.etapa("verificacion"):
+            verifica_clave(cabecera, clave)
+        if cabecera.cifrado == CIFRADO_AES_GCM:
+            bloques = self._bloques_gcm(clave, cabecera, origen, trabajadores)
+        elif cabecera.cifrado == CIFRADO_AES_CBC:
+            bloques = self._bloques_cbc(clave, cabecera, origen)
+        else:
+            raise ValueError(f"El cifrado {cabecera.cifrado} del archivo no está soportado.")
+
+        if cabecera.nombre_cifrado:
+            bloques = self._separa_nombre(cabecera, bloques)
+
+        descriptor, temporal = self._crear_temporal()
+        cronometro = self.cronometro
+        try:
+            escritos = 0
+            with os.fdopen(descriptor, 'wb') as salida:
+                for claro in bloques:
+                    with cronometro.etapa("escritura"):
+                        escritos += salida.write(claro)
+            if escritos != cabecera.longitud:
+                raise ValueError("La longitud descifrada no coincide con la registrada en la cabecera.")
+            return self._terminar(temporal, cabecera.nombre, publicar)
+        except BaseException:
+            if os.path.exists(temporal):
+                os.remove(temporal)
+            raise
+
+    def _separa_nombre(self, cabecera, bloques):
+        """
+        Retira del texto claro el nombre del archivo original y lo guarda en la cabecera.
+
+        Args:
+            cabecera (Cabecera): Cabecera de la versión 3 o posterior; se le asigna `nombre`.
+            bloques: Generador de bloques de texto claro que comienza con el nombre.
+        Returns:
+            Generador de bloques con solo el contenido.
+        Raises:
+            ValueError: Si el texto claro termina antes del nombre o este no es UTF-8 válido.
+        """
+        nombre = bytearray()
+        for claro in bloques:
+            faltan = cabecera.largo_nombre - len(nombre)
+            if faltan:
+                nombre += claro[:faltan]
+                claro = claro[faltan:]
+            if claro:
+                yield claro
+        if len(nombre) < cabecera.largo_nombre:
+            raise ValueError("El archivo cifrado está truncado: falta el nombre del archivo original.")
+        try:
+            cabecera.nombre = nombre.decode('utf-8')
+        except UnicodeDecodeError:
+            raise ValueError("El nombre cifrado del archivo original no es válido.")
+
+    def _bloques_cbc(self, clave, cabecera, origen):
+        """
+        Descifra en flujo el contenido AES-CBC con relleno PKCS7.
+
+        Args:
+            clave (bytes): Clave AES de 32 bytes.
+            cabecera (Cabecera): Cabecera ya leída, con el IV.
+            origen: Archivo cifrado posicionado al inicio del texto cifrado.
+        Returns:
+            Generador de bloques de texto claro.
+        """
+        # `cryptography` se importa hasta que se necesita para no penalizar el arranque.
+        from cryptography.hazmat.primitives import padding as padding_lib
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+        from cryptography.hazmat.backends import default_backend
+
+        descifrar = Cipher(algorithms.AES(clave), modes.CBC(cabecera.iv), backend=default_backend())
+        decryptor = descifrar.decryptor()
+        unpadder = padding_lib.PKCS7(algorithms.AES.block_size).unpadder()
+
+        bufer = bytearray(cabecera.tamano_bloque)
+        vista = memoryview(bufer)
+        cronometro = self.cronometro
+        while True:
+            with cronometro.etapa("lectura"):
+                leidos = origen.readinto(bufer)
+            if not leidos:
+                break
+            with cronometro.etapa("aes"):
+                claro = unpadder.update(decryptor.update(vista[:leidos]))
+            yield claro
+        with cronometro.etapa("aes"):
+            claro = unpadder.update(decryptor.finalize()) + unpadder.finalize()
+        yield claro
+
+    def _bloques_gcm(self, clave, cabecera, origen, trabajadores=None):
+        """
+        Descifra y autentica en flujo el contenido AES-GCM, bloque por bloque.
+
+        El número de bloques se deduce de la longitud registrada en la cabecera, que también está
+        autenticada. Ningún bloque se entrega antes de verificar su etiqueta, de modo que una
+        clave incorrecta se detecta en el primero. Los bloques se descifran en paralelo con
+        `EjecutorOrdenado`; cada tarea pendiente usa su propio búfer de un anillo que se reutiliza.
+
+        Args:
+            clave (bytes): Clave AES de 32 bytes.
+            cabecera (Cabecera): Cabecera ya leída, con la sal de la clave del archivo.
+            origen: Archivo cifrado posicionado al inicio del texto cifrado.
+            trabajadores (int, optional): Número de hilos. Por defecto, el número de núcleos.
+        Returns:
+            Generador de bloques de texto claro.
+        Raises:
+            ValueError: Si alguna etiqueta no coincide o sobran datos al final del archivo.
+        """
+        from cryptography.exceptions import InvalidTag
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+        clave, prefijo = clave_gcm(clave, cabecera)
+        aesgcm = AESGCM(clave)
+        datos_asociados = cabecera.a_bytes()
+        total = max(1, -(-cabecera.longitud_flujo // cabecera.tamano_bloque))
+
+        def descifra_bloque(indice, datos):
+            try:
+                return aesgcm.decrypt(nonce_bloque(prefijo, indice, indice == total - 1), datos, datos_asociados)
+            except InvalidTag:
+                raise ValueError(f"La clave es incorrecta o el archivo cifrado está dañado (bloque {indice}).")
+
+        cronometro = self.cronometro
+        with EjecutorOrdenado(descifra_bloque, trabajadores) as ejecutor:
+            bufers = [bytearray(cabecera.tamano_bloque + TAMANO_ETIQUETA)
+                      for _ in range(min(ejecutor.max_en_vuelo, total))]
+            for indice in range(total):
+                bufer = bufers[indice % len(bufers)]
+                with cronometro.etapa("lectura"):
+                    leidos = origen.readinto(bufer)
+                ejecutor.agrega(indice, memoryview(bufer)[:leidos])
+                with cronometro.etapa("aes"):
+                    claros = ejecutor.extrae(todas=indice == total - 1)
+                yield from claros
+        if origen.read(1):
+            raise ValueError("El archivo cifrado tiene datos después del último bloque.")
+
+    def _descifrar_cbc(self, clave, iv, datos):
+        """
+        Descifra datos con AES en modo CBC y retira el relleno PKCS7.
+
+        Args:
+            clave (bytes): Clave AES de 32 bytes.
+            iv (bytes): Vector de inicialización.
+            datos (bytes): Texto cifrado.
+        Returns:
+            bytes: Texto claro sin relleno.
+        """
+        from cryptography.hazmat.primitives import padding as padding_lib
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+        from cryptography.hazmat.backends import default_backend
 
         descifrar = Cipher(algorithms.AES(clave), modes.CBC(iv), backend=default_backend())
         decryptor = descifrar.decryptor()
-        datos_padded = decryptor.update(datos_cifrados_puros) + decryptor.finalize()
+        datos_padded = decryptor.update(datos) + decryptor.finalize()
 
         unpadder = padding_lib.PKCS7(algorithms.AES.block_size).unpadder()
-        datos_descifrados = unpadder.update(datos_padded) + unpadder.finalize()
-        # Deserializar el objeto Archivo
-        objeto_archivo = pickle.loads(datos_descifrados)
-
-        # Guardar el archivo original
-        self.guardar_archivo(objeto_archivo.get_nombre(), objeto_archivo.get_archivo())
+        return unpadder.update(datos_padded) + unpadder.finalize()
 
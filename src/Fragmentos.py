@@ -0,0 +1,302 @@
+import struct
+import zlib
+from itertools import chain
+
+# Identifica los archivos `.frg` binarios; los de texto comienzan con "(".
+MAGIA = b"SSSF"
+
+# Versión del formato binario que se escribe. La versión 1 no registraba el umbral.
+VERSION = 2
+
+# Magia y versión, comunes a todas las versiones.
+_INICIO = struct.Struct(">4sB")
+# Resto de la cabecera por versión: ancho en bytes de las ordenadas, umbral y número de fragmentos.
+_RESTO_CABECERA = {1: struct.Struct(">BI"), 2: struct.Struct(">BII")}
+_CRC = struct.Struct(">I")
+
+# Bytes máximos de un varint de `x`; un varint más largo indica un archivo dañado.
+_MAX_VARINT = 10
+
+
+def codifica_varint(valor):
+    """
+    Codifica un entero no negativo como varint (LEB128 sin signo).
+
+    Args:
+        valor (int): Entero a codificar.
+
+    Returns:
+        bytes: Siete bits por byte, con el bit alto indicando que siguen más bytes.
+
+    Raises:
+        ValueError: Si `valor` es negativo o necesita más de `_MAX_VARINT` bytes.
+    """
+    if valor < 0:
+        raise ValueError("Solo se pueden codificar enteros no negativos.")
+    if valor >> (7 * _MAX_VARINT):
+        raise ValueError(f"El valor {valor} no cabe en un varint de {_MAX_VARINT} bytes.")
+    salida = bytearray()
+    while valor >= 0x80:
+        salida.append((valor & 0x7F) | 0x80)
+        valor >>= 7
+    salida.append(valor)
+    return bytes(salida)
+
+
+def decodifica_varint(datos, posicion):
+    """
+    Decodifica un varint a partir de `posicion`.
+
+    Args:
+        datos (bytes-like): Búfer con el varint.
+        posicion (int): Índice del primer byte.
+
+    Returns:
+        Tuple[int, int]: El valor y la posición siguiente al varint.
+
+    Raises:
+        ValueError: Si el varint está truncado o tiene más de `_MAX_VARINT` bytes.
+    """
+    valor = 0
+    desplazamiento = 0
+    for _ in range(_MAX_VARINT):
+        if posicion >= len(datos):
+            raise ValueError("El archivo de fragmentos está truncado.")
+        byte = datos[posicion]
+        posicion += 1
+        valor |= (byte & 0x7F) << desplazamiento
+        if byte < 0x80:
+            return valor, posicion
+        desplazamiento += 7
+    raise ValueError(f"Un varint del archivo de fragmentos tiene más de {_MAX_VARINT} bytes.")
+
+
+def codifica_fragmentos(puntos, umbral=0):
+    """
+    Codifica una lista de puntos en el formato binario de `.frg`.
+
+    El formato es una cabecera (magia, versión, ancho de las ordenadas, umbral y número de
+    puntos) seguida de un registro por punto: `x` como varint, `y` en big-endian con el ancho fijo
+    de la cabecera y un CRC32 del registro.
+
+    Args:
+        puntos (List[Tuple[int, int]]): Puntos (x, y) con coordenadas no negativas.
+        umbral (int): Número de fragmentos necesarios para reconstruir; 0 si se desconoce.
+
+    Returns:
+        bytes: Contenido del archivo de fragmentos.
+
+    Raises:
+        ValueError: Si alguna coordenada es negativa.
+    """
+    if any(y < 0 for _, y in puntos):
+        raise ValueError("Las ordenadas de los fragmentos no pueden ser negativas.")
+    ancho = max([(y.bit_length() + 7) // 8 for _, y in puntos] + [1])
+    if ancho > 0xFF:
+        raise ValueError("Las ordenadas de los fragmentos son demasiado grandes para el formato binario.")
+
+    partes = [_INICIO.pack(MAGIA, VERSION) + _RESTO_CABECERA[VERSION].pack(ancho, umbral, len(puntos))]
+    agrega = partes.append
+    crc32 = zlib.crc32
+    for x, y in puntos:
+        registro = codifica_varint(x) + y.to_bytes(ancho, 'big')
+        agrega(registro)
+        agrega(crc32(registro).to_bytes(4, 'big'))
+    return b"".join(partes)
+
+
+def decodifica_fragmentos(datos):
+    """
+    Decodifica el contenido binario de un `.frg`.
+
+    Args:
+        datos (bytes): Contenido del archivo.
+
+    Returns:
+        List[Tuple[int, int]]: Puntos (x, y).
+
+    Raises:
+        ValueError: Si la cabecera es inválida, el archivo está truncado o un CRC no coincide.
+    """
+    _, ancho, _, cantidad, posicion = _decodifica_cabecera(datos[:_INICIO.size], datos[_INICIO.size:])
+
+    puntos = []
+    total = len(datos)
+    crc32 = zlib.crc32
+    desde_bytes = int.from_bytes
+    for _ in range(cantidad):
+        inicio = posicion
+        x, posicion = decodifica_varint(datos, posicion)
+        fin = posicion + ancho
+        siguiente = fin + _CRC.size
+        if siguiente > total:
+            raise ValueError("El archivo de fragmentos está truncado.")
+        if crc32(datos[inicio:fin]) != desde_bytes(datos[fin:siguiente], 'big'):
+            raise ValueError(f"El fragmento con x={x} está dañado (CRC inválido).")
+        puntos.append((x, desde_bytes(datos[posicion:fin], 'big')))
+        posicion = siguiente
+    return puntos
+
+
+def _decodifica_cabecera(inicio, resto):
+    """
+    Interpreta la cabecera binaria a partir de sus primeros bytes.
+
+    Args:
+        inicio (bytes): Magia y versión.
+        resto (bytes): Bytes siguientes; basta con que contengan el resto de la cabecera.
+
+    Returns:
+        Tuple[int, int, int, int, int]: Versión, ancho, umbral (0 si se desconoce), número de
+        fragmentos y tamaño total de la cabecera.
+
+    Raises:
+        ValueError: Si la cabecera es inválida, está truncada o su versión no está soportada.
+    """
+    if len(inicio) < _INICIO.size:
+        raise ValueError("El archivo de fragmentos está truncado.")
+    magia, version = _INICIO.unpack(inicio)
+    if magia != MAGIA:
+        raise ValueError("El archivo no tiene una cabecera de fragmentos válida.")
+    if version not in _RESTO_CABECERA:
+        raise ValueError(f"La versión {version} del formato de fragmentos no está soportada.")
+    estructura = _RESTO_CABECERA[version]
+    if len(resto) < estructura.size:
+        raise ValueError("El archivo de fragmentos está truncado.")
+    if version == 1:
+        ancho, cantidad = estructura.unpack_from(resto)
+        umbral = 0
+    else:
+        ancho, umbral, cantidad = estructura.unpack_from(resto)
+    return version, ancho, umbral, cantidad, _INICIO.size + estructura.size
+
+
+class LectorFragmentos:
+    """
+    Lee los fragmentos de un `.frg` en flujo, uno a la vez y solo conforme se piden.
+
+    Acepta el formato binario y el de texto. Al construirse lee únicamente la cabecera, de modo
+    que quien itera puede detenerse en cuanto tenga suficientes fragmentos sin leer ni
+    interpretar el resto del archivo.
+
+    Attributes:
+        umbral (int): Fragmentos necesarios para reconstruir, o None si el archivo no lo registra.
+        cantidad (int): Fragmentos en el archivo, o None en el formato de texto.
+    """
+
+    def __init__(self, flujo, tamano_lectura=64 * 1024):
+        """
+        Inicializa el lector leyendo la cabecera.
+
+        Args:
+            flujo: Archivo abierto en modo binario, posicionado al inicio.
+            tamano_lectura (int): Bytes que se leen del flujo cada vez.
+
+        Raises:
+            ValueError: Si la cabecera binaria es inválida.
+        """
+        self._flujo = flujo
+        self._tamano_lectura = tamano_lectura
+        inicio = flujo.read(_INICIO.size)
+        self._binario = inicio[:len(MAGIA)] == MAGIA
+        if self._binario:
+            resto = flujo.read(max(estructura.size for estructura in _RESTO_CABECERA.values()))
+            _, self._ancho, umbral, self.cantidad, tamano = _decodifica_cabecera(inicio, resto)
+            self._pendiente = resto[tamano - _INICIO.size:]
+            self.umbral = umbral or None
+        else:
+            self._pendiente = inicio
+            self.umbral = None
+            self.cantidad = None
+
+    def __iter__(self):
+        """
+        Recorre los fragmentos del archivo.
+
+        Returns:
+            Generador de tuplas (x, y, integro); `integro` es False si el CRC del registro no
+            coincide o si la línea de texto no se pudo interpretar.
+        """
+        return self._itera_binario() if self._binario else self._itera_texto()
+
+    def _itera_texto(self):
+        """Recorre las líneas `(x,y)` del formato de texto."""
+        primera = self._pendiente + self._flujo.readline()
+        for linea in chain([primera], self._flujo):
+            linea = linea.strip()
+            if not linea:
+                continue
+            try:
+                x, y = map(int, linea.strip(b'()').split(b','))
+            except ValueError:
+                yield None, None, False
+                continue
+            yield x, y, True
+
+    def _itera_binario(self):
+        """Recorre los registros del formato binario, leyendo el flujo por bloques."""
+        bufer = self._pendiente
+        posicion = 0
+        registro_maximo = _MAX_VARINT + self._ancho + _CRC.size
+        fin_de_archivo = False
+        for _ in range(self.cantidad):
+            if len(bufer) - posicion < registro_maximo and not fin_de_archivo:
+                leido = self._flujo.read(self._tamano_lectura)
+                fin_de_archivo = not leido
+                bufer = bufer[posicion:] + leido
+                posicion = 0
+            inicio = posicion
+            x, posicion = decodifica_varint(bufer, posicion)
+            fin = posicion + self._ancho
+            siguiente = fin + _CRC.size
+            if siguiente > len(bufer):
+                raise ValueError("El archivo de fragmentos está truncado.")
+            integro = zlib.crc32(bufer[inicio:fin]) == int.from_bytes(bufer[fin:siguiente], 'big')
+            yield x, int.from_bytes(bufer[posicion:fin], 'big'), integro
+            posicion = siguiente
+
+
+def codifica_texto(puntos):
+    """
+    Codifica los puntos en el formato de texto original, un `(x,y)` decimal por línea.
+
+    Args:
+        puntos (List[Tuple[int, int]]): Puntos (x, y).
+
+    Returns:
+        str: Contenido del archivo de fragmentos.
+    """
+    return "".join(f"({x},{y})\n" for x, y in puntos)
+
+
+def decodifica_texto(texto):
+    """
+    Decodifica el formato de texto original de `.frg`.
+
+    Args:
+        texto (str): Contenido del archivo, un `(x,y)` por línea.
+
+    Returns:
+        List[Tuple[int, int]]: Puntos (x, y).
+    """
+    puntos = []
+    for linea in texto.splitlines():
+        if linea.strip():
+            x, y = map(int, linea.strip().strip('()').split(','))
+            puntos.append((x, y))
+    return puntos
+
+
+def decodifica(datos):
+    """
+    Decodifica un `.frg` en cualquiera de los dos formatos, según su magia.
+
+    Args:
+        datos (bytes): Contenido del archivo.
+
+    Returns:
+        List[Tuple[int, int]]: Puntos (x, y).
+    """
+    if datos[:len(MAGIA)] == MAGIA:
+        return decodifica_fragmentos(datos)
+    return decodifica_texto(datos.decode('ascii'))
@@ -1,13 +1,6 @@
-from .Polinomio import Polinomio
-from .Codificador import Codificador
-from .Lagrange import Lagrange
-from .Decodificador import Decodificador
 import os
 import re
 
-
-import os
-
 def verifica_archivo(ruta):
     """
     Verifica si el archivo existe en la carpeta 'docs' o, si no lo encuentra, en la carpeta 'src/resultados'.
@@ -190,7 +183,7 @@ def validar_tamano(entrada):
     if not (5 < longitud < 32):
         raise ValueError(f"La longitud de la contraseña debe estar entre 6 y 31 caracteres. Longitud actual: {longitud}")
 
-def gestiona_C(datos):
+def gestiona_C(datos, cronometro=None, hilos=None):
     """
     Realiza la gestión de codificación utilizando el esquema de Shamir.
 
@@ -201,19 +194,31 @@ def gestiona_C(datos):
             - datos[2] (int): Número mínimo de puntos requeridos (t).
             - datos[3] (str): Nombre del archivo a cifrar.
             - datos[4] (str): Contraseña para cifrar el archivo.
+        cronometro (Cronometro, optional): Si se da, registra el tiempo de cada etapa.
+        hilos (int, optional): Hilos para el cifrado AES-GCM por bloques. Por defecto, el número de núcleos.
     """
     nombre = datos[0]
     n = int(datos[1])
     t = int(datos[2])
     archivo = datos[3]
     contrasena = datos[4]
-    cd = Codificador()
-    cd.cifrar_archivo(archivo, nombre, contrasena)
-    pol = cd.shamir_generar_polinomio(t)
-    puntos = cd.shamir_generar_puntos(pol,n)
-    cd.guardar_fragmentos(puntos)
-
-def gestiona_D(datos):
+    # Los módulos de cifrado se importan hasta usarse para que validar argumentos sea barato.
+    from .Codificador import Codificador
+    from .Cronometro import Cronometro
+
+    cronometro = cronometro or Cronometro(activo=False)
+    with cronometro.etapa("gestiona_C"):
+        cd = Codificador(cronometro)
+        with cronometro.etapa("cifrar_archivo"):
+            cd.cifrar_archivo(archivo, nombre, contrasena, trabajadores=hilos)
+        with cronometro.etapa("polinomio"):
+            pol = cd.shamir_generar_polinomio(t)
+        with cronometro.etapa("puntos"):
+            puntos = cd.shamir_generar_puntos(pol,n)
+        with cronometro.etapa("guardar_fragmentos"):
+            cd.guardar_fragmentos(puntos, umbral=t)
+
+def gestiona_D(datos, cronometro=None, hilos=None, robusto=False, publicar=True):
     """
     Realiza la gestión de decodificación de un archivo cifrado.
 
@@ -221,12 +226,320 @@ def gestiona_D(datos):
         datos (list): Lista que contiene:
             - datos[0] (str): Nombre del archivo cifrado.
             - datos[1] (list): Lista de puntos de evaluación para descifrar.
+        cronometro (Cronometro, optional): Si se da, registra el tiempo de cada etapa.
+        hilos (int, optional): Hilos para el descifrado AES-GCM por bloques. Por defecto, el número de núcleos.
+        robusto (bool): Si es True, tolera fragmentos alterados al reconstruir la clave.
+        publicar (bool): Si es False, el resultado queda en un archivo temporal (ver
+            `Decodificador.descifrar_archivo`).
+
+    Returns:
+        Tuple[str, str]: Ruta donde quedó el archivo descifrado y ruta final que le corresponde.
     """
     cifrado = datos[0]
     evalua = datos[1]
-    dc = Decodificador()
-    dc.descifrar_archivo(cifrado, evalua)
+    from .Decodificador import Decodificador
+    from .Cronometro import Cronometro
+
+    cronometro = cronometro or Cronometro(activo=False)
+    with cronometro.etapa("gestiona_D"):
+        dc = Decodificador(cronometro)
+        with cronometro.etapa("descifrar_archivo"):
+            return dc.descifrar_archivo(cifrado, evalua, trabajadores=hilos, robusto=robusto, publicar=publicar)
+
+
+def ruta_docs(ruta):
+    """
+    Resuelve una ruta relativa a la carpeta 'docs'. Las rutas absolutas se dejan igual.
+
+    Args:
+        ruta (str): Ruta a resolver.
+
+    Returns:
+        str: Ruta resuelta.
+    """
+    return os.path.join(os.path.dirname(__file__), '../docs', ruta)
+
+
+def nombre_desde_archivo(archivo, usados):
+    """
+    Deriva un nombre válido para `nombreCorrecto` a partir del nombre de un archivo.
+
+    Sustituye los caracteres no permitidos por guiones bajos, recorta a 25 caracteres y agrega
+    un sufijo numérico si el nombre ya fue usado en el mismo lote.
+
+    Args:
+        archivo (str): Ruta o nombre del archivo original.
+        usados (set): Nombres ya asignados en el lote; se actualiza con el nombre devuelto.
+
+    Returns:
+        str: Nombre para el archivo cifrado y el de fragmentos, sin extensión.
+    """
+    base = re.sub(r"[^a-zA-Z0-9_-]", "_", os.path.splitext(os.path.basename(archivo))[0])
+    base = base.lstrip("-")[:25] or "archivo"
+    nombre = base
+    contador = 2
+    while nombre in usados:
+        sufijo = f"_{contador}"
+        nombre = base[:25 - len(sufijo)] + sufijo
+        contador += 1
+    usados.add(nombre)
+    return nombre
+
+
+def listar_lote(origen):
+    """
+    Obtiene los archivos de un lote a partir de un directorio o de un manifiesto.
+
+    Un directorio aporta todos sus archivos regulares (sin recorrer subdirectorios). Un
+    manifiesto es un archivo de texto con una entrada por línea de la forma `archivo` o
+    `archivo,nombre`; las líneas vacías y las que empiezan con `#` se ignoran. Las rutas
+    relativas se resuelven dentro de la carpeta 'docs'.
+
+    Args:
+        origen (str): Directorio o manifiesto.
+
+    Returns:
+        List[Tuple[str, str]]: Pares (ruta del archivo, nombre de salida).
+
+    Raises:
+        FileNotFoundError: Si `origen` no existe.
+    """
+    ruta = ruta_docs(origen)
+    usados = set()
+    if os.path.isdir(ruta):
+        with os.scandir(ruta) as entradas:
+            archivos = sorted(entrada.path for entrada in entradas if entrada.is_file())
+        return [(archivo, nombre_desde_archivo(archivo, usados)) for archivo in archivos]
+    if not os.path.isfile(ruta):
+        raise FileNotFoundError(f"El directorio o manifiesto {origen} no fue encontrado dentro de la ruta: '../docs'.")
+
+    lote = []
+    with open(ruta, 'r', encoding='utf-8') as manifiesto:
+        for linea in manifiesto:
+            linea = linea.strip()
+            if not linea or linea.startswith("#"):
+                continue
+            archivo, _, nombre = (parte.strip() for parte in linea.partition(","))
+            if nombre:
+                usados.add(nombre)
+            lote.append((ruta_docs(archivo), nombre))
+    return [(archivo, nombre or nombre_desde_archivo(archivo, usados)) for archivo, nombre in lote]
+
+
+def ejecutar_lote(funcion, tareas, trabajadores=None, max_en_vuelo=None):
+    """
+    Ejecuta `funcion` sobre cada tarea en un grupo de procesos, con un máximo de tareas en vuelo.
+
+    Solo se envían al grupo `max_en_vuelo` tareas a la vez, de modo que la memoria usada no
+    crece con el tamaño del lote. Con un solo trabajador las tareas se ejecutan en el proceso
+    actual.
+
+    Args:
+        funcion (callable): Función de nivel de módulo que recibe una tarea y devuelve un resultado.
+        tareas (iterable): Tareas a procesar.
+        trabajadores (int, optional): Número de procesos. Por defecto, el número de núcleos.
+        max_en_vuelo (int, optional): Tareas enviadas simultáneamente. Por defecto, el doble de trabajadores.
+
+    Returns:
+        list: Resultados en el mismo orden que las tareas.
+
+    Raises:
+        ValueError: Si `trabajadores` o `max_en_vuelo` no son positivos.
+    """
+    trabajadores = trabajadores or os.cpu_count() or 1
+    max_en_vuelo = max_en_vuelo or 2 * trabajadores
+    if trabajadores < 1 or max_en_vuelo < 1:
+        raise ValueError("El número de trabajadores y de tareas en vuelo debe ser positivo.")
+    tareas = list(tareas)
+    if trabajadores == 1:
+        return [funcion(tarea) for tarea in tareas]
+    from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+    resultados = [None] * len(tareas)
+    pendientes = {}
+    siguiente = 0
+    with ProcessPoolExecutor(max_workers=trabajadores) as grupo:
+        while siguiente < len(tareas) or pendientes:
+            while siguiente < len(tareas) and len(pendientes) < max_en_vuelo:
+                pendientes[grupo.submit(funcion, tareas[siguiente])] = siguiente
+                siguiente += 1
+            terminadas, _ = wait(pendientes, return_when=FIRST_COMPLETED)
+            for futuro in terminadas:
+                resultados[pendientes.pop(futuro)] = futuro.result()
+    return resultados
+
+
+def resumen_lote(resultados):
+    """
+    Resume los resultados de un lote.
+
+    Args:
+        resultados (list): Diccionarios con la llave `exito`.
 
+    Returns:
+        dict: Número de éxitos y fallos, junto con los resultados individuales.
+    """
+    exitosos = sum(1 for resultado in resultados if resultado["exito"])
+    return {"exitosos": exitosos, "fallidos": len(resultados) - exitosos, "resultados": resultados}
 
 
+def _cifrar_en_lote(tarea):
+    """
+    Cifra un archivo del lote, capturando el error para reportarlo sin detener el resto.
 
+    Args:
+        tarea (tuple): (ruta del archivo, nombre de salida, n, t, contraseña).
+
+    Returns:
+        dict: Archivo, nombre, si tuvo éxito y el mensaje de error si lo hubo.
+    """
+    archivo, nombre, n, t, contrasena = tarea
+    try:
+        nombreCorrecto(nombre)
+        # Cada proceso del lote ya ocupa un núcleo, así que cada archivo se cifra con un hilo.
+        gestiona_C([nombre, n, t, archivo, contrasena], hilos=1)
+    except Exception as e:
+        return {"archivo": archivo, "nombre": nombre, "exito": False, "error": str(e)}
+    return {"archivo": archivo, "nombre": nombre, "exito": True, "error": None}
+
+
+def gestiona_C_lote(origen, n, t, contrasena, trabajadores=None):
+    """
+    Cifra en paralelo todos los archivos de un directorio o manifiesto.
+
+    Cada archivo produce su propio `.aes` y `.frg` en la carpeta 'resultados'. Un error en un
+    archivo se reporta en su resultado y no detiene el resto del lote. Si el manifiesto repite
+    un nombre explícito, solo se cifra la primera entrada con ese nombre y las demás se
+    reportan como fallidas, para que no sobrescriban su salida.
+
+    Args:
+        origen (str): Directorio o manifiesto (ver `listar_lote`).
+        n (int): Número de evaluaciones.
+        t (int): Número mínimo de puntos requeridos.
+        contrasena (str): Contraseña para cifrar los archivos.
+        trabajadores (int, optional): Número de procesos. Por defecto, el número de núcleos.
+
+    Returns:
+        dict: Resumen del lote (ver `resumen_lote`).
+
+    Raises:
+        ValueError: Si `n`, `t` o la contraseña no son válidos.
+    """
+    rangoValido(n, t)
+    validar_tamano(contrasena)
+    lote = listar_lote(origen)
+    resultados = [None] * len(lote)
+    tareas, posiciones, duenos = [], [], {}
+    for i, (archivo, nombre) in enumerate(lote):
+        if nombre in duenos:
+            resultados[i] = {"archivo": archivo, "nombre": nombre, "exito": False,
+                             "error": f"El nombre {nombre} ya se usó en el lote para: {duenos[nombre]}"}
+            continue
+        duenos[nombre] = archivo
+        tareas.append((archivo, nombre, int(n), int(t), contrasena))
+        posiciones.append(i)
+    for i, resultado in zip(posiciones, ejecutar_lote(_cifrar_en_lote, tareas, trabajadores)):
+        resultados[i] = resultado
+    return resumen_lote(resultados)
+
+
+def emparejar_lote(origen):
+    """
+    Empareja los archivos `.aes` de un directorio con el `.frg` del mismo nombre.
+
+    Args:
+        origen (str): Directorio, relativo a la carpeta 'docs' o absoluto.
+
+    Returns:
+        List[Tuple[str, str]]: Pares (archivo cifrado, archivo de fragmentos). Si un `.aes` no
+        tiene `.frg`, se incluye de todos modos para que su error quede en el resumen.
+
+    Raises:
+        FileNotFoundError: Si `origen` no es un directorio.
+    """
+    ruta = ruta_docs(origen)
+    if not os.path.isdir(ruta):
+        raise FileNotFoundError(f"El directorio {origen} no fue encontrado dentro de la ruta: '../docs'.")
+    with os.scandir(ruta) as entradas:
+        cifrados = sorted(entrada.path for entrada in entradas if entrada.is_file() and entrada.name.endswith('.aes'))
+    return [(cifrado, cifrado[:-len('.aes')] + '.frg') for cifrado in cifrados]
+
+
+def _descifrar_en_lote(tarea):
+    """
+    Descifra un par del lote, capturando el error para reportarlo sin detener el resto.
+
+    El resultado se deja en un archivo temporal; `gestiona_D_lote` lo renombra después de
+    revisar que ningún otro par del lote produce un archivo con el mismo nombre.
+
+    Args:
+        tarea (tuple): (archivo cifrado, archivo de fragmentos).
+
+    Returns:
+        dict: Archivos del par, si tuvo éxito, el mensaje de error si lo hubo y, si tuvo éxito,
+        el archivo temporal y el destino del resultado.
+    """
+    cifrado, fragmentos = tarea
+    try:
+        verificar_extension_aes(cifrado)
+        verificar_extension_frg(fragmentos)
+        verifica_archivo(cifrado)
+        verifica_archivo(fragmentos)
+        temporal, destino = gestiona_D([cifrado, fragmentos], hilos=1, publicar=False)
+    except Exception as e:
+        return {"cifrado": cifrado, "fragmentos": fragmentos, "exito": False, "error": str(e), "descifrado": None}
+    return {"cifrado": cifrado, "fragmentos": fragmentos, "exito": True, "error": None,
+            "temporal": temporal, "descifrado": destino}
+
+
+def _publicar_lote(resultados):
+    """
+    Renombra los resultados temporales de un lote a su destino, salvo los que chocan.
+
+    El nombre de cada resultado viene de su archivo cifrado, así que dos pares pueden
+    producir el mismo archivo (por ejemplo, `dir1/a.txt` y `dir2/a.txt` cifrados en un lote).
+    En ese caso ninguno se publica y todos se reportan como fallidos, en vez de que uno
+    sobrescriba al otro.
+
+    Args:
+        resultados (list): Resultados de `_descifrar_en_lote`; se actualizan en su lugar.
+    """
+    por_destino = {}
+    for resultado in resultados:
+        if resultado["exito"]:
+            por_destino.setdefault(resultado["descifrado"], []).append(resultado)
+    for destino, grupo in por_destino.items():
+        for resultado in grupo:
+            temporal = resultado.pop("temporal")
+            if len(grupo) == 1:
+                os.replace(temporal, destino)
+                continue
+            os.remove(temporal)
+            otros = ", ".join(otro["cifrado"] for otro in grupo if otro is not resultado)
+            resultado.update(exito=False, descifrado=None,
+                             error=f"El resultado {os.path.basename(destino)} choca con el de: {otros}")
+
+
+def gestiona_D_lote(pares, trabajadores=None, max_en_vuelo=None):
+    """
+    Reconstruye las claves y descifra en paralelo varios pares `.aes`/`.frg`.
+
+    Cada archivo se descifra en flujo y solo hay `max_en_vuelo` pares encolados a la vez, por
+    lo que la memoria usada queda acotada sin importar el tamaño del lote. Un error en un par se
+    reporta en su resultado y no detiene el resto. Los pares cuyo resultado tendría el mismo
+    nombre se reportan como fallidos y no se escribe ninguno (ver `_publicar_lote`).
+
+    Args:
+        pares (iterable | str): Pares (archivo cifrado, archivo de fragmentos), o un directorio
+            cuyos pares se obtienen con `emparejar_lote`.
+        trabajadores (int, optional): Número de procesos. Por defecto, el número de núcleos.
+        max_en_vuelo (int, optional): Pares enviados simultáneamente. Por defecto, el doble de trabajadores.
+
+    Returns:
+        dict: Resumen del lote (ver `resumen_lote`).
+    """
+    if isinstance(pares, str):
+        pares = emparejar_lote(pares)
+    resultados = ejecutar_lote(_descifrar_en_lote, pares, trabajadores, max_en_vuelo)
+    _publicar_lote(resultados)
+    return resumen_lote(resultados)
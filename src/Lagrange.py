@@ -1,20 +1,65 @@
-from .Polinomio import Monomio, Polinomio
+from functools import lru_cache
+from .Polinomio import Polinomio
+from .ArbolProductos import interpola
+from .Campo import inverso, inversos
+
+
+@lru_cache(maxsize=256)
+def _pesos_en_cero(xs, primo):
+    """
+    Calcula los pesos de Lagrange en cero, L_i(0), para un conjunto de abscisas.
+
+    El resultado se guarda en una caché LRU indexada por las abscisas ordenadas, de modo que
+    reconstruir varias veces con el mismo conjunto de fragmentos cuesta O(t).
+
+    Args:
+        xs (tuple): Abscisas ordenadas y sin repetir.
+        primo (int): Módulo del campo.
+
+    Returns:
+        tuple: Pesos L_i(0) en el mismo orden que `xs`.
+    """
+    t = len(xs)
+    sufijos = [1] * (t + 1)
+    for i in range(t - 1, -1, -1):
+        sufijos[i] = sufijos[i + 1] * xs[i] % primo
+
+    numeradores = []
+    prefijo = 1
+    for i in range(t):
+        numeradores.append(prefijo * sufijos[i + 1] % primo)
+        prefijo = prefijo * xs[i] % primo
+
+    denominadores = []
+    for i, xi in enumerate(xs):
+        denominador = 1
+        for j, xj in enumerate(xs):
+            if i != j:
+                denominador = denominador * (xj - xi) % primo
+        denominadores.append(denominador)
+
+    return tuple(n * d % primo for n, d in zip(numeradores, inversos(denominadores, primo)))
 
 
 class Lagrange:
     """
     Clase para construir y evaluar el polinomio de Lagrange.
 
+    Si se proporciona un primo, la interpolación se realiza de forma exacta en el campo GF(primo),
+    sustituyendo la división por la multiplicación por el inverso modular.
+
     Atributos:
         pares (list): Lista de pares ordenados (x, y).
+        primo (int): Módulo del campo, o `None` para aritmética real.
     """
 
-    def __init__(self, pares):
+    def __init__(self, pares, primo=None):
         """
         Inicializa el polinomio de Lagrange con una lista de pares ordenados.
 
         Args:
             pares (list): Lista de pares ordenados (x, y) utilizada para construir el polinomio de Lagrange.
+            primo (int, optional): Módulo del campo finito. Si es None se usa aritmética real.
 
         Precondición:
             - `pares` debe ser una lista de al menos dos pares (x, y).
@@ -28,6 +73,7 @@ class Lagrange:
         if len(pares) < 2:
             raise ValueError("Se necesitan al menos dos pares ordenados para construir el polinomio de Lagrange.")
         self.pares = pares
+        self.primo = primo
 
     def calcula_Li(self, i, x=None):
         """
@@ -48,16 +94,19 @@ class Lagrange:
             Polinomio o float: El polinomio base L_i o su valor evaluado en `x`.
         """
         xi, _ = self.pares[i]
-        numerador = [Monomio(1, 0)]
+        numerador = [1]
         denominador = 1
 
         for j, (xj, _) in enumerate(self.pares):
             if i != j:
-                termino = [Monomio(1, 1), Monomio(-xj, 0)]
-                numerador = self._multiplica_monomios(numerador, termino)
+                numerador = self._multiplica_lineal(numerador, xj)
                 denominador *= (xi - xj)
 
-        Li = Polinomio([Monomio(m.coef // denominador, m.exp) for m in numerador])
+        if self.primo is not None:
+            factor = inverso(denominador, self.primo)
+            Li = Polinomio.desde_coeficientes([coef * factor for coef in numerador], self.primo)
+        else:
+            Li = Polinomio.desde_coeficientes([coef / denominador for coef in numerador])
         return Li.evalua(x) if x is not None else Li
 
     def evalua(self, x):
@@ -76,15 +125,67 @@ class Lagrange:
         Returns:
             float: El valor del polinomio evaluado en `x`.
         """
+        if x == 0 and self.primo is not None:
+            return self.evalua_en_cero()
         resultado = 0
         for i, (_, yi) in enumerate(self.pares):
             resultado += yi * self.calcula_Li(i, x)
+        if self.primo is not None:
+            return resultado % self.primo
         return resultado
 
+    def evalua_en_cero(self):
+        """
+        Evalúa el polinomio de Lagrange en cero sin construir los polinomios base.
+
+        Usa los pesos L_i(0) = prod_{j != i} x_j / (x_j - x_i), calculados con una sola inversión
+        modular y guardados en caché por conjunto de abscisas. Es el camino usado para recuperar
+        el secreto de Shamir.
+
+        Precondición:
+            - El objeto debe haberse creado con un `primo`.
+            - Las abscisas de `pares` no deben repetirse.
+
+        Postcondición:
+            - Se retorna P(0) en el campo GF(primo).
+
+        Returns:
+            int: El valor del polinomio evaluado en cero.
+
+        Raises:
+            ValueError: Si no se definió un primo o si hay abscisas repetidas.
+        """
+        if self.primo is None:
+            raise ValueError("La evaluación rápida en cero requiere un campo finito.")
+        pares = sorted((x % self.primo, y) for x, y in self.pares)
+        xs = tuple(x for x, _ in pares)
+        if len(set(xs)) != len(xs):
+            raise ValueError("Las abscisas de los pares ordenados no pueden repetirse.")
+
+        pesos = _pesos_en_cero(xs, self.primo)
+        resultado = 0
+        for peso, (_, yi) in zip(pesos, pares):
+            resultado += peso * yi
+        return resultado % self.primo
+
+    @staticmethod
+    def limpia_cache():
+        """
+        Vacía la caché de pesos en cero que comparten todas las instancias.
+
+        Postcondición:
+            - La siguiente llamada a `evalua_en_cero` con cualquier conjunto de abscisas recalcula sus pesos.
+        """
+        _pesos_en_cero.cache_clear()
+
     def genera_polinomio(self):
         """
         Genera el polinomio completo de Lagrange como objeto Polinomio.
 
+        En modo campo finito usa la interpolación con árbol de subproductos de `ArbolProductos`,
+        en O(M(n) log n), para recuperar el polinomio de miles de puntos (por ejemplo, para
+        auditar o volver a repartir un secreto). Sin primo suma los polinomios base.
+
         Precondición:
             - La lista de pares ordenados debe estar inicializada.
 
@@ -94,34 +195,39 @@ class Lagrange:
         Returns:
             Polinomio: El polinomio de Lagrange completo.
         """
-        terminos = []
+        orden = range(len(self.pares) - 1, -1, -1)
+        if self.primo is not None:
+            return Polinomio.desde_coeficientes(interpola(self.pares, self.primo), self.primo, orden=orden)
+
+        coeficientes = [0] * len(self.pares)
         for i, (_, yi) in enumerate(self.pares):
             Li = self.calcula_Li(i)
-            terminos.extend([Monomio(m.coef * yi, m.exp) for m in Li.monomios])
+            for k, coef in enumerate(Li.coeficientes):
+                coeficientes[k] += coef * yi
 
-        return Polinomio(terminos)
+        return Polinomio.desde_coeficientes(coeficientes, orden=orden)
 
-    def _multiplica_monomios(self, m1, m2):
+    def _multiplica_lineal(self, coeficientes, raiz):
         """
-        Multiplica dos listas de monomios.
+        Multiplica un polinomio denso por el factor lineal (x - raiz).
 
         Args:
-            m1 (list): Lista de Monomios.
-            m2 (list): Lista de Monomios.
+            coeficientes (list): Coeficientes del polinomio, del término independiente en adelante.
+            raiz (int): Raíz del factor lineal.
 
         Precondición:
-            - `m1` y `m2` deben ser listas de objetos `Monomio`.
+            - `coeficientes` no está vacía.
 
         Postcondición:
-            - Se retorna una lista de monomios resultantes de la multiplicación de las dos listas.
+            - Se retorna una lista nueva con un coeficiente más; en modo campo finito, reducida módulo primo.
 
         Returns:
-            Polinomio: El polinomio resultante de la multiplicación de los monomios.
+            list: Coeficientes del producto.
         """
-        resultado = []
-        for monomio1 in m1:
-            for monomio2 in m2:
-                nuevo_monomio = Monomio(monomio1.coef * monomio2.coef, monomio1.exp + monomio2.exp)
-                resultado.append(nuevo_monomio)
-
-        return Polinomio(resultado).simplificar(resultado)
+        producto = [0] + coeficientes
+        for k, coef in enumerate(coeficientes):
+            producto[k] -= raiz * coef
+        if self.primo is not None:
+            primo = self.primo
+            producto = [coef % primo for coef in producto]
+        return producto
@@ -0,0 +1,81 @@
+import os
+from collections import deque
+
+
+class EjecutorOrdenado:
+    """
+    Ejecuta tareas en un grupo de hilos y entrega sus resultados en el orden en que se agregaron.
+
+    Sirve para cifrar o descifrar en paralelo los bloques independientes de un archivo y
+    escribirlos en orden. Solo hay `max_en_vuelo` tareas pendientes a la vez, de modo que la
+    memoria queda acotada sin importar el tamaño del archivo. Se usan hilos porque las llamadas
+    de `cryptography` a OpenSSL liberan el GIL y los bloques no tienen que copiarse a otro
+    proceso. Con un solo trabajador las tareas se ejecutan en el hilo que llama, sin grupo.
+
+    Attributes:
+        trabajadores (int): Número de hilos.
+        max_en_vuelo (int): Máximo de tareas pendientes.
+    """
+
+    def __init__(self, funcion, trabajadores=None, max_en_vuelo=None):
+        """
+        Inicializa el ejecutor.
+
+        Args:
+            funcion (callable): Función que procesa una tarea.
+            trabajadores (int, optional): Número de hilos. Por defecto, el número de núcleos.
+            max_en_vuelo (int, optional): Tareas pendientes simultáneas. Por defecto, el doble de trabajadores.
+
+        Raises:
+            ValueError: Si `trabajadores` o `max_en_vuelo` no son positivos.
+        """
+        self.trabajadores = trabajadores or os.cpu_count() or 1
+        self.max_en_vuelo = max_en_vuelo or (2 * self.trabajadores if self.trabajadores > 1 else 1)
+        if self.trabajadores < 1 or self.max_en_vuelo < 1:
+            raise ValueError("El número de trabajadores y de tareas en vuelo debe ser positivo.")
+        self._funcion = funcion
+        self._pendientes = deque()
+        self._grupo = None
+        if self.trabajadores > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            self._grupo = ThreadPoolExecutor(max_workers=self.trabajadores)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        if self._grupo is not None:
+            self._grupo.shutdown(wait=True, cancel_futures=True)
+        return False
+
+    def agrega(self, *argumentos):
+        """
+        Encola una tarea. Debe llamarse `extrae` después de cada tarea para acotar las pendientes.
+
+        Args:
+            *argumentos: Argumentos de la función para esta tarea.
+        """
+        if self._grupo is None:
+            self._pendientes.append(argumentos)
+        else:
+            self._pendientes.append(self._grupo.submit(self._funcion, *argumentos))
+
+    def extrae(self, todas=False):
+        """
+        Espera las tareas más antiguas hasta que haya lugar para una más.
+
+        Args:
+            todas (bool): Si es True, espera todas las tareas pendientes.
+
+        Returns:
+            list: Resultados de las tareas terminadas, en el orden en que se agregaron.
+
+        Raises:
+            Exception: La excepción de la primera tarea que haya fallado.
+        """
+        limite = 0 if todas else self.max_en_vuelo - 1
+        resultados = []
+        while len(self._pendientes) > limite:
+            pendiente = self._pendientes.popleft()
+            resultados.append(self._funcion(*pendiente) if self._grupo is None else pendiente.result())
+        return resultados
@@ -1,11 +1,19 @@
+from .ArbolProductos import evalua_consecutivos
+
+
 class Monomio:
     """Representa un monomio de variable x.
 
+    `Polinomio` ya no guarda sus términos como monomios; los construye al pedirlos, para
+    mostrarlos o por compatibilidad.
+
     Attributes:
         coef (float): El coeficiente del monomio.
         exp (int): El exponente del monomio.
     """
 
+    __slots__ = ("coef", "exp")
+
     def __init__(self, coef, exp):
         """Inicializa el objeto Monomio.
 
@@ -166,29 +174,98 @@ class Monomio:
 
 
 class Polinomio:
-    """Representa un polinomio como una lista de monomios.
+    """Representa un polinomio con una lista densa de coeficientes.
+
+    `coeficientes[i]` es el coeficiente de `x^(menor + i)`; `menor` solo es distinto de cero
+    si hay exponentes negativos. Guardar enteros en una lista en lugar de un objeto `Monomio`
+    por término reduce la memoria y las asignaciones de cada operación, y permite evaluar con
+    Horner. Los monomios se construyen solo al pedirlos (`monomios`, `__str__`), en el orden
+    en que aparecieron sus exponentes.
+
+    Si se proporciona un primo, el polinomio vive en el campo GF(primo): los coeficientes se
+    reducen módulo primo y toda evaluación devuelve un residuo de ancho fijo.
 
     Attributes:
-        list_monomios (List): Lista de monomios que forman el polinomio.
+        coeficientes (List): Coeficientes, del exponente `menor` en adelante, sin ceros al final.
+        menor (int): Exponente del primer coeficiente; cero salvo con exponentes negativos.
+        primo (int): Módulo del campo, o `None` para aritmética entera/real.
     """
 
-    def __init__(self, list_monomios):
+    __slots__ = ("coeficientes", "menor", "primo", "_orden")
+
+    def __init__(self, list_monomios, primo=None):
         """Inicializa el objeto Polinomio.
 
         El constructor recibe una lista de monomios, verifica que todos los elementos sean monomios
-        y luego simplifica la lista de monomios (eliminando términos redundantes).
+        y suma sus coeficientes en la lista densa (eliminando términos redundantes).
 
         Args:
             list_monomios (list): Lista de objetos Monomio.
+            primo (int, optional): Módulo del campo finito. Si es None se usa aritmética ordinaria.
 
         Precondición:
             - La lista debe contener objetos de tipo `Monomio`.
+            - Si `primo` no es None, los coeficientes deben ser enteros.
 
         Postcondición:
-            - El polinomio se crea y la lista de monomios se simplifica.
+            - El polinomio se crea con los coeficientes de los monomios combinados.
         """
         self.verifica(list_monomios)
-        self.monomios = self.simplificar(list_monomios)
+        self.primo = primo
+        if not list_monomios:
+            self._asigna([], 0, None)
+            return
+        exponentes = [monomio.exp for monomio in list_monomios]
+        menor = min(0, min(exponentes))
+        coeficientes = [0] * (max(exponentes) - menor + 1)
+        for monomio in list_monomios:
+            coeficientes[monomio.exp - menor] += monomio.coef
+        orden = tuple(dict.fromkeys(exponentes))
+        self._asigna(coeficientes, menor, None if orden == tuple(sorted(orden)) else orden)
+
+    @classmethod
+    def desde_coeficientes(cls, coeficientes, primo=None, orden=None):
+        """Crea un polinomio a partir de sus coeficientes, sin pasar por monomios.
+
+        Args:
+            coeficientes (list): Coeficientes, del término independiente en adelante.
+            primo (int, optional): Módulo del campo finito. Si es None se usa aritmética ordinaria.
+            orden (iterable, optional): Exponentes en el orden en que se muestran. Por defecto, ascendente.
+
+        Returns:
+            Polinomio: El polinomio `sum(coeficientes[i] * x^i)`.
+        """
+        polinomio = cls.__new__(cls)
+        polinomio.primo = primo
+        polinomio._asigna(list(coeficientes), 0, orden)
+        return polinomio
+
+    def _asigna(self, coeficientes, menor, orden):
+        """Reduce los coeficientes módulo primo, quita los ceros finales y los guarda."""
+        if self.primo is not None:
+            primo = self.primo
+            coeficientes = [coef % primo for coef in coeficientes]
+        while coeficientes and coeficientes[-1] == 0:
+            coeficientes.pop()
+        self.coeficientes = coeficientes
+        self.menor = menor
+        self._orden = orden
+
+    @property
+    def grado(self):
+        """int: Mayor exponente con coeficiente distinto de cero, o -1 si el polinomio es cero."""
+        return self.menor + len(self.coeficientes) - 1 if self.coeficientes else -1
+
+    @property
+    def monomios(self):
+        """List[Monomio]: Términos con coeficiente distinto de cero, construidos al pedirlos."""
+        menor = self.menor
+        coeficientes = self.coeficientes
+        if self._orden is None:
+            exponentes = range(menor, menor + len(coeficientes))
+        else:
+            exponentes = (exp for exp in self._orden if 0 <= exp - menor < len(coeficientes))
+        return [Monomio(coeficientes[exp - menor], exp) for exp in exponentes if coeficientes[exp - menor] != 0]
 
     def simplificar(self, list_monomios):
         """Simplifica una lista de monomios.
@@ -207,22 +284,32 @@ class Polinomio:
         Returns:
             list: Lista de monomios simplificados.
         """
-        monomios_dict = {}
-        for monomio in list_monomios:
-            if monomio.exp in monomios_dict:
-                monomios_dict[monomio.exp] += monomio.coef
-            else:
-                monomios_dict[monomio.exp] = monomio.coef
-        simplificados = []
-        for exp, coef in monomios_dict.items():
-            if coef != 0:
-                simplificados.append(Monomio(coef, exp))
-        return simplificados
+        return Polinomio(list_monomios, self.primo).monomios
+
+    def multiplica(self, otro):
+        """Multiplica dos polinomios.
+
+        Args:
+            otro (Polinomio): El otro factor, en el mismo campo.
+
+        Returns:
+            Polinomio: El producto.
+        """
+        producto = [0] * max(len(self.coeficientes) + len(otro.coeficientes) - 1, 0)
+        for i, a in enumerate(self.coeficientes):
+            if a:
+                for j, b in enumerate(otro.coeficientes):
+                    producto[i + j] += a * b
+        resultado = Polinomio.__new__(Polinomio)
+        resultado.primo = self.primo
+        resultado._asigna(producto, self.menor + otro.menor, None)
+        return resultado
 
     def evalua(self, x):
         """Evalúa el polinomio en un valor dado de `x`.
 
-        Sustituye `x` en cada monomio del polinomio y devuelve la suma total.
+        Usa el método de Horner: una multiplicación y una suma por coeficiente, sin calcular
+        potencias. En modo campo finito cada paso se reduce módulo `primo`.
 
         Args:
             x (float): El valor de `x` para evaluar el polinomio.
@@ -237,10 +324,42 @@ class Polinomio:
             float: El valor numérico del polinomio evaluado en `x`.
         """
         resultado = 0
-        for monomio in self.monomios:
-            resultado += monomio.coef * (x ** monomio.exp)
+        if self.primo is not None:
+            primo = self.primo
+            x %= primo
+            for coef in reversed(self.coeficientes):
+                resultado = (resultado * x + coef) % primo
+            if self.menor:
+                resultado = resultado * pow(x, self.menor, primo) % primo
+            return resultado
+        for coef in reversed(self.coeficientes):
+            resultado = resultado * x + coef
+        if self.menor:
+            resultado *= x ** self.menor
         return resultado
 
+    def evalua_consecutivos(self, n):
+        """Evalúa el polinomio en `x = 1, 2, ..., n`.
+
+        En modo campo finito usa `ArbolProductos.evalua_consecutivos` (diferencias finitas), que
+        no hace multiplicaciones por punto; en otro caso evalúa punto por punto.
+
+        Args:
+            n (int): Número de puntos.
+
+        Precondición:
+            - `n` no es negativo.
+
+        Postcondición:
+            - Se retorna `[P(1), ..., P(n)]`, igual que llamar a `evalua` con cada `x`.
+
+        Returns:
+            list: Los valores del polinomio en `1, ..., n`.
+        """
+        if self.primo is None or self.menor:
+            return [self.evalua(x) for x in range(1, n + 1)]
+        return evalua_consecutivos(self.coeficientes, n, self.primo)
+
     def verifica(self, list_monomios):
         """Verifica que todos los elementos de la lista sean instancias de Monomio.
 
@@ -258,7 +377,6 @@ class Polinomio:
         Raises:
             TypeError: Si algún elemento de la lista no es un objeto `Monomio`.
         """
-        temp = Monomio(1, 0)
         for monomio in list_monomios:
             if not isinstance(monomio, Monomio):
                 raise TypeError("Solo se aceptan objetos de tipo Monomio en la lista")
@@ -0,0 +1,136 @@
+from .Campo import PRIMO, inverso
+
+
+def _resuelve_sistema(filas, incognitas, primo):
+    """
+    Resuelve un sistema lineal sobre GF(primo) por eliminación de Gauss-Jordan.
+
+    Args:
+        filas (List[List[int]]): Matriz aumentada; cada fila tiene `incognitas + 1` elementos.
+        incognitas (int): Número de incógnitas.
+        primo (int): Módulo del campo.
+
+    Returns:
+        List[int]: Una solución, con las variables libres en cero, o None si el sistema es inconsistente.
+    """
+    filas = [[valor % primo for valor in fila] for fila in filas]
+    pivotes = []
+    fila_actual = 0
+    for columna in range(incognitas):
+        pivote = next((i for i in range(fila_actual, len(filas)) if filas[i][columna]), None)
+        if pivote is None:
+            continue
+        filas[fila_actual], filas[pivote] = filas[pivote], filas[fila_actual]
+        fila = filas[fila_actual]
+        factor = inverso(fila[columna], primo)
+        fila[:] = [valor * factor % primo for valor in fila]
+        for i, otra in enumerate(filas):
+            if i != fila_actual and otra[columna]:
+                multiplo = otra[columna]
+                otra[:] = [(a - multiplo * b) % primo for a, b in zip(otra, fila)]
+        pivotes.append(columna)
+        fila_actual += 1
+        if fila_actual == len(filas):
+            break
+
+    if any(fila[-1] for fila in filas[fila_actual:]):
+        return None
+    solucion = [0] * incognitas
+    for i, columna in enumerate(pivotes):
+        solucion[columna] = filas[i][-1]
+    return solucion
+
+
+def _divide(numerador, denominador, primo):
+    """
+    Divide dos polinomios sobre GF(primo), con coeficientes del término independiente en adelante.
+
+    Args:
+        numerador (List[int]): Coeficientes del dividendo.
+        denominador (List[int]): Coeficientes del divisor; el principal no puede ser cero.
+        primo (int): Módulo del campo.
+
+    Returns:
+        Tuple[List[int], List[int]]: Cociente y residuo.
+    """
+    residuo = list(numerador)
+    grado = len(denominador) - 1
+    principal = inverso(denominador[-1], primo)
+    cociente = [0] * max(len(residuo) - grado, 1)
+    for i in range(len(residuo) - 1 - grado, -1, -1):
+        coeficiente = residuo[i + grado] * principal % primo
+        cociente[i] = coeficiente
+        if coeficiente:
+            for j, valor in enumerate(denominador):
+                residuo[i + j] = (residuo[i + j] - coeficiente * valor) % primo
+    return cociente, residuo[:grado]
+
+
+def _evalua(coeficientes, x, primo):
+    """Evalúa un polinomio con Horner sobre GF(primo)."""
+    resultado = 0
+    for coeficiente in reversed(coeficientes):
+        resultado = (resultado * x + coeficiente) % primo
+    return resultado
+
+
+def decodifica_berlekamp_welch(puntos, k, primo=PRIMO):
+    """
+    Recupera el polinomio de grado menor que `k` que pasa por casi todos los puntos.
+
+    Usa el algoritmo de Berlekamp-Welch: con `n` puntos tolera hasta `e = (n - k) // 2` errores.
+    Plantea `Q(x_i) = y_i·E(x_i)` con `E` mónico de grado `e` (el localizador de errores) y `Q`
+    de grado menor que `e + k`; resuelve el sistema lineal en O(n^3) operaciones del campo y
+    obtiene el polinomio como `Q / E`. Los puntos en los que no coincide son los dañados.
+
+    Args:
+        puntos (List[Tuple[int, int]]): Puntos (x, y) con abscisas distintas.
+        k (int): Número de coeficientes del polinomio, es decir, el umbral.
+        primo (int): Módulo del campo. Por defecto es `PRIMO`.
+
+    Precondición:
+        - Hay a lo más `(n - k) // 2` puntos que no están en el polinomio.
+
+    Postcondición:
+        - Se retorna el único polinomio de grado menor que `k` que coincide con al menos
+          `n - (n - k) // 2` puntos.
+
+    Returns:
+        Tuple[List[int], List[int]]: Coeficientes del polinomio, del término independiente en
+        adelante, y abscisas de los puntos que no coinciden.
+
+    Raises:
+        ValueError: Si hay menos de `k` puntos, si se repite alguna abscisa o si hay demasiados
+            errores para corregirlos.
+    """
+    n = len(puntos)
+    if n < k or k < 1:
+        raise ValueError(f"Se necesitan al menos {k} fragmentos para reconstruir.")
+    if len({x % primo for x, _ in puntos}) != n:
+        raise ValueError("Los fragmentos tienen abscisas repetidas.")
+
+    errores = (n - k) // 2
+    incognitas = errores + k + errores
+    filas = []
+    for x, y in puntos:
+        potencias = [1]
+        for _ in range(errores + k):
+            potencias.append(potencias[-1] * x % primo)
+        # Coeficientes de Q, luego los de E sin el principal, luego el lado derecho y·x^e.
+        filas.append(potencias[:errores + k] + [-y * potencia for potencia in potencias[:errores]]
+                     + [y * potencias[errores]])
+
+    solucion = _resuelve_sistema(filas, incognitas, primo)
+    if solucion is None:
+        raise ValueError("Hay demasiados fragmentos dañados para reconstruir el secreto.")
+    q = solucion[:errores + k]
+    e = solucion[errores + k:] + [1]
+    coeficientes, residuo = _divide(q, e, primo)
+    if any(residuo):
+        raise ValueError("Hay demasiados fragmentos dañados para reconstruir el secreto.")
+    coeficientes = (coeficientes + [0] * k)[:k]
+
+    malos = [x for x, y in puntos if _evalua(coeficientes, x, primo) != y % primo]
+    if len(malos) > errores:
+        raise ValueError("Hay demasiados fragmentos dañados para reconstruir el secreto.")
+    return coeficientes, malos
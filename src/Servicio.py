@@ -0,0 +1,420 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+from concurrent.futures import BrokenExecutor
+from .Gestor import (verifica_archivo, validar_tamano, nombreCorrecto, rangoValido, nombre_desde_archivo,
+                     verificar_extension_aes, verificar_extension_frg)
+
+PUERTO = 8765
+
+# Peticiones que se procesan a la vez; las demás esperan su turno.
+MAX_CONCURRENTES = 64
+
+# Tamaño máximo del cuerpo JSON de una petición, en bytes.
+MAX_CUERPO = 1024 * 1024
+
+# Fragmentos que acepta `/combine` por petición; reconstruir cuesta O(t^2) en el trabajador.
+MAX_FRAGMENTOS = 1024
+
+# Segundos que una conexión persistente puede quedar inactiva antes de cerrarse.
+TIEMPO_INACTIVO = 30
+
+_RAZONES = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class ErrorPeticion(Exception):
+    """Error atribuible a la petición, que se responde con el código HTTP `estado`."""
+
+    def __init__(self, estado, mensaje):
+        super().__init__(mensaje)
+        self.estado = estado
+
+
+def _calentar():
+    """Importa en cada proceso trabajador los módulos de cifrado para no pagarlo por petición."""
+    from . import Codificador, Decodificador  # noqa: F401
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM  # noqa: F401
+
+
+def _dentro_de_docs(ruta):
+    """
+    Verifica que `ruta` se resuelva dentro de la carpeta 'docs', siguiendo enlaces simbólicos.
+
+    Raises:
+        TypeError: Si `ruta` no es una cadena.
+        ValueError: Si la ruta sale de la carpeta 'docs'.
+    """
+    if not isinstance(ruta, str):
+        raise TypeError("La ruta debe ser una cadena válida.")
+    docs = os.path.realpath(os.path.join(os.path.dirname(__file__), '../docs'))
+    if os.path.commonpath([docs, os.path.realpath(os.path.join(docs, ruta))]) != docs:
+        raise ValueError(f"El archivo {ruta} está fuera de la carpeta 'docs'.")
+
+
+def dividir(contrasena, n, t):
+    """
+    Deriva la clave de una contraseña y la divide en `n` fragmentos con umbral `t`.
+
+    Args:
+        contrasena (str): Contraseña de la que se deriva la clave con SHA-256.
+        n (int): Número de fragmentos.
+        t (int): Número mínimo de fragmentos para reconstruir.
+
+    Returns:
+        dict: Fragmentos como pares `[x, y]` con `y` en hexadecimal.
+    """
+    from .Codificador import Codificador
+
+    rangoValido(n, t)
+    validar_tamano(contrasena)
+    codificador = Codificador()
+    codificador.generaSha(contrasena)
+    puntos = codificador.shamir_generar_puntos(codificador.shamir_generar_polinomio(t), n)
+    return {"fragmentos": [[x, format(y, 'x')] for x, y in puntos]}
+
+
+def combinar(fragmentos):
+    """
+    Reconstruye la clave a partir de fragmentos `[x, y]` con `y` en hexadecimal.
+
+    Args:
+        fragmentos (list): Fragmentos a combinar.
+
+    Returns:
+        dict: La clave de 32 bytes en hexadecimal.
+
+    Raises:
+        ValueError: Si hay más de `MAX_FRAGMENTOS` fragmentos o no reconstruyen una clave de 32 bytes.
+    """
+    from .Acumulador import Acumulador
+
+    if len(fragmentos) > MAX_FRAGMENTOS:
+        raise ValueError(f"Se aceptan a lo más {MAX_FRAGMENTOS} fragmentos por petición.")
+    acumulador = Acumulador()
+    for x, y in fragmentos:
+        acumulador.agrega(int(x), int(y, 16))
+    secreto = acumulador.secreto()
+    # El campo es un poco mayor que 2^256: fragmentos inconsistentes pueden dar un valor que no cabe.
+    if secreto.bit_length() > 256:
+        raise ValueError("Los fragmentos no reconstruyen una clave de 32 bytes.")
+    return {"clave": secreto.to_bytes(32, 'big').hex()}
+
+
+def cifrar(archivo, n, t, contrasena, nombre=None):
+    """
+    Cifra un archivo de la carpeta 'docs', como el subcomando `split`.
+
+    Args:
+        archivo (str): Archivo a cifrar dentro de la carpeta 'docs'.
+        n (int): Número de fragmentos.
+        t (int): Número mínimo de fragmentos para reconstruir.
+        contrasena (str): Contraseña para cifrar el archivo.
+        nombre (str, optional): Nombre del `.aes` y `.frg` de salida. Por defecto, el del archivo.
+
+    Returns:
+        dict: Nombres del `.aes` y del `.frg` generados en la carpeta 'resultados'.
+    """
+    from .Gestor import gestiona_C
+
+    rangoValido(n, t)
+    validar_tamano(contrasena)
+    _dentro_de_docs(archivo)
+    verifica_archivo(archivo)
+    nombre = nombre or nombre_desde_archivo(archivo, set())
+    nombreCorrecto(nombre)
+    # Cada proceso trabajador atiende una petición a la vez, así que usa un solo hilo.
+    gestiona_C([nombre, n, t, archivo, contrasena], hilos=1)
+    return {"cifrado": f"{nombre}.aes", "fragmentos": f"{nombre}.frg"}
+
+
+def descifrar(cifrado, fragmentos, robusto=False):
+    """
+    Descifra un par `.aes`/`.frg` de la carpeta 'docs', como el subcomando `combine`.
+
+    Args:
+        cifrado (str): Archivo `.aes` dentro de la carpeta 'docs'.
+        fragmentos (str): Archivo `.frg` dentro de la carpeta 'docs'.
+        robusto (bool): Si es True, tolera fragmentos alterados al reconstruir la clave.
+
+    Returns:
+        dict: Los archivos de entrada y, en `descifrado`, la ruta del archivo escrito, cuyo nombre
+        solo se conoce al descifrar.
+    """
+    from .Gestor import gestiona_D
+
+    verificar_extension_aes(cifrado)
+    verificar_extension_frg(fragmentos)
+    _dentro_de_docs(cifrado)
+    _dentro_de_docs(fragmentos)
+    verifica_archivo(cifrado)
+    verifica_archivo(fragmentos)
+    _, destino = gestiona_D([cifrado, fragmentos], hilos=1, robusto=robusto)
+    return {"cifrado": cifrado, "fragmentos": fragmentos, "descifrado": os.path.abspath(destino)}
+
+
+# Ruta de cada operación, con la función que la ejecuta y sus parámetros obligatorios y opcionales.
+OPERACIONES = {
+    "/split": (dividir, ("contrasena", "n", "t"), ()),
+    "/combine": (combinar, ("fragmentos",), ()),
+    "/encrypt": (cifrar, ("archivo", "n", "t", "contrasena"), ("nombre",)),
+    "/decrypt": (descifrar, ("cifrado", "fragmentos"), ("robusto",)),
+}
+
+
+class Servicio:
+    """
+    Servicio HTTP/1.1 con conexiones persistentes que expone `split`, `combine`, `encrypt` y `decrypt`.
+
+    Cada operación recibe un objeto JSON por POST y responde otro con la llave `exito`. El
+    trabajo de CPU se ejecuta en un grupo de procesos que importan los módulos de cifrado una
+    sola vez al arrancar, y un semáforo limita cuántas peticiones se procesan a la vez.
+
+    Attributes:
+        max_concurrentes (int): Peticiones procesadas simultáneamente.
+    """
+
+    def __init__(self, trabajadores=None, max_concurrentes=MAX_CONCURRENTES, ejecutor=None):
+        """
+        Inicializa el servicio.
+
+        Args:
+            trabajadores (int, optional): Procesos del grupo. Por defecto, el número de núcleos.
+            max_concurrentes (int): Peticiones procesadas simultáneamente.
+            ejecutor (concurrent.futures.Executor, optional): Grupo a usar en lugar de crear uno.
+        """
+        self.max_concurrentes = max_concurrentes
+        self._trabajadores = trabajadores
+        self._ejecutor = ejecutor
+        self._propio = ejecutor is None
+        self._semaforo = None
+
+    def _preparar(self):
+        """Crea el semáforo y, si no se dio uno, el grupo de procesos con sus trabajadores calentados."""
+        self._semaforo = asyncio.Semaphore(self.max_concurrentes)
+        if self._ejecutor is None:
+            self._ejecutor = self._crear_ejecutor()
+
+    def _crear_ejecutor(self):
+        """Crea un grupo de procesos que calienta a sus trabajadores al arrancar."""
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        # Con `spawn` los trabajadores no heredan los sockets de las conexiones abiertas, que de
+        # otro modo seguirían abiertas en el trabajador después de que el servicio las cierra.
+        return ProcessPoolExecutor(max_workers=self._trabajadores, initializer=_calentar,
+                                   mp_context=multiprocessing.get_context("spawn"))
+
+    def _reponer(self, roto):
+        """
+        Reemplaza el grupo de procesos propio después de que un trabajador murió.
+
+        Un `ProcessPoolExecutor` roto rechaza todas las tareas siguientes, así que sin esto cada
+        petición posterior respondería 500. Solo se repone si `roto` sigue siendo el grupo actual,
+        para no crear otro por cada petición que estaba en curso cuando se rompió.
+        """
+        if self._propio and self._ejecutor is roto:
+            roto.shutdown(wait=False, cancel_futures=True)
+            self._ejecutor = self._crear_ejecutor()
+
+    def cerrar(self):
+        """Detiene el grupo de procesos si lo creó el servicio."""
+        if self._propio and self._ejecutor is not None:
+            self._ejecutor.shutdown(wait=True, cancel_futures=True)
+            self._ejecutor = None
+
+    async def iniciar(self, anfitrion="127.0.0.1", puerto=PUERTO, socket_unix=None):
+        """
+        Comienza a escuchar en localhost o en un socket Unix.
+
+        Args:
+            anfitrion (str): Dirección en la que escuchar.
+            puerto (int): Puerto TCP; 0 elige uno libre.
+            socket_unix (str, optional): Ruta de un socket Unix en lugar de TCP.
+
+        Returns:
+            asyncio.Server: El servidor ya escuchando.
+        """
+        self._preparar()
+        if socket_unix:
+            return await asyncio.start_unix_server(self.atender, path=socket_unix)
+        return await asyncio.start_server(self.atender, anfitrion, puerto)
+
+    async def atender(self, lector, escritor):
+        """
+        Atiende las peticiones de una conexión hasta que el cliente la cierra o queda inactiva.
+
+        Args:
+            lector (asyncio.StreamReader): Flujo de entrada de la conexión.
+            escritor (asyncio.StreamWriter): Flujo de salida de la conexión.
+        """
+        try:
+            while True:
+                try:
+                    peticion = await asyncio.wait_for(self._leer_peticion(lector), TIEMPO_INACTIVO)
+                except ErrorPeticion as e:
+                    self._escribir_respuesta(escritor, e.estado, {"exito": False, "error": str(e)}, False)
+                    await escritor.drain()
+                    break
+                if peticion is None:
+                    break
+                metodo, ruta, cuerpo, persistente = peticion
+                estado, respuesta = await self.despachar(metodo, ruta, cuerpo)
+                self._escribir_respuesta(escritor, estado, respuesta, persistente)
+                await escritor.drain()
+                if not persistente:
+                    break
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            escritor.close()
+
+    async def _leer_peticion(self, lector):
+        """
+        Lee una petición HTTP/1.1.
+
+        Returns:
+            Tuple[str, str, bytes, bool]: Método, ruta, cuerpo y si la conexión sigue abierta;
+            None si el cliente cerró la conexión.
+
+        Raises:
+            ErrorPeticion: Si la petición está mal formada o su cuerpo es demasiado grande.
+        """
+        linea = await lector.readline()
+        if not linea.strip():
+            return None
+        try:
+            metodo, ruta, version = linea.decode('latin-1').split()
+        except ValueError:
+            raise ErrorPeticion(400, "Línea de petición inválida.")
+        cabeceras = {}
+        while (linea := await lector.readline()) not in (b"\r\n", b"\n", b""):
+            nombre, _, valor = linea.decode('latin-1').partition(":")
+            cabeceras[nombre.strip().lower()] = valor.strip()
+        try:
+            largo = int(cabeceras.get("content-length", 0))
+        except ValueError:
+            raise ErrorPeticion(400, "Content-Length inválido.")
+        if largo < 0:
+            raise ErrorPeticion(400, "Content-Length inválido.")
+        if largo > MAX_CUERPO:
+            raise ErrorPeticion(413, "El cuerpo de la petición es demasiado grande.")
+        cuerpo = await lector.readexactly(largo)
+        conexion = cabeceras.get("connection", "").lower()
+        persistente = conexion == "keep-alive" if version == "HTTP/1.0" else conexion != "close"
+        return metodo, ruta, cuerpo, persistente
+
+    async def despachar(self, metodo, ruta, cuerpo):
+        """
+        Ejecuta la operación de `ruta` en el grupo de procesos.
+
+        Args:
+            metodo (str): Método HTTP.
+            ruta (str): Ruta de la operación.
+            cuerpo (bytes): Cuerpo JSON de la petición.
+
+        Returns:
+            Tuple[int, dict]: Código HTTP y respuesta.
+        """
+        if ruta == "/salud":
+            return 200, {"exito": True}
+        if ruta not in OPERACIONES:
+            return 404, {"exito": False, "error": f"La ruta {ruta} no existe."}
+        if metodo != "POST":
+            return 405, {"exito": False, "error": "Solo se admite POST."}
+        funcion, obligatorios, opcionales = OPERACIONES[ruta]
+        try:
+            datos = json.loads(cuerpo or b"{}")
+            if not isinstance(datos, dict):
+                raise ValueError("El cuerpo debe ser un objeto JSON.")
+            faltantes = [campo for campo in obligatorios if campo not in datos]
+            if faltantes:
+                raise ValueError(f"Faltan los campos: {', '.join(faltantes)}.")
+            argumentos = {campo: datos[campo] for campo in obligatorios + opcionales if campo in datos}
+        except ValueError as e:
+            return 400, {"exito": False, "error": str(e)}
+
+        async with self._semaforo:
+            ejecutor = self._ejecutor
+            try:
+                resultado = await asyncio.get_running_loop().run_in_executor(
+                    ejecutor, _llamar, funcion, argumentos)
+            except BrokenExecutor as e:
+                self._reponer(ejecutor)
+                return 500, {"exito": False, "error": str(e)}
+            except Exception as e:
+                return 500, {"exito": False, "error": str(e)}
+        return (200, dict(resultado, exito=True)) if "error" not in resultado else (400, dict(resultado, exito=False))
+
+    def _escribir_respuesta(self, escritor, estado, respuesta, persistente):
+        """Escribe una respuesta JSON con su longitud, para que la conexión pueda reutilizarse."""
+        cuerpo = json.dumps(respuesta, ensure_ascii=False).encode('utf-8')
+        cabecera = (f"HTTP/1.1 {estado} {_RAZONES[estado]}\r\n"
+                    "Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(cuerpo)}\r\n"
+                    f"Connection: {'keep-alive' if persistente else 'close'}\r\n\r\n")
+        escritor.write(cabecera.encode('latin-1') + cuerpo)
+
+
+def _llamar(funcion, argumentos):
+    """
+    Ejecuta una operación en el proceso trabajador y convierte los errores en una respuesta.
+
+    Returns:
+        dict: El resultado de la operación, o `{"error": ...}` si la petición era inválida.
+    """
+    try:
+        return funcion(**argumentos)
+    except (ValueError, TypeError, FileNotFoundError) as e:
+        return {"error": str(e)}
+
+
+def crear_parser():
+    """
+    Construye el analizador de argumentos del servicio.
+
+    Returns:
+        argparse.ArgumentParser: Analizador de argumentos.
+    """
+    parser = argparse.ArgumentParser(prog="python -m src.Servicio",
+                                     description="Servicio local de cifrado y descifrado con Shamir Secret Sharing.")
+    parser.add_argument("--puerto", type=int, default=PUERTO, help=f"Puerto en localhost. Por defecto, {PUERTO}.")
+    parser.add_argument("--unix", metavar="RUTA", help="Escucha en un socket Unix en lugar de TCP.")
+    parser.add_argument("--trabajadores", type=int, help="Procesos para el trabajo de CPU. Por defecto, el número de núcleos.")
+    parser.add_argument("--max-concurrentes", type=int, default=MAX_CONCURRENTES,
+                        help=f"Peticiones procesadas a la vez. Por defecto, {MAX_CONCURRENTES}.")
+    return parser
+
+
+async def _servir(argumentos):
+    """Ejecuta el servicio hasta que se interrumpe."""
+    servicio = Servicio(argumentos.trabajadores, argumentos.max_concurrentes)
+    servidor = await servicio.iniciar(puerto=argumentos.puerto, socket_unix=argumentos.unix)
+    try:
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        servicio.cerrar()
+
+
+def main(argv=None):
+    """
+    Punto de entrada del servicio.
+
+    Args:
+        argv (list, optional): Argumentos sin el nombre del programa. Por defecto, `sys.argv[1:]`.
+
+    Returns:
+        int: Código de salida.
+    """
+    argumentos = crear_parser().parse_args(argv)
+    try:
+        asyncio.run(_servir(argumentos))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+import random
+import pytest
+from src.Acumulador import Acumulador
+from src.Campo import PRIMO
+from src.Lagrange import Lagrange
+
+def test_secreto_al_alcanzar_umbral():
+    acumulador = Acumulador(umbral=3)
+    assert not acumulador.agrega(1, 5)
+    assert not acumulador.agrega(2, 15)
+    with pytest.raises(ValueError):
+        acumulador.secreto()
+    assert acumulador.agrega(3, 35)
+    assert acumulador.completo and len(acumulador) == 3
+    assert acumulador.secreto() == 5
+
+def test_coincide_con_lagrange_en_cualquier_orden():
+    coeficientes = [random.randrange(PRIMO) for _ in range(6)]
+    puntos = [(x, sum(c * pow(x, i, PRIMO) for i, c in enumerate(coeficientes)) % PRIMO)
+              for x in random.sample(range(1, 10**6), 6)]
+    acumulador = Acumulador(umbral=6)
+    for x, y in puntos:
+        acumulador.agrega(x, y)
+    assert acumulador.secreto() == coeficientes[0] == Lagrange(puntos, PRIMO).evalua(0)
+
+def test_umbral_desconocido_y_fragmento_en_cero():
+    acumulador = Acumulador()
+    acumulador.agrega(1, 0)
+    acumulador.agrega(0, 0)
+    acumulador.agrega(2, 0)
+    assert not acumulador.completo
+    assert acumulador.secreto() == 0
+
+def test_abscisa_repetida():
+    acumulador = Acumulador(umbral=2)
+    acumulador.agrega(4, 1)
+    with pytest.raises(ValueError, match="x=4"):
+        acumulador.agrega(4, 2)
+    with pytest.raises(ValueError):
+        Acumulador(umbral=0)
+
+def test_abscisa_repetida_no_altera_lo_acumulado():
+    acumulador = Acumulador(umbral=3)
+    acumulador.agrega(1, 123 + 7 + 1)
+    acumulador.agrega(2, 123 + 14 + 4)
+    with pytest.raises(ValueError, match="x=2"):
+        acumulador.agrega(2, 5)
+    assert len(acumulador) == 2
+    assert acumulador.agrega(3, 123 + 21 + 9)
+    assert acumulador.secreto() == 123
@@ -0,0 +1,60 @@
+import sqlite3
+import pytest
+from src import Fragmentos
+from src.Almacen import AlmacenFragmentos
+from src.Campo import PRIMO
+
+@pytest.fixture
+def almacen(tmp_path):
+    with AlmacenFragmentos(str(tmp_path / "fragmentos.db")) as almacen:
+        yield almacen
+
+def test_guardar_y_reconstruir(almacen):
+    almacen.guarda_secreto("clave-1", 3, [(1, 5), (2, 15), (3, 35), (4, 63)], ["ana", "beto", "ceci", "dani"])
+    assert almacen.umbral("clave-1") == 3
+    assert almacen.fragmentos("clave-1", limite=3) == [(1, 5), (2, 15), (3, 35)]
+    assert almacen.reconstruye("clave-1") == 5
+    assert almacen.fragmentos_de_custodio("beto") == [("clave-1", 2, 15)]
+    with pytest.raises(KeyError):
+        almacen.reconstruye("no-existe")
+
+def test_lote_y_busqueda_masiva(almacen):
+    registros = [(f"s{i}", f"c{x}", x, (i * 1000 + x) ** 5 % PRIMO, 2) for i in range(1200) for x in (1, 2, 3)]
+    almacen.guarda_lote(registros)
+    encontrados = almacen.fragmentos_de_secretos([f"s{i}" for i in range(0, 1200, 2)] + ["ninguno"])
+    assert len(encontrados) == 600
+    assert encontrados["s10"] == [(x, (10000 + x) ** 5 % PRIMO) for x in (1, 2, 3)]
+    assert len(almacen.fragmentos_de_custodio("c2")) == 1200
+
+def test_abscisa_repetida_no_guarda_nada(almacen):
+    with pytest.raises(sqlite3.IntegrityError):
+        almacen.guarda_lote([("a", None, 1, 7, 2), ("b", None, 1, 8, 2), ("a", None, 1, 9, 2)])
+    assert almacen.fragmentos_de_secretos(["a", "b"]) == {}
+    with pytest.raises(ValueError):
+        almacen.guarda_lote([("a", None, 1, 7, 2), ("a", None, 2, 8, 3)])
+    with pytest.raises(ValueError):
+        almacen.guarda_secreto("c", 2, [(1, 1), (2, 2)], ["solo uno"])
+
+def test_importar_frg(almacen, tmp_path):
+    ruta = tmp_path / "clave.frg"
+    ruta.write_bytes(Fragmentos.codifica_fragmentos([(1, 5), (2, 15), (3, 35)], umbral=3))
+    almacen.importa_frg("clave", str(ruta))
+    assert almacen.reconstruye("clave") == 5
+    ruta.write_text(Fragmentos.codifica_texto([(1, 5), (2, 15)]))
+    with pytest.raises(ValueError, match="umbral"):
+        almacen.importa_frg("texto", str(ruta))
+
+def test_umbral_distinto_en_otra_llamada(almacen):
+    almacen.guarda_secreto("k", 3, [(1, 5), (2, 15), (3, 35)])
+    with pytest.raises(ValueError):
+        almacen.guarda_secreto("k", 2, [(4, 63)])
+    assert almacen.umbral("k") == 3
+    assert almacen.fragmentos("k") == [(1, 5), (2, 15), (3, 35)]
+    almacen.guarda_secreto("k", 3, [(4, 63)])
+    assert almacen.reconstruye("k") == 5
+
+def test_umbral_distinto_entre_bloques_de_insercion(almacen, monkeypatch):
+    monkeypatch.setattr("src.Almacen._POR_INSERCION", 2)
+    with pytest.raises(ValueError):
+        almacen.guarda_lote([("k", None, 1, 5, 3), ("k", None, 2, 15, 3), ("k", None, 3, 35, 2)])
+    assert almacen.umbral("k") is None
@@ -0,0 +1,47 @@
+import random
+import pytest
+from src.ArbolProductos import multiplica, residuo, evalua_en_puntos, evalua_consecutivos, interpola
+from src.Campo import PRIMO
+from src.ReedSolomon import _divide, _evalua
+
+
+def _aleatorios(n, semilla):
+    generador = random.Random(semilla)
+    return [generador.randrange(PRIMO) for _ in range(n)]
+
+
+@pytest.mark.parametrize("n, m", [(1, 1), (3, 5), (20, 20), (40, 70)])
+def test_multiplica_coincide_con_termino_a_termino(n, m):
+    a, b = _aleatorios(n, 1), _aleatorios(m, 2)
+    esperado = [0] * (n + m - 1)
+    for i, x in enumerate(a):
+        for j, y in enumerate(b):
+            esperado[i + j] = (esperado[i + j] + x * y) % PRIMO
+    assert multiplica(a, b) == esperado
+
+
+@pytest.mark.parametrize("n, m", [(10, 4), (100, 40), (60, 59), (3, 8)])
+def test_residuo_coincide_con_division_larga(n, m):
+    a, b = _aleatorios(n, 3), _aleatorios(m - 1, 4) + [7]
+    esperado = (_divide(a, b, PRIMO)[1] + [0] * m)[:m - 1] if n >= m else a + [0] * (m - 1 - n)
+    assert residuo(a, b) == esperado
+
+
+@pytest.mark.parametrize("n", [1, 2, 17, 100])
+def test_evalua_en_puntos_e_interpola(n):
+    coeficientes = _aleatorios(n, n)
+    xs = random.Random(5).sample(range(1, 10**9), n)
+    valores = evalua_en_puntos(coeficientes, xs)
+    assert valores == [_evalua(coeficientes, x, PRIMO) for x in xs]
+    assert interpola(list(zip(xs, valores))) == coeficientes
+
+
+def test_interpola_abscisas_repetidas():
+    with pytest.raises(ValueError):
+        interpola([(1, 2), (3, 4), (PRIMO + 1, 5)])
+
+
+@pytest.mark.parametrize("t, n", [(0, 3), (1, 5), (4, 4), (4, 200), (30, 500), (300, 310)])
+def test_evalua_consecutivos(t, n):
+    coeficientes = _aleatorios(t, t + n)
+    assert evalua_consecutivos(coeficientes, n) == [_evalua(coeficientes, x, PRIMO) for x in range(1, n + 1)]
@@ -0,0 +1,54 @@
+import os
+import pickle
+import pytest
+from src.Archivo import Archivo
+
+RUTA_DOCS = os.path.join(os.path.dirname(__file__), "../docs")
+
+@pytest.fixture
+def archivo_binario():
+    nombre = "prueba_archivo.bin"
+    ruta = os.path.join(RUTA_DOCS, nombre)
+    contenido = bytes(range(256)) * 1000
+    with open(ruta, "wb") as f:
+        f.write(contenido)
+    yield nombre, ruta, contenido
+    os.remove(ruta)
+
+def test_archivo_no_lee_al_construir(archivo_binario):
+    nombre, ruta, contenido = archivo_binario
+    archivo = Archivo(nombre)
+    assert archivo.get_tamano() == len(contenido)
+    assert archivo._Archivo__archivo is None
+    assert archivo.get_archivo() == contenido
+
+def test_archivo_binario_no_utf8(archivo_binario):
+    nombre, _, contenido = archivo_binario
+    assert Archivo(nombre).get_tamano() == len(contenido)
+
+def test_archivo_iterar_bloques(archivo_binario):
+    nombre, _, contenido = archivo_binario
+    bloques = list(Archivo(nombre).iterar_bloques(4096))
+    assert all(len(bloque) <= 4096 for bloque in bloques)
+    assert b"".join(bloques) == contenido
+
+@pytest.mark.parametrize("prefijo", [b"", b"nombre.txt", b"x" * 5000])
+def test_archivo_iterar_bloques_con_prefijo(archivo_binario, prefijo):
+    nombre, _, contenido = archivo_binario
+    bloques = list(Archivo(nombre).iterar_bloques(4096, prefijo))
+    assert all(len(bloque) == 4096 for bloque in bloques[:-1])
+    assert b"".join(bloques) == prefijo + contenido
+
+def test_archivo_pickle_conserva_contenido(archivo_binario):
+    nombre, _, contenido = archivo_binario
+    copia = pickle.loads(pickle.dumps(Archivo(nombre)))
+    assert copia.get_nombre() == nombre
+    assert copia.get_archivo() == contenido
+
+def test_archivo_no_existente():
+    with pytest.raises(FileNotFoundError):
+        Archivo("no_existe.bin")
+
+def test_archivo_directorio():
+    with pytest.raises(FileNotFoundError):
+        Archivo(".")
@@ -0,0 +1,96 @@
+import io
+import pytest
+from src.Cabecera import Cabecera, CIFRADO_AES_CBC, MAGIA
+
+def test_cabecera_ida_y_vuelta():
+    cabecera = Cabecera("Ejemplo.scv", b"\x01" * 16, 123456789, CIFRADO_AES_CBC, 4096)
+    datos = cabecera.a_bytes() + b"texto cifrado"
+
+    leida, desplazamiento = Cabecera.desde_bytes(datos)
+
+    assert b"Ejemplo" not in datos
+    assert (leida.nombre, leida.largo_nombre) == (None, len("Ejemplo.scv"))
+    assert leida.longitud_flujo == 123456789 + len("Ejemplo.scv")
+    assert leida.a_bytes() == cabecera.a_bytes()
+    assert leida.iv == b"\x01" * 16
+    assert leida.longitud == 123456789
+    assert leida.cifrado == CIFRADO_AES_CBC
+    assert leida.tamano_bloque == 4096
+    assert datos[desplazamiento:] == b"texto cifrado"
+
+def test_cabecera_leer_deja_flujo_en_texto_cifrado():
+    flujo = io.BytesIO(Cabecera("ñandú.txt", b"\x02" * 16, 5).a_bytes() + b"resto")
+    assert Cabecera.leer(flujo).largo_nombre == len("ñandú.txt".encode("utf-8"))
+    assert flujo.read() == b"resto"
+
+def test_cabecera_version_2_guarda_nombre_en_claro():
+    flujo = io.BytesIO(Cabecera("ñandú.txt", b"\x02" * 16, 5, version=2).a_bytes() + b"resto")
+    leida = Cabecera.leer(flujo)
+    assert (leida.version, leida.nombre, leida.nombre_cifrado) == (2, "ñandú.txt", False)
+    assert flujo.read() == b"resto"
+
+def test_cabecera_magia_invalida():
+    with pytest.raises(ValueError):
+        Cabecera.desde_bytes(b"XXXX" + bytes(40))
+
+def test_cabecera_version_no_soportada():
+    datos = bytearray(Cabecera("a", b"\x00" * 16, 1).a_bytes())
+    datos[len(MAGIA)] = 99
+    with pytest.raises(ValueError, match="versión"):
+        Cabecera.desde_bytes(datos)
+
+def test_cabecera_truncada():
+    with pytest.raises(ValueError):
+        Cabecera.leer(io.BytesIO(Cabecera("archivo", b"\x00" * 16, 1).a_bytes()[:-3]))
+
+def test_nonce_bloque_distingue_indice_y_ultimo():
+    from src.Cabecera import nonce_bloque
+    prefijo = b"\x07" * 7
+    nonces = {nonce_bloque(prefijo, i, ultimo) for i in range(3) for ultimo in (False, True)}
+    assert len(nonces) == 6 and all(len(nonce) == 12 for nonce in nonces)
+    with pytest.raises(ValueError):
+        nonce_bloque(prefijo, 2**32, True)
+
+def test_cabecera_version_1_sin_verificacion():
+    from src.Cabecera import verifica_clave
+    datos = Cabecera("viejo.txt", b"\x03" * 16, 10, version=1).a_bytes() + b"resto"
+    flujo = io.BytesIO(datos)
+    leida = Cabecera.leer(flujo)
+    assert (leida.version, leida.nombre, leida.verificacion) == (1, "viejo.txt", b"")
+    assert flujo.read() == b"resto"
+    verifica_clave(leida, b"\x00" * 32)
+
+def test_cabecera_valor_verificacion():
+    from src.Cabecera import valor_verificacion, verifica_clave, TAMANO_VERIFICACION
+    clave = b"\x05" * 32
+    cabecera, _ = Cabecera.desde_bytes(Cabecera("a", b"\x00" * 7, 1, verificacion=valor_verificacion(clave)).a_bytes())
+    assert len(cabecera.verificacion) == TAMANO_VERIFICACION
+    verifica_clave(cabecera, clave)
+    with pytest.raises(ValueError, match="no corresponden"):
+        verifica_clave(cabecera, b"\x06" * 32)
+
+def test_cabecera_sin_verificacion_se_rechaza_desde_version_2():
+    from src.Cabecera import verifica_clave
+    for version in (2, 3, 4):
+        cabecera, _ = Cabecera.desde_bytes(Cabecera("a", b"\x00" * 7, 1, version=version).a_bytes())
+        assert cabecera.verificacion == b""
+        with pytest.raises(ValueError, match="valor de verificación"):
+            verifica_clave(cabecera, b"\x05" * 32)
+
+def test_clave_gcm_distinta_por_archivo():
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+    from src.Cabecera import clave_gcm, CIFRADO_AES_GCM, TAMANO_PREFIJO_NONCE
+    clave = b"\x05" * 32
+    uno = Cabecera("a", b"\x01" * 16, 1, CIFRADO_AES_GCM)
+    otro = Cabecera("a", b"\x02" * 16, 1, CIFRADO_AES_GCM)
+    clave_uno, prefijo_uno = clave_gcm(clave, uno)
+    assert len(clave_uno) == 32 and len(prefijo_uno) == TAMANO_PREFIJO_NONCE
+    assert clave_uno not in (clave, clave_gcm(clave, otro)[0])
+    esperado = HKDF(hashes.SHA256(), 32 + TAMANO_PREFIJO_NONCE, uno.iv, b"SSSC clave AES-GCM por archivo").derive(clave)
+    assert clave_uno + prefijo_uno == esperado
+
+    anterior = Cabecera("a", b"\x01" * 7, 1, CIFRADO_AES_GCM, version=3)
+    assert clave_gcm(clave, anterior) == (clave, anterior.iv)
+    with pytest.raises(ValueError, match="sal"):
+        clave_gcm(clave, Cabecera("a", b"\x01" * 7, 1, CIFRADO_AES_GCM))
@@ -0,0 +1,42 @@
+import os
+import random
+import pytest
+
+np = pytest.importorskip("numpy")
+from src import CampoBinario
+
+def test_multiplicacion_conocida():
+    # Ejemplo del estándar AES: {57}·{83} = {c1}.
+    assert CampoBinario.multiplica(0x57, 0x83) == 0xC1
+    assert CampoBinario.multiplica(0, 0x83) == 0
+
+def test_inverso():
+    for valor in range(1, 256):
+        assert CampoBinario.multiplica(valor, CampoBinario.inverso(valor)) == 1
+    with pytest.raises(ValueError):
+        CampoBinario.inverso(0)
+
+def test_dividir_y_combinar_cualquier_subconjunto():
+    secreto = os.urandom(4096)
+    fragmentos = CampoBinario.divide_secreto(secreto, 7, 4)
+    assert len(fragmentos) == 7 and all(len(y) == len(secreto) for _, y in fragmentos)
+    for _ in range(5):
+        assert CampoBinario.combina_secreto(random.sample(fragmentos, 4)) == secreto
+
+def test_menos_del_umbral_no_reconstruye():
+    secreto = os.urandom(64)
+    fragmentos = CampoBinario.divide_secreto(secreto, 5, 3)
+    assert CampoBinario.combina_secreto(fragmentos[:2]) != secreto
+
+def test_secreto_vacio():
+    assert CampoBinario.combina_secreto(CampoBinario.divide_secreto(b"", 3, 2)[:2]) == b""
+
+def test_parametros_invalidos():
+    with pytest.raises(ValueError):
+        CampoBinario.divide_secreto(b"x", 256, 3)
+    with pytest.raises(ValueError):
+        CampoBinario.divide_secreto(b"x", 3, 4)
+    with pytest.raises(ValueError):
+        CampoBinario.combina_secreto([(1, b"a"), (1, b"b")])
+    with pytest.raises(ValueError):
+        CampoBinario.combina_secreto([(1, b"a"), (2, b"bc")])
@@ -4,6 +4,7 @@ import os
 import pytest
 from src.Codificador import Codificador
 from src.Polinomio import Polinomio
+from src.Campo import PRIMO
 
 def test_generaSha1():
     codificador = Codificador()
@@ -83,6 +84,23 @@ def test_cifrar_archivo_no_existente():
     with pytest.raises(Exception):
         codificador.cifrar_archivo("archivo_inexistente.txt", "contrasena")
 
+def test_cifrar_archivo_que_cambia_de_tamano_no_deja_salida(monkeypatch):
+    from src.Archivo import Archivo
+    codificador = Codificador()
+    ruta_archivo_claro = os.path.abspath(os.path.join(os.path.dirname(__file__), "../docs/Crece.txt"))
+    resultados = os.path.abspath(os.path.join(os.path.dirname(__file__), "../resultados"))
+    with open(ruta_archivo_claro, "wb") as archivo:
+        archivo.write(b"contenido que crece")
+    # Simula que el archivo creció entre la consulta del tamaño y la lectura.
+    monkeypatch.setattr(Archivo, "get_tamano", lambda self: 3)
+    try:
+        with pytest.raises(IOError, match="cambió de tamaño"):
+            codificador.cifrar_archivo(ruta_archivo_claro, "Crece", "contrasena")
+        assert not os.path.exists(os.path.join(resultados, "Crece.aes"))
+        assert not [nombre for nombre in os.listdir(resultados) if nombre.endswith(".parcial")]
+    finally:
+        os.remove(ruta_archivo_claro)
+
 def test_cifrarArchivo3():
     codificador = Codificador()
     archivo_claro = "Test3.txt"
@@ -109,7 +127,7 @@ def test_shamir_generar_polinomio_valido():
     polinomio = codificador.shamir_generar_polinomio(grado)
     
     assert isinstance(polinomio, Polinomio)
-    assert len(polinomio.monomios) == grado-1
+    assert len(polinomio.monomios) == grado
     assert polinomio.monomios[0].coef == int.from_bytes(codificador._Codificador__key, 'big')
 
 def test_shamir_generar_polinomio_grado_invalido():
@@ -117,11 +135,31 @@ def test_shamir_generar_polinomio_grado_invalido():
     password = "segura123"
     codificador.generaSha(password)
 
-    with pytest.raises(Exception, match="El umbral del polinomio es inválido por ser cero, negativo, o muy grande."):
+    with pytest.raises(Exception, match="El umbral del polinomio es inválido por ser cero o negativo."):
         codificador.shamir_generar_polinomio(0)
 
-    with pytest.raises(Exception, match="El umbral del polinomio es inválido por ser cero, negativo, o muy grande."):
-        codificador.shamir_generar_polinomio(25)
+    with pytest.raises(Exception, match="El umbral del polinomio es inválido por ser cero o negativo."):
+        codificador.shamir_generar_polinomio(-3)
+
+def test_shamir_generar_polinomio_grado_grande():
+    codificador = Codificador()
+    codificador.generaSha("segura123")
+
+    polinomio = codificador.shamir_generar_polinomio(500)
+    assert len(polinomio.coeficientes) == 500
+
+def test_shamir_umbral_es_el_minimo_de_fragmentos():
+    from src.Acumulador import Acumulador
+    codificador = Codificador()
+    codificador.generaSha("segura123")
+    clave = int.from_bytes(codificador._Codificador__key, 'big')
+
+    puntos = codificador.shamir_generar_puntos(codificador.shamir_generar_polinomio(5), 8)
+    for cuantos, reconstruye in ((4, False), (5, True)):
+        acumulador = Acumulador()
+        for x, y in puntos[:cuantos]:
+            acumulador.agrega(x, y)
+        assert (acumulador.secreto() == clave) == reconstruye
 
 def test_shamir_generar_puntos():
     codificador = Codificador()
@@ -139,6 +177,15 @@ def test_shamir_generar_puntos():
         assert isinstance(x, int)
         assert isinstance(y, int)
 
+def test_shamir_generar_puntos_coincide_con_evalua():
+    codificador = Codificador()
+    codificador.generaSha("segura123")
+
+    for grado in (2, 3, 30):
+        polinomio = codificador.shamir_generar_polinomio(grado)
+        puntos = codificador.shamir_generar_puntos(polinomio, 300)
+        assert puntos == [(x, polinomio.evalua(x)) for x in range(1, 301)]
+
 def test_shamir_generar_puntos_numero_invalido():
     codificador = Codificador()
     password = "segura123"
@@ -157,7 +204,7 @@ def test_guardar_fragmentos():
     nombre_archivo = "TestFragmentos"
     codificador._Codificador__nombreCifrado = nombre_archivo  # Simular cifrado previo
 
-    codificador.guardar_fragmentos(puntos)
+    codificador.guardar_fragmentos(puntos, formato="texto")
 
     ruta_fragmentos = os.path.join(os.path.dirname(__file__), f"../resultados/{nombre_archivo}.frg")
     assert os.path.exists(ruta_fragmentos)
@@ -168,4 +215,29 @@ def test_guardar_fragmentos():
         for i, (x, y) in enumerate(puntos):
             assert lineas[i].strip() == f"({x},{y})"
 
-    os.remove(ruta_fragmentos)
\ No newline at end of file
+    os.remove(ruta_fragmentos)
+
+def test_shamir_generar_puntos_en_campo():
+    codificador = Codificador()
+    codificador.generaSha("segura123")
+    polinomio = codificador.shamir_generar_polinomio(6)
+
+    for _, y in codificador.shamir_generar_puntos(polinomio, 50):
+        assert 0 <= y < PRIMO
+
+def test_guardar_fragmentos_binario():
+    codificador = Codificador()
+    puntos = [(1, PRIMO - 1), (2, 0), (300, 2**200)]
+
+    nombre_archivo = "TestFragmentosBinario"
+    codificador._Codificador__nombreCifrado = nombre_archivo
+
+    codificador.guardar_fragmentos(puntos)
+
+    ruta_fragmentos = os.path.join(os.path.dirname(__file__), f"../resultados/{nombre_archivo}.frg")
+    with open(ruta_fragmentos, 'rb') as archivo:
+        contenido = archivo.read()
+    os.remove(ruta_fragmentos)
+
+    assert contenido.startswith(b"SSSF")
+    assert len(contenido) < len("".join(f"({x},{y})\n" for x, y in puntos))
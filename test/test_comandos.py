@@ -0,0 +1,119 @@
+import io
+import json
+import os
+import shutil
+import pytest
+from src.Comandos import main, VARIABLE_CONTRASENA
+
+RUTA_DOCS = os.path.join(os.path.dirname(__file__), "../docs")
+RUTA_RESULTADOS = os.path.join(os.path.dirname(__file__), "../resultados")
+
+@pytest.fixture
+def archivo_claro():
+    ruta = os.path.join(RUTA_DOCS, "comandos_prueba.txt")
+    with open(ruta, "wb") as f:
+        f.write(b"contenido para la linea de comandos")
+    yield "comandos_prueba.txt"
+    for ruta_limpiar in (ruta, os.path.join(RUTA_DOCS, "CliPrueba.aes"), os.path.join(RUTA_DOCS, "CliPrueba.frg"),
+                         os.path.join(RUTA_RESULTADOS, "CliPrueba.aes"), os.path.join(RUTA_RESULTADOS, "CliPrueba.frg"),
+                         os.path.join(RUTA_RESULTADOS, "comandos_prueba.txt")):
+        if os.path.exists(ruta_limpiar):
+            os.remove(ruta_limpiar)
+
+def test_split_y_combine_json(archivo_claro, monkeypatch, capsys):
+    monkeypatch.setenv(VARIABLE_CONTRASENA, "contrasena")
+    assert main(["--json", "split", archivo_claro, "-n", "5", "-t", "3", "--nombre", "CliPrueba"]) == 0
+    assert json.loads(capsys.readouterr().out) == {"exito": True, "cifrado": "CliPrueba.aes", "fragmentos": "CliPrueba.frg"}
+
+    for extension in (".aes", ".frg"):
+        shutil.move(os.path.join(RUTA_RESULTADOS, "CliPrueba" + extension), RUTA_DOCS)
+    assert main(["--json", "combine", "CliPrueba.aes", "CliPrueba.frg"]) == 0
+    resultado = json.loads(capsys.readouterr().out)
+    assert resultado["exito"]
+    assert resultado["descifrado"] == os.path.abspath(os.path.join(RUTA_RESULTADOS, archivo_claro))
+    with open(resultado["descifrado"], "rb") as f:
+        assert f.read() == b"contenido para la linea de comandos"
+
+def test_combine_robusto(archivo_claro, monkeypatch, capsys):
+    from src import Fragmentos
+    monkeypatch.setenv(VARIABLE_CONTRASENA, "contrasena")
+    assert main(["split", archivo_claro, "-n", "7", "-t", "3", "--nombre", "CliPrueba"]) == 0
+    for extension in (".aes", ".frg"):
+        shutil.move(os.path.join(RUTA_RESULTADOS, "CliPrueba" + extension), RUTA_DOCS)
+    ruta_frg = os.path.join(RUTA_DOCS, "CliPrueba.frg")
+    with open(ruta_frg, "rb") as f:
+        puntos = Fragmentos.decodifica(f.read())
+    puntos[0] = (puntos[0][0], puntos[0][1] ^ 1)
+    with open(ruta_frg, "wb") as f:
+        f.write(Fragmentos.codifica_fragmentos(puntos, umbral=3))
+
+    assert main(["combine", "CliPrueba.aes", "CliPrueba.frg"]) == 1
+    assert "no corresponden" in capsys.readouterr().err
+    assert main(["combine", "--robusto", "CliPrueba.aes", "CliPrueba.frg"]) == 0
+    with open(os.path.join(RUTA_RESULTADOS, archivo_claro), "rb") as f:
+        assert f.read() == b"contenido para la linea de comandos"
+
+def test_split_contrasena_stdin(archivo_claro, monkeypatch):
+    monkeypatch.delenv(VARIABLE_CONTRASENA, raising=False)
+    monkeypatch.setattr("sys.stdin", io.StringIO("contrasena\n"))
+    assert main(["split", archivo_claro, "-n", "4", "-t", "3", "--nombre", "CliPrueba", "--contrasena-stdin"]) == 0
+    assert os.path.exists(os.path.join(RUTA_RESULTADOS, "CliPrueba.aes"))
+
+def test_split_sin_contrasena(archivo_claro, monkeypatch, capsys):
+    monkeypatch.delenv(VARIABLE_CONTRASENA, raising=False)
+    assert main(["--json", "split", archivo_claro, "-n", "4", "-t", "3"]) == 2
+    assert "contraseña" in json.loads(capsys.readouterr().out)["error"]
+
+def test_split_rango_invalido(archivo_claro, monkeypatch, capsys):
+    monkeypatch.setenv(VARIABLE_CONTRASENA, "contrasena")
+    assert main(["split", archivo_claro, "-n", "2", "-t", "3"]) == 2
+    assert "2 < t <= n" in capsys.readouterr().err
+
+def test_combine_extension_invalida(capsys):
+    assert main(["combine", "archivo.txt", "archivo.frg"]) == 2
+    assert ".aes" in capsys.readouterr().err
+
+def test_argumentos_invalidos_terminan_con_2(archivo_claro, monkeypatch, capsys):
+    monkeypatch.setenv(VARIABLE_CONTRASENA, "contrasena")
+    assert main(["split", archivo_claro, "-n", "4", "-t", "3", "--nombre", "no valido"]) == 2
+    assert main(["combine", "archivo.aes"]) == 2
+    assert main(["combine", "archivo.aes", "archivo.txt"]) == 2
+    assert main(["split", "--lote", "lote", "-n", "4", "-t", "3", "--hilos", "2"]) == 2
+    assert main(["split", "--lote", "lote", "-n", "4", "-t", "3", "--nombre", "Lote"]) == 2
+    assert main(["combine", "--lote", "lote", "--robusto"]) == 2
+    assert main(["combine", "--lote", "lote", "--hilos", "2"]) == 2
+    assert "--hilos no está disponible con --lote" in capsys.readouterr().err
+    # Un archivo inexistente es un error de ejecución, no de argumentos.
+    assert main(["combine", "no_existe.aes", "no_existe.frg"]) == 1
+    assert "no_existe.aes" in capsys.readouterr().err
+
+def test_argumentos_invalidos():
+    with pytest.raises(SystemExit) as salida:
+        main(["split"])
+    assert salida.value.code == 2
+
+@pytest.mark.parametrize("modulo", ["src.Comandos", "src.Consola", "src.Gestor", "src.Servicio"])
+def test_importar_no_carga_dependencias_pesadas(modulo):
+    from benchmarks.arranque import modulos_prohibidos
+    assert modulos_prohibidos(modulo) == []
+
+def test_split_tiempos_y_perfil(archivo_claro, monkeypatch, tmp_path):
+    monkeypatch.setenv(VARIABLE_CONTRASENA, "contrasena")
+    tiempos = tmp_path / "tiempos.json"
+    perfil = tmp_path / "split.prof"
+    assert main(["--tiempos", str(tiempos), "--perfil", str(perfil),
+                 "split", archivo_claro, "-n", "4", "-t", "3", "--nombre", "CliPrueba"]) == 0
+
+    etapas = [etapa["etapa"] for etapa in json.loads(tiempos.read_text())["etapas"]]
+    assert "gestiona_C/cifrar_archivo/aes" in etapas
+    assert "gestiona_C/puntos" in etapas
+    assert etapas.index("gestiona_C") < etapas.index("gestiona_C/cifrar_archivo/aes")
+    assert perfil.exists()
+
+def test_tiempos_no_admite_lote(tmp_path, capsys):
+    tiempos = tmp_path / "tiempos.json"
+    with pytest.raises(SystemExit) as salida:
+        main(["--tiempos", str(tiempos), "combine", "--lote", "lote_prueba"])
+    assert salida.value.code == 2
+    assert "--lote" in capsys.readouterr().err
+    assert not tiempos.exists()
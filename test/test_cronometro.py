@@ -0,0 +1,36 @@
+import json
+import os
+import pstats
+from src.Cronometro import Cronometro, perfilar
+
+def test_cronometro_acumula_etapas_anidadas():
+    cronometro = Cronometro()
+    with cronometro.etapa("total"):
+        for _ in range(3):
+            with cronometro.etapa("bloque"):
+                pass
+
+    resultados = cronometro.resultados()
+    assert [etapa["etapa"] for etapa in resultados["etapas"]] == ["total", "total/bloque"]
+    assert resultados["etapas"][1]["llamadas"] == 3
+    assert resultados["total_ms"] == resultados["etapas"][0]["total_ms"]
+
+def test_cronometro_inactivo_no_registra():
+    cronometro = Cronometro(activo=False)
+    with cronometro.etapa("nada"):
+        pass
+    assert cronometro.resultados() == {"etapas": [], "total_ms": 0}
+
+def test_cronometro_guardar_json(tmp_path):
+    cronometro = Cronometro()
+    with cronometro.etapa("aes"):
+        pass
+    ruta = tmp_path / "tiempos.json"
+    cronometro.guardar(str(ruta))
+    assert json.loads(ruta.read_text())["etapas"][0]["etapa"] == "aes"
+
+def test_perfilar_guarda_perfil(tmp_path):
+    ruta = str(tmp_path / "perfil.prof")
+    assert perfilar(ruta, sum, [1, 2, 3]) == 6
+    assert os.path.exists(ruta)
+    pstats.Stats(ruta)
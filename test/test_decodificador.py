@@ -100,3 +100,234 @@ def test_guardar_archivo():
     assert contenido_leido == data
 
     os.remove(ruta)
+
+def _cifrar_y_mover(nombre_claro, contenido, nombre, password="contrasena", n=5, t=3, **opciones):
+    """Cifra un archivo de `docs` y mueve el `.aes` y el `.frg` resultantes a `docs`."""
+    docs = os.path.join(os.path.dirname(__file__), "../docs")
+    resultados = os.path.join(os.path.dirname(__file__), "../resultados")
+    with open(os.path.join(docs, nombre_claro), "wb") as f:
+        f.write(contenido)
+
+    codificador = Codificador()
+    codificador.cifrar_archivo(nombre_claro, nombre, password, **opciones)
+    codificador.guardar_fragmentos(codificador.shamir_generar_puntos(codificador.shamir_generar_polinomio(t), n))
+
+    os.remove(os.path.join(docs, nombre_claro))
+    for extension in (".aes", ".frg"):
+        os.replace(os.path.join(resultados, nombre + extension), os.path.join(docs, nombre + extension))
+
+def _limpiar(*rutas):
+    for ruta in rutas:
+        if os.path.exists(ruta):
+            os.remove(ruta)
+
+def test_descifrar_archivo_ida_y_vuelta():
+    docs = os.path.join(os.path.dirname(__file__), "../docs")
+    resultados = os.path.join(os.path.dirname(__file__), "../resultados")
+    contenido = os.urandom(3 * 1024 * 1024 + 7)
+    _cifrar_y_mover("IdaVuelta.bin", contenido, "IdaVuelta")
+
+    try:
+        Decodificador().descifrar_archivo("IdaVuelta.aes", "IdaVuelta.frg")
+        with open(os.path.join(resultados, "IdaVuelta.bin"), "rb") as f:
+            assert f.read() == contenido
+    finally:
+        _limpiar(os.path.join(docs, "IdaVuelta.aes"), os.path.join(docs, "IdaVuelta.frg"),
+                 os.path.join(resultados, "IdaVuelta.bin"))
+
+def test_descifrar_archivo_formato_pickle():
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+    from cryptography.hazmat.primitives.padding import PKCS7
+
+    docs = os.path.join(os.path.dirname(__file__), "../docs")
+    resultados = os.path.join(os.path.dirname(__file__), "../resultados")
+    _cifrar_y_mover("Antiguo.txt", b"formato anterior", "Antiguo")
+    with open(os.path.join(docs, "Antiguo.txt"), "wb") as f:
+        f.write(b"formato anterior")
+
+    codificador = Codificador()
+    codificador.generaSha("contrasena")
+    padder = PKCS7(algorithms.AES.block_size).padder()
+    datos = padder.update(codificador.convertir_objeto("Antiguo.txt")) + padder.finalize()
+    iv = os.urandom(16)
+    encryptor = Cipher(algorithms.AES(codificador._Codificador__key), modes.CBC(iv)).encryptor()
+    with open(os.path.join(docs, "Antiguo.aes"), "wb") as f:
+        f.write(iv + encryptor.update(datos) + encryptor.finalize())
+
+    try:
+        Decodificador().descifrar_archivo("Antiguo.aes", "Antiguo.frg")
+        with open(os.path.join(resultados, "Antiguo.txt"), "rb") as f:
+            assert f.read() == b"formato anterior"
+    finally:
+        _limpiar(os.path.join(docs, "Antiguo.txt"), os.path.join(docs, "Antiguo.aes"),
+                 os.path.join(docs, "Antiguo.frg"), os.path.join(resultados, "Antiguo.txt"))
+
+def _escribir_fragmentos(archivo, datos):
+    ruta = os.path.join(os.path.dirname(__file__), f"../docs/{archivo}")
+    with open(ruta, "wb") as f:
+        f.write(datos)
+    return ruta
+
+def test_leer_fragmentos_umbral_se_detiene_y_descarta_repetidos():
+    from src import Fragmentos
+    puntos = [(1, 5), (1, 5), (2, 15), (3, 35), (4, 63)]
+    ruta = _escribir_fragmentos("fragmentos_umbral.frg", Fragmentos.codifica_fragmentos(puntos, umbral=3))
+    try:
+        decodificador = Decodificador()
+        assert decodificador.leer_fragmentos_umbral("fragmentos_umbral.frg") == [(1, 5), (2, 15), (3, 35)]
+        assert decodificador.reconstruir_secreto("fragmentos_umbral.frg") == 5
+    finally:
+        os.remove(ruta)
+
+def test_leer_fragmentos_umbral_insuficientes():
+    from src import Fragmentos
+    ruta = _escribir_fragmentos("fragmentos_pocos.frg", Fragmentos.codifica_fragmentos([(1, 5), (1, 5)], umbral=2))
+    try:
+        with pytest.raises(ValueError, match="1 fragmentos válidos"):
+            Decodificador().leer_fragmentos_umbral("fragmentos_pocos.frg")
+    finally:
+        os.remove(ruta)
+
+def test_descifrar_archivo_cbc_y_vacio():
+    from src.Cabecera import CIFRADO_AES_CBC
+
+    docs = os.path.join(os.path.dirname(__file__), "../docs")
+    resultados = os.path.join(os.path.dirname(__file__), "../resultados")
+    casos = [("Cbc.bin", os.urandom(70000), "Cbc", {"cifrado": CIFRADO_AES_CBC}), ("Vacio.bin", b"", "Vacio", {})]
+    for nombre_claro, contenido, nombre, opciones in casos:
+        _cifrar_y_mover(nombre_claro, contenido, nombre, **opciones)
+        try:
+            Decodificador().descifrar_archivo(f"{nombre}.aes", f"{nombre}.frg")
+            with open(os.path.join(resultados, nombre_claro), "rb") as f:
+                assert f.read() == contenido
+        finally:
+            _limpiar(os.path.join(docs, f"{nombre}.aes"), os.path.join(docs, f"{nombre}.frg"),
+                     os.path.join(resultados, nombre_claro))
+
+def test_descifrar_gcm_clave_incorrecta():
+    docs = os.path.join(os.path.dirname(__file__), "../docs")
+    resultados = os.path.join(os.path.dirname(__file__), "../resultados")
+    _cifrar_y_mover("ClaveA.bin", b"contenido A", "ClaveA", password="contrasena A")
+    _cifrar_y_mover("ClaveB.bin", b"contenido B", "ClaveB", password="contrasena B")
+    try:
+        with pytest.raises(ValueError, match="no corresponden a este archivo"):
+            Decodificador().descifrar_archivo("ClaveA.aes", "ClaveB.frg")
+        assert not os.path.exists(os.path.join(resultados, "ClaveA.bin"))
+    finally:
+        _limpiar(*(os.path.join(docs, f"Clave{x}.{e}") for x in "AB" for e in ("aes", "frg")))
+
+def test_descifrar_gcm_detecta_alteracion_y_truncado():
+    from src.Cabecera import Cabecera, TAMANO_BLOQUE
+
+    docs = os.path.join(os.path.dirname(__file__), "../docs")
+    resultados = os.path.join(os.path.dirname(__file__), "../resultados")
+    _cifrar_y_mover("Alterado.bin", os.urandom(2 * 1024 * 1024 + 5), "Alterado")
+    ruta = os.path.join(docs, "Alterado.aes")
+    with open(ruta, "rb") as f:
+        largo_cabecera = len(Cabecera.leer(f).a_bytes())
+        f.seek(0)
+        original = f.read()
+    alterado = bytearray(original)
+    alterado[-3] ^= 0x01
+    truncado = original[:largo_cabecera + 2 * (TAMANO_BLOQUE + 16)]
+    try:
+        for datos, error in ((alterado, "bloque 2"), (truncado, "bloque 2")):
+            with open(ruta, "wb") as f:
+                f.write(datos)
+            with pytest.raises(ValueError, match=error):
+                Decodificador().descifrar_archivo("Alterado.aes", "Alterado.frg", trabajadores=2)
+            assert not os.path.exists(os.path.join(resultados, "Alterado.bin"))
+            assert not [nombre for nombre in os.listdir(resultados) if nombre.endswith(".parcial")]
+    finally:
+        _limpiar(ruta, os.path.join(docs, "Alterado.frg"))
+
+def test_cifrado_paralelo_equivale_al_secuencial():
+    docs = os.path.join(os.path.dirname(__file__), "../docs")
+    resultados = os.path.join(os.path.dirname(__file__), "../resultados")
+    contenido = os.urandom(5 * 1024 * 1024 + 11)
+    _cifrar_y_mover("Paralelo.bin", contenido, "Paralelo", trabajadores=4)
+    try:
+        for trabajadores in (1, 3):
+            Decodificador().descifrar_archivo("Paralelo.aes", "Paralelo.frg", trabajadores=trabajadores)
+            with open(os.path.join(resultados, "Paralelo.bin"), "rb") as f:
+                assert f.read() == contenido
+    finally:
+        _limpiar(os.path.join(docs, "Paralelo.aes"), os.path.join(docs, "Paralelo.frg"),
+                 os.path.join(resultados, "Paralelo.bin"))
+
+def test_verificacion_rechaza_clave_sin_leer_contenido():
+    from src.Cabecera import Cabecera
+
+    docs = os.path.join(os.path.dirname(__file__), "../docs")
+    _cifrar_y_mover("Verifica.bin", b"contenido", "Verifica", password="contrasena A")
+    _cifrar_y_mover("Otra.bin", b"otro", "Otra", password="contrasena B")
+    ruta = os.path.join(docs, "Verifica.aes")
+    with open(ruta, "rb") as f:
+        cabecera = Cabecera.leer(f)
+    # Sin contenido detrás de la cabecera: solo la verificación puede detectar la clave incorrecta.
+    with open(ruta, "wb") as f:
+        f.write(cabecera.a_bytes())
+    try:
+        decodificador = Decodificador()
+        with open(ruta, "rb") as f, pytest.raises(ValueError, match="no corresponden"):
+            decodificador.descifrar_flujo(b"\x00" * 32, f)
+    finally:
+        _limpiar(ruta, os.path.join(docs, "Verifica.frg"),
+                 os.path.join(docs, "Otra.aes"), os.path.join(docs, "Otra.frg"))
+
+def test_reconstruir_secreto_robusto():
+    from src import Fragmentos
+    from src.Campo import PRIMO
+
+    secreto = 123456789
+    coeficientes = [secreto, 987654321, 555]
+    puntos = [(x, sum(c * x**i for i, c in enumerate(coeficientes)) % PRIMO) for x in range(1, 10)]
+    puntos[1] = (2, (puntos[1][1] + 1) % PRIMO)
+    puntos[6] = (7, 42)
+    datos = bytearray(Fragmentos.codifica_fragmentos(puntos, umbral=3))
+    datos[-1] ^= 0xFF
+    ruta = _escribir_fragmentos("fragmentos_ruidosos.frg", bytes(datos))
+    try:
+        decodificador = Decodificador()
+        assert decodificador.reconstruir_secreto_robusto("fragmentos_ruidosos.frg") == (secreto, [2, 7, 9])
+        _escribir_fragmentos("fragmentos_ruidosos.frg", Fragmentos.codifica_texto(puntos).encode())
+        with pytest.raises(ValueError, match="umbral"):
+            decodificador.reconstruir_secreto_robusto("fragmentos_ruidosos.frg")
+    finally:
+        os.remove(ruta)
+
+@pytest.mark.parametrize("opciones", [{}, {"cifrado": 1}])
+def test_nombre_original_va_cifrado(opciones):
+    docs = os.path.join(os.path.dirname(__file__), "../docs")
+    resultados = os.path.join(os.path.dirname(__file__), "../resultados")
+    _cifrar_y_mover("NombreSecreto.txt", b"contenido", "Anonimo", **opciones)
+    try:
+        with open(os.path.join(docs, "Anonimo.aes"), "rb") as f:
+            assert b"NombreSecreto" not in f.read()
+        Decodificador().descifrar_archivo("Anonimo.aes", "Anonimo.frg")
+        with open(os.path.join(resultados, "NombreSecreto.txt"), "rb") as f:
+            assert f.read() == b"contenido"
+    finally:
+        _limpiar(os.path.join(docs, "Anonimo.aes"), os.path.join(docs, "Anonimo.frg"),
+                 os.path.join(resultados, "NombreSecreto.txt"))
+
+def test_descifrar_cabecera_version_2_con_nombre_en_claro():
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    from src.Cabecera import Cabecera, CIFRADO_AES_GCM, nonce_bloque, valor_verificacion
+
+    docs = os.path.join(os.path.dirname(__file__), "../docs")
+    resultados = os.path.join(os.path.dirname(__file__), "../resultados")
+    _cifrar_y_mover("Version2.txt", b"", "Version2")
+    clave = hashlib.sha256(b"contrasena").digest()
+    cabecera = Cabecera("Version2.txt", os.urandom(7), 11, CIFRADO_AES_GCM, version=2,
+                        verificacion=valor_verificacion(clave))
+    datos = cabecera.a_bytes()
+    with open(os.path.join(docs, "Version2.aes"), "wb") as f:
+        f.write(datos + AESGCM(clave).encrypt(nonce_bloque(cabecera.iv, 0, True), b"formato v2!", datos))
+    try:
+        Decodificador().descifrar_archivo("Version2.aes", "Version2.frg")
+        with open(os.path.join(resultados, "Version2.txt"), "rb") as f:
+            assert f.read() == b"formato v2!"
+    finally:
+        _limpiar(os.path.join(docs, "Version2.aes"), os.path.join(docs, "Version2.frg"),
+                 os.path.join(resultados, "Version2.txt"))
@@ -0,0 +1,73 @@
+import io
+import zlib
+import pytest
+from src import Fragmentos
+from src.Campo import PRIMO
+
+def test_varint_ida_y_vuelta():
+    for valor in (0, 1, 127, 128, 300, 2**35 + 5):
+        codificado = Fragmentos.codifica_varint(valor)
+        assert Fragmentos.decodifica_varint(codificado, 0) == (valor, len(codificado))
+    assert len(Fragmentos.codifica_varint(127)) == 1
+
+def test_varint_truncado_o_demasiado_largo():
+    maximo = 2 ** 70 - 1
+    assert Fragmentos.decodifica_varint(Fragmentos.codifica_varint(maximo), 0) == (maximo, 10)
+    with pytest.raises(ValueError, match="truncado"):
+        Fragmentos.decodifica_varint(b"\x80\x80", 0)
+    with pytest.raises(ValueError, match="más de 10 bytes"):
+        Fragmentos.decodifica_varint(b"\xff" * 10 + b"\x01", 0)
+    with pytest.raises(ValueError, match="no cabe"):
+        Fragmentos.codifica_varint(2 ** 70)
+
+def test_fragmentos_binarios_ida_y_vuelta():
+    puntos = [(x, (x * 7919 ** 20) % PRIMO) for x in range(1, 500)]
+    assert Fragmentos.decodifica(Fragmentos.codifica_fragmentos(puntos)) == puntos
+
+def test_fragmentos_texto_ida_y_vuelta():
+    puntos = [(1, 5), (2, 15), (3, 35)]
+    assert Fragmentos.decodifica(Fragmentos.codifica_texto(puntos).encode()) == puntos
+
+def test_fragmentos_crc_detecta_dano():
+    datos = bytearray(Fragmentos.codifica_fragmentos([(1, 2**255), (2, 2**254)]))
+    datos[-6] ^= 0xFF
+    with pytest.raises(ValueError, match="x=2"):
+        Fragmentos.decodifica(bytes(datos))
+
+def test_fragmentos_truncados():
+    datos = Fragmentos.codifica_fragmentos([(1, 2**255), (2, 2**254)])
+    with pytest.raises(ValueError, match="truncado"):
+        Fragmentos.decodifica(datos[:-3])
+
+def test_fragmentos_ordenada_negativa():
+    with pytest.raises(ValueError):
+        Fragmentos.codifica_fragmentos([(1, -1)])
+
+def test_fragmentos_registran_umbral():
+    datos = Fragmentos.codifica_fragmentos([(1, 5), (2, 15), (3, 35)], umbral=2)
+    lector = Fragmentos.LectorFragmentos(io.BytesIO(datos))
+    assert lector.umbral == 2 and lector.cantidad == 3
+    assert [(x, y) for x, y, _ in lector] == [(1, 5), (2, 15), (3, 35)]
+
+def test_fragmentos_version_1_se_siguen_leyendo():
+    version_1 = b"SSSF\x01\x01\x00\x00\x00\x01" + b"\x01\x05" + zlib.crc32(b"\x01\x05").to_bytes(4, 'big')
+    assert Fragmentos.decodifica(version_1) == [(1, 5)]
+    lector = Fragmentos.LectorFragmentos(io.BytesIO(version_1))
+    assert lector.umbral is None
+    assert list(lector) == [(1, 5, True)]
+
+def test_lector_se_detiene_sin_leer_el_resto():
+    puntos = [(x, (x * 7919 ** 20) % PRIMO) for x in range(1, 5001)]
+    flujo = io.BytesIO(Fragmentos.codifica_fragmentos(puntos, umbral=3))
+    lector = iter(Fragmentos.LectorFragmentos(flujo, tamano_lectura=256))
+    assert [next(lector)[:2] for _ in range(3)] == puntos[:3]
+    assert flujo.tell() < 1024
+
+def test_lector_marca_fragmentos_danados():
+    datos = bytearray(Fragmentos.codifica_fragmentos([(1, 2**255), (2, 2**254)]))
+    datos[-6] ^= 0xFF
+    assert [integro for _, _, integro in Fragmentos.LectorFragmentos(io.BytesIO(bytes(datos)))] == [True, False]
+
+def test_lector_texto():
+    datos = Fragmentos.codifica_texto([(1, 5), (2, 15)]).encode() + b"\nbasura\n"
+    assert list(Fragmentos.LectorFragmentos(io.BytesIO(datos))) == [(1, 5, True), (2, 15, True), (None, None, False)]
@@ -0,0 +1,143 @@
+import os
+import shutil
+import pytest
+from src.Gestor import gestiona_C_lote, gestiona_D_lote, listar_lote, nombre_desde_archivo
+
+RUTA_DOCS = os.path.join(os.path.dirname(__file__), "../docs")
+RUTA_RESULTADOS = os.path.join(os.path.dirname(__file__), "../resultados")
+
+@pytest.fixture
+def directorio_lote():
+    directorio = os.path.join(RUTA_DOCS, "lote_prueba")
+    os.makedirs(directorio, exist_ok=True)
+    for i in range(4):
+        with open(os.path.join(directorio, f"doc {i}.txt"), "wb") as f:
+            f.write(f"contenido {i}".encode() * 1000)
+    yield "lote_prueba"
+    shutil.rmtree(directorio)
+
+def _limpiar_resultados(nombres):
+    for nombre in nombres:
+        for extension in (".aes", ".frg"):
+            ruta = os.path.join(RUTA_RESULTADOS, nombre + extension)
+            if os.path.exists(ruta):
+                os.remove(ruta)
+
+def test_nombre_desde_archivo_sanitiza_y_evita_repetidos():
+    usados = set()
+    assert nombre_desde_archivo("/tmp/mi archivo.txt", usados) == "mi_archivo"
+    assert nombre_desde_archivo("/otra/mi archivo.csv", usados) == "mi_archivo_2"
+    assert len(nombre_desde_archivo("x" * 40 + ".bin", usados)) == 25
+
+def test_listar_lote_directorio(directorio_lote):
+    lote = listar_lote(directorio_lote)
+    assert [nombre for _, nombre in lote] == ["doc_0", "doc_1", "doc_2", "doc_3"]
+
+def test_gestiona_C_lote_directorio(directorio_lote):
+    resumen = gestiona_C_lote(directorio_lote, 5, 3, "contrasena", trabajadores=2)
+    nombres = [resultado["nombre"] for resultado in resumen["resultados"]]
+    try:
+        assert resumen["exitosos"] == 4
+        assert resumen["fallidos"] == 0
+        for nombre in nombres:
+            assert os.path.exists(os.path.join(RUTA_RESULTADOS, nombre + ".aes"))
+            assert os.path.exists(os.path.join(RUTA_RESULTADOS, nombre + ".frg"))
+    finally:
+        _limpiar_resultados(nombres)
+
+def test_gestiona_C_lote_manifiesto_reporta_errores(directorio_lote):
+    manifiesto = os.path.join(RUTA_DOCS, "manifiesto_prueba.txt")
+    with open(manifiesto, "w") as f:
+        f.write("# comentario\nlote_prueba/doc 0.txt,Manifiesto0\nlote_prueba/no_existe.txt\n")
+    try:
+        resumen = gestiona_C_lote("manifiesto_prueba.txt", 4, 3, "contrasena", trabajadores=1)
+        assert resumen["exitosos"] == 1
+        assert resumen["fallidos"] == 1
+        fallido = resumen["resultados"][1]
+        assert fallido["nombre"] == "no_existe"
+        assert fallido["error"]
+    finally:
+        os.remove(manifiesto)
+        _limpiar_resultados(["Manifiesto0", "no_existe"])
+
+def test_gestiona_C_lote_manifiesto_con_nombres_repetidos(directorio_lote):
+    with open(os.path.join(RUTA_DOCS, directorio_lote, "corto.txt"), "wb") as f:
+        f.write(b"corto")
+    manifiesto = os.path.join(RUTA_DOCS, "manifiesto_repetidos.txt")
+    with open(manifiesto, "w") as f:
+        f.write("lote_prueba/doc 0.txt,Repetido\nlote_prueba/corto.txt,Repetido\nlote_prueba/doc 2.txt\n")
+    try:
+        resumen = gestiona_C_lote("manifiesto_repetidos.txt", 4, 3, "contrasena", trabajadores=2)
+        assert (resumen["exitosos"], resumen["fallidos"]) == (2, 1)
+        fallido = resumen["resultados"][1]
+        assert fallido["archivo"].endswith("corto.txt") and "ya se usó" in fallido["error"]
+        assert [resultado["nombre"] for resultado in resumen["resultados"]] == ["Repetido", "Repetido", "doc_2"]
+        with open(os.path.join(RUTA_RESULTADOS, "Repetido.aes"), "rb") as f:
+            from src.Cabecera import Cabecera
+            assert Cabecera.leer(f).longitud == len("contenido 0") * 1000
+    finally:
+        os.remove(manifiesto)
+        _limpiar_resultados(["Repetido", "doc_2"])
+
+def test_gestiona_C_lote_parametros_invalidos(directorio_lote):
+    with pytest.raises(ValueError):
+        gestiona_C_lote(directorio_lote, 2, 3, "contrasena")
+
+def test_gestiona_D_lote_ida_y_vuelta(directorio_lote):
+    resumen = gestiona_C_lote(directorio_lote, 5, 3, "contrasena", trabajadores=2)
+    nombres = [resultado["nombre"] for resultado in resumen["resultados"]]
+    directorio_cifrados = os.path.join(RUTA_DOCS, "lote_cifrados")
+    os.makedirs(directorio_cifrados, exist_ok=True)
+    try:
+        for nombre in nombres:
+            for extension in (".aes", ".frg"):
+                shutil.move(os.path.join(RUTA_RESULTADOS, nombre + extension), directorio_cifrados)
+        os.remove(os.path.join(directorio_cifrados, "doc_3.frg"))
+
+        resumen = gestiona_D_lote("lote_cifrados", trabajadores=2, max_en_vuelo=1)
+
+        assert resumen["exitosos"] == 3
+        assert resumen["fallidos"] == 1
+        assert resumen["resultados"][3]["fragmentos"].endswith("doc_3.frg")
+        for i in range(3):
+            with open(os.path.join(RUTA_RESULTADOS, f"doc {i}.txt"), "rb") as f:
+                assert f.read() == f"contenido {i}".encode() * 1000
+    finally:
+        shutil.rmtree(directorio_cifrados)
+        for i in range(4):
+            ruta = os.path.join(RUTA_RESULTADOS, f"doc {i}.txt")
+            if os.path.exists(ruta):
+                os.remove(ruta)
+
+def test_gestiona_D_lote_reporta_resultados_con_el_mismo_nombre(directorio_lote):
+    directorio = os.path.join(RUTA_DOCS, directorio_lote)
+    for subdirectorio in ("uno", "dos"):
+        os.makedirs(os.path.join(directorio, subdirectorio))
+        with open(os.path.join(directorio, subdirectorio, "a.txt"), "wb") as f:
+            f.write(subdirectorio.encode())
+    manifiesto = os.path.join(RUTA_DOCS, "manifiesto_choque.txt")
+    with open(manifiesto, "w") as f:
+        f.write("lote_prueba/uno/a.txt\nlote_prueba/dos/a.txt\nlote_prueba/doc 0.txt\n")
+    directorio_cifrados = os.path.join(RUTA_DOCS, "lote_choque")
+    os.makedirs(directorio_cifrados, exist_ok=True)
+    try:
+        resumen = gestiona_C_lote("manifiesto_choque.txt", 4, 3, "contrasena", trabajadores=1)
+        nombres = [resultado["nombre"] for resultado in resumen["resultados"]]
+        assert nombres == ["a", "a_2", "doc_0"]
+        for nombre in nombres:
+            for extension in (".aes", ".frg"):
+                shutil.move(os.path.join(RUTA_RESULTADOS, nombre + extension), directorio_cifrados)
+
+        resumen = gestiona_D_lote("lote_choque", trabajadores=2)
+
+        assert (resumen["exitosos"], resumen["fallidos"]) == (1, 2)
+        assert all("choca" in resultado["error"] for resultado in resumen["resultados"][:2])
+        assert not os.path.exists(os.path.join(RUTA_RESULTADOS, "a.txt"))
+        assert resumen["resultados"][2]["descifrado"].endswith("doc 0.txt")
+        assert not [nombre for nombre in os.listdir(RUTA_RESULTADOS) if nombre.endswith(".parcial")]
+    finally:
+        os.remove(manifiesto)
+        shutil.rmtree(directorio_cifrados)
+        ruta = os.path.join(RUTA_RESULTADOS, "doc 0.txt")
+        if os.path.exists(ruta):
+            os.remove(ruta)
@@ -52,4 +52,43 @@ def test_polinomioCorrecto2():
     pares = [(0, 3), (1, 3), (2, 5), (3, 15), (4, 39)]
     lagrange = Lagrange(pares)
     resultado = lagrange.genera_polinomio()
-    assert resultado.__str__() == "+ 1.0x^3 - 2.0x^2 + 1.0x + 3.0"
\ No newline at end of file
+    assert resultado.__str__() == "+ 1.0x^3 - 2.0x^2 + 1.0x + 3.0"
+
+def test_lagrange_campo_finito_recupera_secreto():
+    primo = 2**256 + 297
+    secreto = 2**255 + 12345
+    polinomio = Polinomio([Monomio(secreto, 0), Monomio(2**250, 1), Monomio(987654321, 2)], primo)
+    pares = [(x, polinomio.evalua(x)) for x in (2, 5, 7)]
+    assert Lagrange(pares, primo).evalua(0) == secreto
+
+def test_lagrange_campo_finito_x_repetido():
+    with pytest.raises(ValueError):
+        Lagrange([(1, 2), (1, 3)], 2**256 + 297).evalua(0)
+
+def test_lagrange_evalua_en_cero_coincide_con_bases():
+    primo = 2**256 + 297
+    polinomio = Polinomio([Monomio(42, 0), Monomio(3**100, 1), Monomio(5**90, 2), Monomio(7, 3)], primo)
+    pares = [(x, polinomio.evalua(x)) for x in (9, 3, 4, 11)]
+    lagrange = Lagrange(pares, primo)
+    assert lagrange.evalua_en_cero() == 42
+    assert sum(yi * lagrange.calcula_Li(i, 0) for i, (_, yi) in enumerate(pares)) % primo == 42
+
+def test_lagrange_evalua_en_cero_requiere_campo():
+    with pytest.raises(ValueError):
+        Lagrange([(1, 2), (2, 3)]).evalua_en_cero()
+
+def test_lagrange_genera_polinomio_campo_finito():
+    primo = 2**256 + 297
+    coeficientes = [2**255 + i * 3**80 for i in range(40)]
+    polinomio = Polinomio.desde_coeficientes(coeficientes, primo)
+    pares = [(x, polinomio.evalua(x)) for x in range(1, 41)]
+    assert Lagrange(pares, primo).genera_polinomio().coeficientes == coeficientes
+
+def test_lagrange_limpia_cache():
+    from src.Lagrange import _pesos_en_cero
+    pares = [(1, 5), (2, 15), (3, 35)]
+    assert Lagrange(pares, 2**256 + 297).evalua_en_cero() == 5
+    assert _pesos_en_cero.cache_info().currsize > 0
+    Lagrange.limpia_cache()
+    assert _pesos_en_cero.cache_info().currsize == 0
+    assert Lagrange(pares, 2**256 + 297).evalua_en_cero() == 5
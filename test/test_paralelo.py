@@ -0,0 +1,54 @@
+import threading
+import time
+import pytest
+from src.Paralelo import EjecutorOrdenado
+
+def test_resultados_en_orden():
+    def lento(i):
+        time.sleep(0.001 * (5 - i % 5))
+        return i * i
+    resultados = []
+    with EjecutorOrdenado(lento, trabajadores=4) as ejecutor:
+        for i in range(20):
+            ejecutor.agrega(i)
+            resultados += ejecutor.extrae()
+        resultados += ejecutor.extrae(todas=True)
+    assert resultados == [i * i for i in range(20)]
+
+def test_pendientes_acotadas():
+    activas = []
+    candado = threading.Lock()
+    maximo = [0]
+    def tarea(i):
+        with candado:
+            activas.append(i)
+            maximo[0] = max(maximo[0], len(activas))
+        time.sleep(0.002)
+        with candado:
+            activas.remove(i)
+        return i
+    with EjecutorOrdenado(tarea, trabajadores=8, max_en_vuelo=3) as ejecutor:
+        for i in range(15):
+            ejecutor.agrega(i)
+            ejecutor.extrae()
+        ejecutor.extrae(todas=True)
+    assert maximo[0] <= 3
+
+def test_un_trabajador_ejecuta_en_el_mismo_hilo():
+    hilos = set()
+    with EjecutorOrdenado(lambda i: hilos.add(threading.get_ident()) or i, trabajadores=1) as ejecutor:
+        ejecutor.agrega(1)
+        assert ejecutor.extrae() == [1]
+    assert hilos == {threading.get_ident()}
+
+def test_errores_se_propagan():
+    def falla(i):
+        raise ValueError(f"tarea {i}")
+    with EjecutorOrdenado(falla, trabajadores=2) as ejecutor:
+        ejecutor.agrega(7)
+        with pytest.raises(ValueError, match="tarea 7"):
+            ejecutor.extrae(todas=True)
+
+def test_parametros_invalidos():
+    with pytest.raises(ValueError):
+        EjecutorOrdenado(abs, trabajadores=2, max_en_vuelo=-1)
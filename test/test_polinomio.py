@@ -83,4 +83,37 @@ def test9_evalua_polynomial_with_negative_exponent_and_x_negativo():
 
 def test10_evalua_polynomial_with_complex_values():
     polinomio = Polinomio([Monomio(2.5, 2), Monomio(3.1, 1), Monomio(4.5, 0)])
-    assert 27.875 == polinomio.evalua(2.5)
\ No newline at end of file
+    assert 27.875 == polinomio.evalua(2.5)
+
+def test11_evalua_campo_finito():
+    primo = 2**256 + 297
+    polinomio = Polinomio([Monomio(primo - 1, 1), Monomio(5, 0)], primo)
+    assert 3 == polinomio.evalua(2)
+
+def test12_polinomio_campo_reduce_coeficientes():
+    polinomio = Polinomio([Monomio(7, 1), Monomio(-2, 1)], 5)
+    assert "0" == str(polinomio)
+
+def test13_evalua_horner_igual_a_suma_de_monomios():
+    primo = 2**256 + 297
+    coeficientes = [3**i * 7 + i for i in range(30)]
+    polinomio = Polinomio.desde_coeficientes(coeficientes, primo)
+    for x in (1, 2, 12345, primo - 1, primo + 5):
+        esperado = sum(c * pow(x, e, primo) for e, c in enumerate(coeficientes)) % primo
+        assert polinomio.evalua(x) == esperado
+
+def test14_desde_coeficientes_quita_ceros_finales():
+    polinomio = Polinomio.desde_coeficientes([4, 0, 2, 0, 0])
+    assert polinomio.coeficientes == [4, 0, 2]
+    assert polinomio.grado == 2
+    assert "+ 4 + 2x^2" == str(polinomio)
+
+def test15_multiplica():
+    p = Polinomio([Monomio(1, 1), Monomio(-2, 0)])
+    q = Polinomio([Monomio(1, 1), Monomio(3, 0)])
+    assert p.multiplica(q).coeficientes == [-6, 1, 1]
+
+def test16_sin_diccionario_por_instancia():
+    polinomio = Polinomio([Monomio(1, 1)])
+    assert not hasattr(polinomio, "__dict__")
+    assert not hasattr(polinomio.monomios[0], "__dict__")
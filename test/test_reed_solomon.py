@@ -0,0 +1,34 @@
+import random
+import pytest
+from src.Campo import PRIMO
+from src.ReedSolomon import decodifica_berlekamp_welch
+
+def _puntos(coeficientes, n):
+    return [(x, sum(c * pow(x, i, PRIMO) for i, c in enumerate(coeficientes)) % PRIMO) for x in range(1, n + 1)]
+
+def test_sin_errores():
+    coeficientes = [random.randrange(PRIMO) for _ in range(4)]
+    assert decodifica_berlekamp_welch(_puntos(coeficientes, 4), 4) == (coeficientes, [])
+
+def test_corrige_hasta_la_cota():
+    coeficientes = [random.randrange(PRIMO) for _ in range(5)]
+    puntos = _puntos(coeficientes, 16)
+    malos = random.sample(range(16), (16 - 5) // 2)
+    for i in malos:
+        puntos[i] = (puntos[i][0], random.randrange(PRIMO))
+    recuperados, incorrectos = decodifica_berlekamp_welch(puntos, 5)
+    assert recuperados == coeficientes
+    assert incorrectos == sorted(i + 1 for i in malos)
+
+def test_demasiados_errores():
+    puntos = _puntos([7, 11, 13], 7)
+    for i in range(3):
+        puntos[i] = (puntos[i][0], puntos[i][1] + 1)
+    with pytest.raises(ValueError, match="demasiados"):
+        decodifica_berlekamp_welch(puntos, 3)
+
+def test_entradas_invalidas():
+    with pytest.raises(ValueError):
+        decodifica_berlekamp_welch([(1, 2)], 2)
+    with pytest.raises(ValueError, match="repetidas"):
+        decodifica_berlekamp_welch([(1, 2), (1, 3), (2, 4)], 2)
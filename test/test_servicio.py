@@ -0,0 +1,141 @@
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import pytest
+from src.Servicio import Servicio, OPERACIONES, MAX_FRAGMENTOS
+
+RUTA_DOCS = os.path.join(os.path.dirname(__file__), "../docs")
+RUTA_RESULTADOS = os.path.join(os.path.dirname(__file__), "../resultados")
+
+async def _peticion(lector, escritor, metodo, ruta, datos=None, cerrar=False):
+    cuerpo = json.dumps(datos).encode() if datos is not None else b""
+    escritor.write(f"{metodo} {ruta} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(cuerpo)}\r\n"
+                   f"{'Connection: close' + chr(13) + chr(10) if cerrar else ''}\r\n".encode() + cuerpo)
+    await escritor.drain()
+    estado = int((await lector.readline()).split()[1])
+    cabeceras = {}
+    while (linea := await lector.readline()) != b"\r\n":
+        nombre, _, valor = linea.decode().partition(":")
+        cabeceras[nombre.lower()] = valor.strip()
+    return estado, json.loads(await lector.readexactly(int(cabeceras["content-length"]))), cabeceras
+
+def _con_servicio(prueba):
+    async def ejecutar():
+        servicio = Servicio(trabajadores=1)
+        servidor = await servicio.iniciar(puerto=0)
+        puerto = servidor.sockets[0].getsockname()[1]
+        try:
+            lector, escritor = await asyncio.open_connection("127.0.0.1", puerto)
+            await prueba(lector, escritor)
+            escritor.close()
+        finally:
+            servidor.close()
+            await servidor.wait_closed()
+            servicio.cerrar()
+    asyncio.run(ejecutar())
+
+def test_split_y_combine_en_una_conexion():
+    async def prueba(lector, escritor):
+        estado, respuesta, cabeceras = await _peticion(lector, escritor, "POST", "/split",
+                                                       {"contrasena": "contrasena", "n": 5, "t": 3})
+        assert estado == 200 and respuesta["exito"] and len(respuesta["fragmentos"]) == 5
+        assert cabeceras["connection"] == "keep-alive"
+        estado, combinado, _ = await _peticion(lector, escritor, "POST", "/combine",
+                                               {"fragmentos": respuesta["fragmentos"][1:4]})
+        assert estado == 200
+        assert combinado["clave"] == hashlib.sha256(b"contrasena").hexdigest()
+    _con_servicio(prueba)
+
+def test_errores_de_peticion():
+    async def prueba(lector, escritor):
+        assert (await _peticion(lector, escritor, "POST", "/nada", {}))[0] == 404
+        assert (await _peticion(lector, escritor, "GET", "/split"))[0] == 405
+        estado, respuesta, _ = await _peticion(lector, escritor, "POST", "/split", {"contrasena": "contrasena"})
+        assert estado == 400 and "n, t" in respuesta["error"]
+        estado, respuesta, _ = await _peticion(lector, escritor, "POST", "/split",
+                                               {"contrasena": "corta", "n": 5, "t": 3})
+        assert estado == 400 and not respuesta["exito"]
+        estado, _, cabeceras = await _peticion(lector, escritor, "GET", "/salud", cerrar=True)
+        assert estado == 200 and cabeceras["connection"] == "close"
+        assert await lector.read() == b""
+    _con_servicio(prueba)
+
+def test_encrypt_y_decrypt():
+    ruta_claro = os.path.join(RUTA_DOCS, "servicio_prueba.txt")
+    with open(ruta_claro, "wb") as f:
+        f.write(b"contenido del servicio")
+
+    async def prueba(lector, escritor):
+        estado, respuesta, _ = await _peticion(lector, escritor, "POST", "/encrypt", {
+            "archivo": "servicio_prueba.txt", "n": 4, "t": 3, "contrasena": "contrasena", "nombre": "ServicioPrueba"})
+        assert estado == 200 and respuesta["cifrado"] == "ServicioPrueba.aes"
+        for extension in (".aes", ".frg"):
+            shutil.move(os.path.join(RUTA_RESULTADOS, "ServicioPrueba" + extension), RUTA_DOCS)
+        os.remove(ruta_claro)
+        estado, respuesta, _ = await _peticion(lector, escritor, "POST", "/decrypt",
+                                               {"cifrado": "ServicioPrueba.aes", "fragmentos": "ServicioPrueba.frg"})
+        assert estado == 200 and respuesta["exito"]
+        assert respuesta["descifrado"] == os.path.abspath(os.path.join(RUTA_RESULTADOS, "servicio_prueba.txt"))
+        with open(respuesta["descifrado"], "rb") as f:
+            assert f.read() == b"contenido del servicio"
+
+    try:
+        _con_servicio(prueba)
+    finally:
+        for ruta in (ruta_claro, os.path.join(RUTA_DOCS, "ServicioPrueba.aes"),
+                     os.path.join(RUTA_DOCS, "ServicioPrueba.frg"), os.path.join(RUTA_RESULTADOS, "servicio_prueba.txt")):
+            if os.path.exists(ruta):
+                os.remove(ruta)
+
+def test_content_length_negativo():
+    async def prueba(lector, escritor):
+        escritor.write(b"POST /split HTTP/1.1\r\nContent-Length: -1\r\n\r\n")
+        await escritor.drain()
+        assert int((await lector.readline()).split()[1]) == 400
+        while await lector.readline() != b"\r\n":
+            pass
+        assert "Content-Length" in json.loads(await lector.read())["error"]
+    _con_servicio(prueba)
+
+def test_rutas_fuera_de_docs():
+    async def prueba(lector, escritor):
+        for ruta, datos in (("/encrypt", {"archivo": "../README.md", "n": 4, "t": 3, "contrasena": "contrasena"}),
+                            ("/encrypt", {"archivo": os.path.abspath(os.path.join(RUTA_DOCS, "../README.md")),
+                                          "n": 4, "t": 3, "contrasena": "contrasena"}),
+                            ("/decrypt", {"cifrado": "../resultados/x.aes", "fragmentos": "x.frg"}),
+                            ("/decrypt", {"cifrado": "x.aes", "fragmentos": "../x.frg"})):
+            estado, respuesta, _ = await _peticion(lector, escritor, "POST", ruta, datos)
+            assert estado == 400 and "fuera de la carpeta 'docs'" in respuesta["error"]
+    _con_servicio(prueba)
+
+def _terminar_trabajador():
+    os._exit(1)
+
+def test_combine_con_fragmentos_inconsistentes():
+    async def prueba(lector, escritor):
+        # Interpolan la recta que en cero vale PRIMO - 1, que no cabe en 32 bytes.
+        primo = 2 ** 256 + 297
+        estado, respuesta, _ = await _peticion(lector, escritor, "POST", "/combine",
+                                               {"fragmentos": [[1, format(primo - 2, 'x')], [2, format(primo - 3, 'x')]]})
+        assert estado == 400 and "32 bytes" in respuesta["error"]
+    _con_servicio(prueba)
+
+def test_combine_limita_fragmentos():
+    async def prueba(lector, escritor):
+        fragmentos = [[x, "1"] for x in range(1, MAX_FRAGMENTOS + 2)]
+        estado, respuesta, _ = await _peticion(lector, escritor, "POST", "/combine", {"fragmentos": fragmentos})
+        assert estado == 400 and str(MAX_FRAGMENTOS) in respuesta["error"]
+    _con_servicio(prueba)
+
+def test_repone_el_grupo_si_muere_un_trabajador(monkeypatch):
+    monkeypatch.setitem(OPERACIONES, "/morir", (_terminar_trabajador, (), ()))
+
+    async def prueba(lector, escritor):
+        estado, _, _ = await _peticion(lector, escritor, "POST", "/morir", {})
+        assert estado == 500
+        estado, respuesta, _ = await _peticion(lector, escritor, "POST", "/split",
+                                               {"contrasena": "contrasena", "n": 5, "t": 3})
+        assert estado == 200 and len(respuesta["fragmentos"]) == 5
+    _con_servicio(prueba)
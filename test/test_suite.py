@@ -0,0 +1,18 @@
+from benchmarks.suite import comparar
+
+def test_comparar_detecta_regresiones():
+    base = {"generacion/t=3/n=10": {"p50_ms": 10.0, "p90_ms": 12.0},
+            "extremo/1MB": {"cifrado": {"p50_ms": 100.0}, "descifrado": {"p50_ms": 100.0}}}
+    actual = {"generacion/t=3/n=10": {"p50_ms": 10.5, "p90_ms": 30.0},
+              "extremo/1MB": {"cifrado": {"p50_ms": 150.0}, "descifrado": {"p50_ms": 90.0}},
+              "reconstruccion/t=3": {"p50_ms": 5.0}}
+    regresiones = comparar(actual, base, tolerancia=0.10)
+    assert [r["medicion"] for r in regresiones] == ["extremo/1MB/cifrado"]
+    assert regresiones[0]["cambio"] == 0.5
+
+def test_comparar_incluye_arranque():
+    base = {"arranque/src.Comandos": {"mediana_ms": 20.0, "p95_ms": 25.0, "presupuesto_ms": 40.0}}
+    actual = {"arranque/src.Comandos": {"mediana_ms": 40.0, "p95_ms": 45.0, "presupuesto_ms": 40.0}}
+    regresiones = comparar(actual, base, tolerancia=0.10)
+    assert regresiones == [{"medicion": "arranque/src.Comandos", "base_ms": 20.0, "actual_ms": 40.0, "cambio": 1.0}]
+    assert comparar(base, base) == []